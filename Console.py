@@ -2,40 +2,191 @@
 The console module is used to start the program as a command line program. Once
 started, the program validates the input and either returns an error or runs the
 program. If the input is ran, it will then print every state in the solution set
-to the console along with time information.
+to the console along with time information. With --batch, a file of puzzles is
+solved through the batch module and one result line is printed per puzzle.
 
 Methods
 -------
 console_solve(list argv) -> str:
     validates input from command line, returns error if invalid input, runs program
     and prints to console.
+_get_parser() -> argparse.ArgumentParser:
+    returns the parser for the command line options.
+_parse_size(str text) -> list[int]:
+    converts a size such as 4x4 into rows and columns.
+parse_puzzle(str text, list[int] size) -> list[int], int, int:
+    converts a puzzle input into tiles, rows and columns.
+_run_batch(argparse.Namespace args) -> str:
+    solves every puzzle in the --batch file and prints the results.
 
 Globals
 -------
 INVALID_INPUT_ERROR : str
-    error to print to console if the input isn't 0-8 non-repeating.
+    error to print to console if the input isn't 0-8 (0 to tiles - 1 for other
+    sizes) non-repeating. Formatted with the largest tile.
+SHAPE_ERROR : str
+    error to print if the number of tiles doesn't fit the puzzle size.
+    Formatted with the number of tiles and the size.
 TOO_MANY_INPUT_ERROR : str
     error to print if more than 1 input is given.
+NO_SOLUTION_ERROR : str
+    error to print if the puzzle can't be solved by shifting tiles.
+ABORTED_ERROR : str
+    error to print if the search hit --timeout or --max-expanded. Formatted
+    with the reason and the states expanded.
 COMPLETION : str
     string to return if the program is successfully ran.
 """
 
+import argparse
+import sys
+from math import isqrt
 from time import perf_counter
 import heuristic as H
+from cache import SolutionCache, CACHE_PATH
+from goal import GOAL_LAYOUTS, DEFAULT_GOAL
+from limits import SearchLimits
 from puzzle import Puzzle
 
-INVALID_INPUT_ERROR = "Invalid Input: input must be the numbers 0-8 non-repeating."
+INVALID_INPUT_ERROR = "Invalid Input: input must be the numbers 0-{} non-repeating."
+SHAPE_ERROR = "Invalid Input: {} tiles don't fit {} puzzle."
 TOO_MANY_INPUT_ERROR = "Too many inputs detected. Program needs 1 string, but got "
+NO_SOLUTION_ERROR = "No solution: puzzle can't be solved by shifting tiles."
+ABORTED_ERROR = "Aborted: {} after {} expanded states."
 COMPLETION = "Program completed."
+
+def _get_parser():
+    """
+    Builds the parser for the command line. The puzzle is taken as positional
+    input, the shift engine can be picked with --engine and the puzzle size with
+    --size. --stats prints the search statistics and --timeout/--max-expanded
+    limit the search. --goal picks the completed puzzle to solve to. --cache
+    keeps solutions in a file between runs. --batch solves a file of puzzles
+    instead, with the pool options --workers, --chunksize and --unordered.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Returns parser for the command line inputs.
+
+    """
+    parser = argparse.ArgumentParser(prog="main.py",
+                                     description="Solves a shifting puzzle.")
+    parser.add_argument("puzzle", nargs="*",
+                        help="the numbers 0-8 non-repeating, e.g. 123456780. Larger "
+                             "puzzles separate the numbers with commas.")
+    parser.add_argument("--engine", choices=sorted(H.SHIFT_ENGINES), default="astar",
+                        help="shift engine used to solve the puzzle.")
+    parser.add_argument("--size", type=_parse_size, default=None,
+                        help="rows x columns of the puzzle, e.g. 4x4. Defaults to "
+                             "square.")
+    parser.add_argument("--goal", choices=sorted(GOAL_LAYOUTS), default=DEFAULT_GOAL,
+                        help="completed puzzle to solve to, e.g. snake for 123/654/780.")
+    parser.add_argument("--stats", action="store_true",
+                        help="print the search statistics, peak memory included. "
+                             "Tracing memory slows the search down.")
+    parser.add_argument("--timeout", type=float, default=None, metavar="SECONDS",
+                        help="give up on a puzzle after this many seconds.")
+    parser.add_argument("--max-expanded", type=int, default=None, metavar="STATES",
+                        help="give up on a puzzle after expanding this many states.")
+    parser.add_argument("--cache", nargs="?", const=CACHE_PATH, default=None, metavar="FILE",
+                        help="answer puzzles solved before from the cache file FILE "
+                             "and add new solutions to it. FILE defaults to "
+                             "cache/solutions.")
+    parser.add_argument("--batch", metavar="FILE", default=None,
+                        help="solve the puzzles in FILE, one per line (- for stdin), "
+                             "and print a result line for each.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes used by --batch and --engine hda, "
+                             "defaults to the number of cores.")
+    parser.add_argument("--chunksize", type=int, default=64,
+                        help="puzzles sent to a worker at a time by --batch.")
+    parser.add_argument("--unordered", action="store_true",
+                        help="print --batch results as they finish instead of in "
+                             "input order.")
+    return parser
+
+def _parse_size(text):
+    """
+    Converts a size given as rows x columns, e.g. 2x3, into ints.
+
+    Parameters
+    ----------
+    text : str
+        size from the command line.
+
+    Returns
+    -------
+    list[int]
+        Returns the rows and columns.
+
+    """
+    try:
+        rows, cols = [int(value) for value in text.lower().split("x")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text}") from None
+    if rows < 2 or cols < 2:
+        raise argparse.ArgumentTypeError(f"invalid size: {text}")
+    return [rows, cols]
+
+def parse_puzzle(text, size=None):
+    """
+    Converts a puzzle input into a list of tiles. Inputs with commas are split
+    on them, otherwise every character is a tile. The size is taken as square
+    if it isn't given.
+
+    Parameters
+    ----------
+    text : str
+        puzzle input, e.g. 123456780 or 1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,0.
+    size : list[int]
+        rows and columns of the puzzle.
+
+    Returns
+    -------
+    list[int], int, int
+        Returns the tiles, rows and columns, or None for the tiles if the input
+        isn't a valid puzzle.
+
+    Raises
+    ------
+    ValueError
+        if the number of tiles doesn't fit the size, or isn't square when no
+        size is given.
+
+    """
+    values = text.split(",") if "," in text else list(text)
+    if size:
+        rows, cols = size
+        if rows * cols != len(values):
+            raise ValueError(SHAPE_ERROR.format(len(values), f"a {rows}x{cols}"))
+    else:
+        rows = cols = isqrt(len(values))
+        if rows * cols != len(values):
+            raise ValueError(SHAPE_ERROR.format(len(values), "a square") + " Give its --size.")
+    try:
+        tiles = [int(value) for value in values]
+    except ValueError:
+        return None, rows, cols
+    if not Puzzle.validate(tiles, rows, cols):
+        return None, rows, cols
+    return tiles, rows, cols
+
 def console_solve(argv):
     """
     console_solve is used to run the program in console form. The function takes
     the input and validates it, returning either an error message for too many
     inputs if there are more than 1 input in the list or an incorrect input if
     the input isn't 0-8 non-repeating. If the input was validated, the program
-    creates a puzzle object and starts a timer. The program solves the puzzle
-    then stops the timer. Once stopped, the solutions set will be printed to
-    console with the final time, and finally returning the completion string.
+    creates a puzzle object and returns the no solution error if the puzzle
+    fails the solvability check. Otherwise it starts a timer. The program solves
+    the puzzle with the engine picked by --engine, returning the aborted error if
+    it runs past --timeout or --max-expanded, then stops the timer. Once
+    stopped, the solutions set will be printed to console with the final time
+    (and the search statistics with --stats), and finally returning the
+    completion string.
+    If --batch is given, every puzzle in the file is solved on a pool of worker
+    processes instead and a result line is printed for each.
 
     Parameters
     ----------
@@ -48,15 +199,41 @@ def console_solve(argv):
         Returns string representing error msg or completion msg.
 
     """
-    if len(argv) > 1:
-        return TOO_MANY_INPUT_ERROR + f"{len(argv)} inputs."
-    puzzle_str = [int(i) for i in list(argv[0])]
-    if not Puzzle.validate(puzzle_str):
-        return print(INVALID_INPUT_ERROR)
-    puzzle = Puzzle(puzzle_str)
+    args = _get_parser().parse_args(argv)
+    if args.batch is not None:
+        if args.puzzle:
+            return TOO_MANY_INPUT_ERROR + f"{len(args.puzzle) + 1} inputs."
+        return _run_batch(args)
+    if not args.puzzle:
+        return INVALID_INPUT_ERROR.format(8)
+    if len(args.puzzle) > 1:
+        return TOO_MANY_INPUT_ERROR + f"{len(args.puzzle)} inputs."
+    try:
+        puzzle_str, rows, cols = parse_puzzle(args.puzzle[0], args.size)
+    except ValueError as error:
+        return str(error)
+    if puzzle_str is None:
+        return INVALID_INPUT_ERROR.format(rows * cols - 1)
+    puzzle = Puzzle(puzzle_str, rows, cols, args.goal)
+    if not puzzle.is_solvable():
+        return NO_SOLUTION_ERROR
 
     start_time = perf_counter()
-    puzzle = H.heuristic(puzzle)
+    limits = SearchLimits(args.timeout, args.max_expanded)
+    cache = None if args.cache is None else SolutionCache(path=args.cache)
+    try:
+        options = {"workers": args.workers} if args.engine == "hda" else {}
+        puzzle, stats = H.solve(puzzle, args.engine, trace_memory=args.stats,
+                                cache=cache, limits=limits, **options)
+    except ValueError as error:
+        return str(error)
+    finally:
+        if cache is not None:
+            cache.close()
+    if stats.aborted:
+        if args.stats:
+            print(stats.summary())
+        return ABORTED_ERROR.format(stats.aborted, stats.expanded)
     soln_set = puzzle.get_soln_states()
     end_time = perf_counter()
 
@@ -69,4 +246,40 @@ def console_solve(argv):
         print()
 
     print(f"Total time: {round(end_time - start_time, 5)}s.")
+    if args.stats:
+        print(stats.summary())
+    return COMPLETION
+
+def _run_batch(args):
+    """
+    Solves every puzzle in the --batch file (stdin for -) on a pool of worker
+    processes and prints a result line for each as they come back. The total
+    time goes to stderr so stdout only holds results.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        parsed command line inputs.
+
+    Returns
+    -------
+    str
+        Returns string representing error msg or completion msg.
+
+    """
+    #imported here so single puzzle runs don't pay for the process pool
+    import batch # pylint: disable=import-outside-toplevel
+
+    start_time = perf_counter()
+    try:
+        lines = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8")
+    except OSError as error:
+        return str(error)
+    with lines:
+        for result in batch.batch_solve(lines, args.engine, args.size, args.workers,
+                                        args.chunksize, not args.unordered,
+                                        args.timeout, args.max_expanded, args.goal):
+            print(result)
+    end_time = perf_counter()
+    print(f"Total time: {round(end_time - start_time, 5)}s.", file=sys.stderr)
     return COMPLETION
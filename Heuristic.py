@@ -5,197 +5,1201 @@ search to find the answer.
 
 Usage
 -----
-With a valid puzzle object, call heuristic() with your puzzle as input. The
-heuristic algorithm will search and return a puzzle with the optimal solution.
-You can get a list containing the solution set of states by calling the returned
-puzzle's get_soln_states() function.
+Puzzles of any size are supported, the moves and tile positions for each size
+come from the shared board.Board of the puzzle. With a valid puzzle object, call
+one of the shift engines in SHIFT_ENGINES or heuristic_swap() with your puzzle
+as input. The algorithm will search and return a puzzle with the solution. The
+'table' engine answers 3x3 puzzles from the precomputed table in distance_table
+and the 'hda' engine spreads the search of large puzzles over worker processes
+(see parallel). The 'anytime' engines return a quick solution and improve it
+until it's optimal or their limits run out, see AnytimeSearch. 'ida' solves
+large puzzles in a fixed amount of memory. You can get a list containing the
+solution set of states by calling the returned puzzle's get_soln_states()
+function.
 
 Methods
 ------
-heuristic(Puzzle puzzle) -> Puzzle:
-    main function called to solve the shifting puzzle. returns a puzzle with
+solve(Puzzle puzzle, str engine, str mode, bool trace_memory, SolutionCache cache)
+        -> Puzzle, SearchStats:
+    solves the puzzle with the named engine and returns the solution with the
+    record of the search.
+bfs_shift(Puzzle puzzle, SearchStats stats, ProgressReporter progress,
+          SearchLimits limits) -> Puzzle:
+    solves the shifting puzzle with breadth first search. returns a puzzle with
     completed steps stored inside.
-_generate_moves(int x_cord, int y_cord) -> list[list[int]]:
-    returns a list of valid moves from the position (x_cord, y_cord).
-_get_tile_loc_dict() -> dict:
-    returns a dict maping the correct numbers that are in position position (x,y).
-_get_heuristic(Puzzle puzzle) -> int:
+astar_shift(Puzzle puzzle, SearchStats stats, ProgressReporter progress,
+            SearchLimits limits) -> Puzzle:
+    solves the shifting puzzle with A* using manhattan distance plus linear
+    conflicts. returns a puzzle with the optimal steps stored inside.
+bidirectional_shift(Puzzle puzzle, SearchStats stats, ProgressReporter progress,
+                    SearchLimits limits) -> Puzzle:
+    solves the shifting puzzle with breadth first search from both the puzzle
+    and the completed puzzle. returns a puzzle with the optimal steps stored.
+batch_astar_shift(Puzzle puzzle, SearchStats stats, ProgressReporter progress,
+                  SearchLimits limits, int batch_size) -> Puzzle:
+    solves the shifting puzzle with A*, expanding batches of nodes and
+    evaluating their children together. returns a puzzle with the optimal
+    steps stored inside.
+heuristic_swap(Puzzle puzzle, SearchStats stats, ProgressReporter progress,
+               SearchLimits limits) -> Puzzle:
+    solves the swapping puzzle with A*. returns a puzzle with the fewest swaps
+    stored inside.
+ida_shift(Puzzle puzzle, SearchStats stats, ProgressReporter progress,
+          SearchLimits limits, str heuristic, int table_size) -> Puzzle:
+    solves the shifting puzzle with IDA* in near constant memory. returns a
+    puzzle with the optimal steps stored inside.
+anytime_shift(Puzzle puzzle, SearchStats stats, ProgressReporter progress,
+              SearchLimits limits, float weight, function on_solution) -> Puzzle:
+    solves the shifting puzzle with anytime weighted A*. returns a puzzle with
+    the best steps found before the limits stopped it stored inside.
+anytime_swap(Puzzle puzzle, SearchStats stats, ProgressReporter progress,
+             SearchLimits limits, float weight, function on_solution) -> Puzzle:
+    solves the swapping puzzle with anytime weighted A*. returns a puzzle with
+    the fewest swaps found before the limits stopped it stored inside.
+_build_solution(Puzzle puzzle, _Node node, _Node goal_node, SearchStats stats) -> Puzzle:
+    adds the moves leading to node (and from goal_node on) to puzzle and
+    returns it.
+_get_path(_Node node, _Node goal_node) -> list[tuple[int]]:
+    returns the moves leading to node (and from goal_node on).
+_get_flat_moves(Puzzle puzzle) -> list[tuple[int]]:
+    returns the moves stored in puzzle as flat indices.
+_add_moves(Puzzle puzzle, list[tuple[int]] path) -> Puzzle:
+    adds moves given as flat indices to puzzle and returns it.
+_get_heuristic(list[list[int]] puzzle, Goal goal) -> int:
     returns the heuristic value indicating how close a state is to being complete.
+_get_swap_heuristic(list[list[int]] puzzle, Goal goal) -> int:
+    returns half the manhattan distance of every tile, rounded up.
+_get_manhattan(list[list[int]] puzzle, Goal goal) -> int:
+    returns manhattan distance of every tile but 0.
+_get_shift_heuristic(list[list[int]] puzzle, Goal goal) -> int:
+    returns manhattan distance of every tile but 0 plus linear conflicts.
+_get_linear_conflict(list[list[int]] puzzle, Goal goal) -> int:
+    returns the extra moves needed for tiles blocking each other in their row
+    or column.
+_get_shift_delta(int state, int new_state, int zero_idx, int move_idx, Goal goal) -> int:
+    returns the change in the shift heuristic made by a shift.
+_get_manhattan_delta(int state, int new_state, int zero_idx, int move_idx, Goal goal) -> int:
+    returns the change in the manhattan distance made by a shift.
+_get_swap_delta(int state, int idx1, int idx2, Goal goal) -> int:
+    returns the change in the manhattan distance of every tile made by a swap.
+_get_line_conflict(int state, Goal goal, int axis, int line) -> int:
+    returns the extra moves needed for tiles blocking each other in one row or
+    column of a packed state.
+_count_conflicts(tuple[int] proper) -> int:
+    returns the tiles that have to leave a line to put it in order.
+_longest_increasing(list[int] values) -> int:
+    returns the length of the longest increasing subsequence of values.
 
+Classes
+-------
+AnytimeSearch:
+    anytime weighted A* search whose best solution so far can be read while it
+    runs.
+_Node:
+    search node holding a packed state, its parent node, the move taken and
+    the heuristic value of the state.
+_TranspositionTable:
+    bounded table of the states an IDA* iteration has reached and the fewest
+    moves it reached them with.
+
+Globals
+-------
+SHIFT_ENGINES : dict[str] -> function
+    maps engine names to the functions that solve the shifting puzzle.
+SWAP_ENGINES : dict[str] -> function
+    maps engine names to the functions that solve the swapping puzzle.
+SHIFT_HEURISTICS : dict[str] -> function
+    maps heuristic names to the functions ida_shift can search with.
 """
-import queue as Q
-from copy import deepcopy
+import heapq
+from array import array
+from collections import deque
+from functools import lru_cache
+from itertools import count
+from math import factorial
+from time import perf_counter
+from goal import get_goal
+from distance_table import table_shift
+from vectorized import batch_shift_heuristic
+from parallel import hda_shift
+from stats import SearchStats
+from limits import SearchAborted
+from puzzle import Puzzle
+from ranking import make_visited
+
+class _Node:
+    """
+    Lightweight search node. Holds a packed state, the node it was generated
+    from and the move (pair of flat indices) that produced it, so creating a
+    child costs the same at any depth. The moves are only rebuilt into a puzzle
+    once a solution is found. The heuristic value is carried along so a child's
+    can be worked out from the change its move makes instead of rescanning the
+    state.
+
+    Attributes
+    ----------
+    state : int
+        packed puzzle state.
+    parent : _Node
+        node this node was generated from, None for the initial state.
+    move : tuple[int]
+        flat indices of the 2 tiles swapped to reach this node.
+    h : int
+        heuristic value of the state the search keeps up to date, 0 for
+        searches without one.
+    """
+    __slots__ = ('state', 'parent', 'move', 'h')
+
+    def __init__(self, state, parent=None, move=None, h=0):
+        self.state = state
+        self.parent = parent
+        self.move = move
+        self.h = h
+
+def solve(puzzle, engine='astar', mode='shift', trace_memory=False, cache=None, **options):
+    """
+    Solves the puzzle with an engine from SHIFT_ENGINES or SWAP_ENGINES and
+    returns the record of the search next to the solution. The search time
+    leaves out the time spent rebuilding the moves. Tracing memory slows the
+    search down noticeably, so it's off unless asked for. A search stopped by
+    its limits returns None with the reason in the record's aborted attribute.
+    With a cache, puzzles solved before are answered from it without
+    searching and new solutions are added to it.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        initial puzzle configuration to solve.
+    engine : str
+        name of the engine in the mode's engine dict.
+    mode : str
+        'shift' or 'swap'.
+    trace_memory : boolean
+        record the peak memory of the search with tracemalloc if True.
+    cache : SolutionCache
+        cache to check before searching and to store the solution in,
+        optional.
+    options : dict
+        passed on to the engine, e.g. progress or limits.
+
+    Returns
+    -------
+    Puzzle, SearchStats
+        Returns the solved puzzle, or None if it can't be solved or the search
+        was aborted, and the record of the search.
 
-def bfs_shift(puzzle, button=None):
+    """
+    solver = (SWAP_ENGINES if mode == 'swap' else SHIFT_ENGINES)[engine]
+    stats = SearchStats()
+    if cache is not None:
+        start_time = perf_counter()
+        path = cache.get(puzzle, mode)
+        if path is not None:
+            stats.cached = True
+            puzzle = _add_moves(puzzle, path)
+            stats.reconstruct_time = perf_counter() - start_time
+            return puzzle, stats
+
+    if trace_memory:
+        #imported here so runs that don't trace memory don't load it
+        import tracemalloc # pylint: disable=import-outside-toplevel
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    elif trace_memory:
+        tracemalloc.reset_peak()
+    start_time = perf_counter()
+    try:
+        puzzle = solver(puzzle, stats=stats, **options)
+    except SearchAborted as error:
+        puzzle = None
+        stats.aborted = error.reason
+    finally:
+        stats.search_time = perf_counter() - start_time - stats.reconstruct_time
+        if trace_memory:
+            stats.peak_memory = tracemalloc.get_traced_memory()[1]
+        if started_tracing:
+            tracemalloc.stop()
+    #anytime solutions cut short aren't known to be optimal, so aren't kept
+    if cache is not None and puzzle is not None and stats.bound in (None, 1.0):
+        cache.put(puzzle, mode, _get_flat_moves(puzzle))
+    return puzzle, stats
+
+def bfs_shift(puzzle, stats=None, progress=None, limits=None):
     """
     Main function to run the shifting puzzle. Function takes in a Puzzle object
-    and runs BFS on it's state to find the optimal solution. If no solution exists,
-    function will run until it examines every possible state. Adds [-1] to puzzle
-    moves if no solution exists.
+    and runs BFS on it's state to find the optimal solution. Puzzles that can't
+    be solved are rejected by a parity check before searching and None is
+    returned. BFS can see every state, so on boards whose state space fits the
+    seen states are kept in a ranking.VisitedSet bitset instead of a set,
+    halving peak memory on a 3x3 board for about twice the time per state. The
+    A* engines keep a best_g dict of every generated state anyway, so a bitset
+    would only replace their smaller closed set and they keep using sets.
 
     Parameters
     ----------
     puzzle : Puzzle
         initial puzzle configuration to begin searching.
+    stats : SearchStats
+        counters to fill in while searching, optional.
+    progress : ProgressReporter
+        reporter updated as states are expanded, optional.
+    limits : SearchLimits
+        limits checked as states are expanded, optional.
 
     Returns
     -------
     Puzzle
-        Returns puzzle with moves/solution state attributes filled.
+        Returns puzzle with moves/solution state attributes filled, or None if
+        the puzzle can't be solved.
 
     """
     #base case
     if puzzle.puzzle_check() is True:
         return puzzle
+    if not puzzle.is_solvable():
+        return None
 
     #initialize data structures
-    queue = Q.Queue()
-    queue.put(puzzle)
-    found_states = set(str(puzzle.get_puzzle_state()))
+    if stats is None:
+        stats = SearchStats()
+    board = puzzle.board
+    queue = deque([_Node(puzzle.get_packed_state())])
+    found_states = make_visited(board)
+    found_states.add(queue[0].state)
     #bfs for solution state
-    while not queue.empty():
-        puzzle = queue.get()
-        zero = puzzle.get_zero_pos()
-        moves = _generate_moves(zero[0], zero[1])
-        for move in moves:
-            if button:
-                button['text'] = len(found_states)
-            new_puzzle = deepcopy(puzzle)
-            new_puzzle.swap(zero, move)
+    while queue:
+        node = queue.popleft()
+        stats.expanded += 1
+        zero_idx = board.zero_pos(node.state)
+        #moving 0 back where it came from gives the parent, which is seen
+        came_from = None if node.move is None else node.move[0]
+        for move_idx in board.neighbours[zero_idx]:
+            if move_idx == came_from:
+                continue
+            new_packed = board.swap(node.state, zero_idx, move_idx)
+            stats.generated += 1
 
             #if state already seen, continue to next state
-            if str(new_puzzle.get_puzzle_state()) in found_states:
+            if not found_states.visit(new_packed):
+                stats.deduped += 1
                 continue
 
-            new_puzzle.add_move([zero, move])
-            if new_puzzle.puzzle_check():
-                return new_puzzle
-            queue.put(new_puzzle)
-            found_states.add(str(new_puzzle.get_puzzle_state()))
+            new_node = _Node(new_packed, node, (zero_idx, move_idx))
+            if puzzle.packed_check(new_packed):
+                return _build_solution(puzzle, new_node, stats=stats)
+            queue.append(new_node)
+        stats.record_sizes(len(queue), len(found_states))
+        if progress is not None:
+            progress.update(stats)
+        if limits is not None:
+            limits.check(stats)
     return None
 
-def heuristic_swap(puzzle):
+def astar_shift(puzzle, stats=None, progress=None, limits=None):
     """
-    Heuristic takes in puzzle and uses a queue to find the shortest path through
-    the puzzle by swapping any tiles. The puzzle is examined to find every
-    possible move and a new puzzle is generated with each move. If the puzzle
-    hasn't been seen yet, it adds the puzzle and it's heuristic value to the
-    priority queue. Once a puzzle is found with a completed board, it is
-    returned with the moves stored inside of it.
+    Solves the shifting puzzle with A*. The frontier is ordered by moves taken
+    plus the manhattan distance and linear conflicts of the state, which never
+    overestimates, so the first completed state popped is an optimal solution.
+    Visits a small fraction of the states bfs_shift does on deep puzzles. The
+    heuristic of each child is its parent's plus the change made by the move,
+    see _get_shift_delta.
 
     Parameters
     ----------
     puzzle : Puzzle
-        puzzle at current state (2d list of ints).
+        initial puzzle configuration to begin searching.
+    stats : SearchStats
+        counters to fill in while searching, optional.
+    progress : ProgressReporter
+        reporter updated as states are expanded, optional.
+    limits : SearchLimits
+        limits checked as states are expanded, optional.
 
     Returns
     -------
     Puzzle
-        Returns a puzzle that has been solved using heuristics.
+        Returns puzzle with moves/solution state attributes filled, or None if
+        the puzzle can't be solved.
 
     """
     #base case
     if puzzle.puzzle_check() is True:
         return puzzle
+    if not puzzle.is_solvable():
+        return None
 
-    #initialize data structures
-    queue = Q.PriorityQueue()
-    queue.put((0, puzzle))
-    found_states = set()
+    #initialize data structures, counter breaks ties without comparing nodes
+    if stats is None:
+        stats = SearchStats()
+    board = puzzle.board
+    goal = puzzle.goal
+    tie = count()
+    node = _Node(puzzle.get_packed_state(), h=_get_shift_heuristic(puzzle.get_puzzle_state(), goal))
+    queue = [(node.h, next(tie), 0, node)]
+    best_g = {node.state: 0}
+    closed = set()
+
+    while queue:
+        _, _, g_cost, node = heapq.heappop(queue)
+        if node.state in closed:
+            continue
+        if puzzle.packed_check(node.state):
+            return _build_solution(puzzle, node, stats=stats)
+        closed.add(node.state)
+        stats.expanded += 1
+
+        zero_idx = board.zero_pos(node.state)
+        for move_idx in board.neighbours[zero_idx]:
+            new_packed = board.swap(node.state, zero_idx, move_idx)
+            stats.generated += 1
+            new_g = g_cost + 1
+            if new_packed in closed or best_g.get(new_packed, new_g + 1) <= new_g:
+                stats.deduped += 1
+                continue
+            best_g[new_packed] = new_g
+
+            h_value = node.h + _get_shift_delta(node.state, new_packed, zero_idx, move_idx, goal)
+            heapq.heappush(queue, (new_g + h_value, next(tie), new_g,
+                                   _Node(new_packed, node, (zero_idx, move_idx), h_value)))
+        stats.record_sizes(len(queue), len(best_g))
+        if progress is not None:
+            progress.update(stats)
+        if limits is not None:
+            limits.check(stats)
+    return None
+
+class _TranspositionTable:
+    """
+    Bounded table of the states reached by the running IDA* iteration and the
+    fewest moves each was reached with. A state reached again with at least
+    as many moves has had its subtree searched with as much of the bound
+    left, so it's skipped. Each state has a single slot picked by its hash.
+    When 2 states share a slot, an entry left over from an earlier iteration
+    is always replaced and otherwise the state reached with fewer moves keeps
+    it, since it cuts off the bigger subtree. The table starts small and
+    doubles when a quarter of its slots are filled, until it reaches
+    max_size, so short searches don't pay for a big table and memory stays
+    bounded however long the search runs.
+
+    Attributes
+    ----------
+    size : int
+        number of slots.
+    max_size : int
+        number of slots the table stops growing at.
+    used : int
+        number of slots holding a state.
+    iteration : int
+        number of the running iteration, entries of earlier ones are stale.
+    """
+    __slots__ = ('size', 'max_size', 'used', 'iteration', '_states', '_depths', '_stamps')
+
+    def __init__(self, max_size, size=1 << 10):
+        self.max_size = max_size
+        self.iteration = 0
+        self._allocate(min(size, max_size))
+
+    def _allocate(self, size):
+        self.size = size
+        self.used = 0
+        self._states = [None] * size
+        self._depths = array('H', bytes(2 * size))
+        self._stamps = array('I', bytes(4 * size))
+
+    def _grow(self):
+        #only entries of the running iteration are worth moving over
+        entries = [(state, depth) for state, depth, stamp
+                   in zip(self._states, self._depths, self._stamps)
+                   if state is not None and stamp == self.iteration]
+        self._allocate(min(2 * self.size, self.max_size))
+        for state, depth in entries:
+            self.visit(state, depth)
+
+    def visit(self, state, g_cost):
+        """
+        Records that state was reached with g_cost moves in the running
+        iteration.
+
+        Parameters
+        ----------
+        state : int
+            packed puzzle state.
+        g_cost : int
+            moves taken to reach state.
+
+        Returns
+        -------
+        boolean
+            Returns False if state was already reached with g_cost moves or
+            fewer, True if it has to be searched.
+        """
+        slot = hash((state,)) % self.size
+        if self._stamps[slot] == self.iteration:
+            if self._states[slot] == state:
+                if self._depths[slot] <= g_cost:
+                    return False
+            elif self._depths[slot] <= g_cost:
+                return True
+        if self._states[slot] is None:
+            self.used += 1
+        self._states[slot] = state
+        self._depths[slot] = g_cost
+        self._stamps[slot] = self.iteration
+        if 4 * self.used > self.size and self.size < self.max_size:
+            self._grow()
+        return True
+
+def ida_shift(puzzle, stats=None, progress=None, limits=None, # pylint: disable=too-many-arguments,too-many-locals
+              heuristic='linear-conflict', table_size=1 << 20):
+    """
+    Solves the shifting puzzle with IDA*. Each iteration is a depth first
+    search that stops at states whose moves taken plus heuristic go over the
+    bound, and the next bound is the lowest value that went over, so the
+    first solution found is optimal. Only the current path and a bounded
+    transposition table are kept in memory, instead of every state seen, which
+    lets 4x4 puzzles be solved in a few tens of MB. The move that would undo
+    the previous one is never tried and states the table has seen reached
+    with as few moves are skipped, which cuts down on searching the same
+    states again.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        initial puzzle configuration to begin searching.
+    stats : SearchStats
+        counters to fill in while searching, optional.
+    progress : ProgressReporter
+        reporter updated as states are expanded, optional.
+    limits : SearchLimits
+        limits checked as states are expanded, optional.
+    heuristic : str or function
+        name of a heuristic in SHIFT_HEURISTICS, or a function taking a 2d
+        puzzle state and its Goal that never overestimates the moves left.
+        The named ones are updated move by move, functions are called on
+        every state.
+    table_size : int
+        most slots the transposition table grows to, 0 for none. It never
+        grows past the number of solvable states of the board.
+
+    Returns
+    -------
+    Puzzle
+        Returns puzzle with moves/solution state attributes filled, or None if
+        the puzzle can't be solved.
+
+    """
+    #base case
+    if puzzle.puzzle_check() is True:
+        return puzzle
+    if not puzzle.is_solvable():
+        return None
+
+    if stats is None:
+        stats = SearchStats()
+    board = puzzle.board
+    goal = puzzle.goal
+    evaluate = SHIFT_HEURISTICS[heuristic] if isinstance(heuristic, str) else heuristic
+    delta = _SHIFT_DELTAS.get(evaluate)
+    #only half of the permutations can be reached from the start
+    table_size = min(table_size, factorial(board.size) // 2)
+    table = _TranspositionTable(table_size) if table_size else None
+    state = puzzle.get_packed_state()
+    zero_idx = board.zero_pos(state)
+    h_value = evaluate(puzzle.get_puzzle_state(), goal)
+    bound = h_value
 
     while True:
-        _, puzzle_state = queue.get()
-
-        #loop used to generate every move from every tile location
-        for i in range(3):
-            for j in range(3):
-                #used to store potential moves for each tile
-                p_moves = _generate_moves(i,j)
-
-                #Iterates over all valid moves generated for the tile
-                for move in p_moves:
-                    #create new puzzle & move lists & completes move
-                    #and evaluates new heuristic
-                    new_puzzle = deepcopy(puzzle_state)
-                    new_puzzle.swap([i, j], move)
-                    new_heuristic = _get_heuristic(new_puzzle.get_puzzle_state())
-
-                    if str(new_puzzle.get_puzzle_state()) in found_states:
+        #each frame holds a state, its heuristic, where 0 is, where 0 came
+        #from and the moves left to try
+        stack = [(state, h_value, zero_idx, None, iter(board.neighbours[zero_idx]))]
+        path = []
+        next_bound = float('inf')
+        if table is not None:
+            table.iteration += 1
+        while stack:
+            node_state, node_h, node_zero, came_from, moves = stack[-1]
+            move_idx = next(moves, None)
+            if move_idx is None:
+                stack.pop()
+                if path:
+                    path.pop()
+                continue
+            #moving 0 back where it came from undoes the last move
+            if move_idx == came_from:
+                continue
+            new_packed = board.swap(node_state, node_zero, move_idx)
+            stats.generated += 1
+            if delta is not None:
+                new_h = node_h + delta(node_state, new_packed, node_zero, move_idx, goal)
+            else:
+                new_h = evaluate(board.unpack(new_packed), goal)
+            new_g = len(stack)
+            if new_g + new_h > bound:
+                next_bound = min(next_bound, new_g + new_h)
+                continue
+            if puzzle.packed_check(new_packed):
+                path.append((node_zero, move_idx))
+                start_time = perf_counter()
+                puzzle = _add_moves(puzzle, path)
+                stats.reconstruct_time += perf_counter() - start_time
+                return puzzle
+            if table is not None and not table.visit(new_packed, new_g):
+                stats.deduped += 1
+                continue
+            stats.expanded += 1
+            path.append((node_zero, move_idx))
+            stack.append((new_packed, new_h, move_idx, node_zero,
+                          iter(board.neighbours[move_idx])))
+            stats.record_sizes(len(stack), 0 if table is None else table.used)
+            if progress is not None:
+                progress.update(stats)
+            if limits is not None:
+                limits.check(stats)
+        if next_bound == float('inf'):
+            return None
+        bound = next_bound
+
+def bidirectional_shift(puzzle, stats=None, progress=None, limits=None):
+    """
+    Solves the shifting puzzle with a breadth first search going forwards from
+    the puzzle and backwards from the completed puzzle at the same time. Each
+    step expands a whole layer of whichever side has the smaller frontier and
+    stops as soon as a new state has been seen by the other side. Because every
+    state the other side has seen is at most as deep as its frontier and no
+    meeting happened on earlier layers, the first meeting found is an optimal
+    solution. Explores about 2*b^(d/2) states instead of b^d.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        initial puzzle configuration to begin searching.
+    stats : SearchStats
+        counters to fill in while searching, optional.
+    progress : ProgressReporter
+        reporter updated as states are expanded, optional.
+    limits : SearchLimits
+        limits checked as states are expanded, optional.
+
+    Returns
+    -------
+    Puzzle
+        Returns puzzle with moves/solution state attributes filled, or None if
+        the puzzle can't be solved.
+
+    """
+    #base case
+    if puzzle.puzzle_check() is True:
+        return puzzle
+    if not puzzle.is_solvable():
+        return None
+
+    #each side maps the states it has seen to their nodes
+    if stats is None:
+        stats = SearchStats()
+    board = puzzle.board
+    forward_layer = [_Node(puzzle.get_packed_state())]
+    backward_layer = [_Node(puzzle.correct_packed)]
+    forward = {forward_layer[0].state: forward_layer[0]}
+    backward = {backward_layer[0].state: backward_layer[0]}
+
+    while forward_layer and backward_layer:
+        is_forward = len(forward_layer) <= len(backward_layer)
+        layer, seen, other = (forward_layer, forward, backward) if is_forward \
+                             else (backward_layer, backward, forward)
+        new_layer = []
+        for node in layer:
+            stats.expanded += 1
+            if limits is not None:
+                limits.check(stats)
+            zero_idx = board.zero_pos(node.state)
+            for move_idx in board.neighbours[zero_idx]:
+                new_packed = board.swap(node.state, zero_idx, move_idx)
+                stats.generated += 1
+                if new_packed in seen:
+                    stats.deduped += 1
+                    continue
+
+                new_node = _Node(new_packed, node, (zero_idx, move_idx))
+                if new_packed in other:
+                    if is_forward:
+                        return _build_solution(puzzle, new_node, other[new_packed], stats)
+                    return _build_solution(puzzle, other[new_packed], new_node, stats)
+                seen[new_packed] = new_node
+                new_layer.append(new_node)
+        if is_forward:
+            forward_layer = new_layer
+        else:
+            backward_layer = new_layer
+        stats.record_sizes(len(forward_layer) + len(backward_layer), len(forward) + len(backward))
+        if progress is not None:
+            progress.update(stats)
+    return None
+
+def batch_astar_shift(puzzle, stats=None, progress=None, limits=None, batch_size=64):
+    """
+    Solves the shifting puzzle with A*, popping up to batch_size of the nodes
+    with the lowest f cost at a time and evaluating the heuristic of all of
+    their children in one call to vectorized.batch_shift_heuristic. Batches
+    never mix f costs, so no node costing more than the solution is expanded,
+    and ties are broken towards the deepest nodes, which reaches the goal with
+    far fewer expansions on the last f cost than astar_shift's first come
+    first served order. Every node of a batch has the lowest f cost, so the
+    first completed state popped is an optimal solution. States reached again
+    with fewer moves are reopened. Pays off on deep puzzles, on 30-40 move 4x4
+    puzzles it's about 3 times faster than astar_shift, while short searches
+    are dominated by the cost of each batch call.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        initial puzzle configuration to begin searching.
+    stats : SearchStats
+        counters to fill in while searching, optional.
+    progress : ProgressReporter
+        reporter updated as states are expanded, optional.
+    limits : SearchLimits
+        limits checked as states are expanded, optional.
+    batch_size : int
+        most nodes expanded per batch. Smaller batches follow the deepest
+        nodes more closely, larger ones pay the batch call less often.
+
+    Returns
+    -------
+    Puzzle
+        Returns puzzle with moves/solution state attributes filled, or None if
+        the puzzle can't be solved.
+
+    """
+    #base case
+    if puzzle.puzzle_check() is True:
+        return puzzle
+    if not puzzle.is_solvable():
+        return None
+
+    if stats is None:
+        stats = SearchStats()
+    board = puzzle.board
+    tie = count()
+    node = _Node(puzzle.get_packed_state())
+    #entries are (f, -g, tie, node) so the deepest node of an f cost goes first
+    queue = [(_get_shift_heuristic(puzzle.get_puzzle_state(), puzzle.goal), 0, next(tie), node)]
+    best_g = {node.state: 0}
+
+    while queue:
+        #pop a batch of the nodes with the lowest f, leaving stale entries behind
+        layer = []
+        f_cost = queue[0][0]
+        while queue and len(layer) < batch_size and queue[0][0] == f_cost:
+            _, neg_g, _, node = heapq.heappop(queue)
+            if -neg_g > best_g[node.state]:
+                continue
+            if puzzle.packed_check(node.state):
+                return _build_solution(puzzle, node, stats=stats)
+            layer.append((-neg_g, node))
+
+        children = []
+        for g_cost, node in layer:
+            stats.expanded += 1
+            zero_idx = board.zero_pos(node.state)
+            for move_idx in board.neighbours[zero_idx]:
+                new_packed = board.swap(node.state, zero_idx, move_idx)
+                stats.generated += 1
+                if best_g.get(new_packed, g_cost + 2) <= g_cost + 1:
+                    stats.deduped += 1
+                    continue
+                best_g[new_packed] = g_cost + 1
+                #each child keeps its own g, a batch can reach a state twice
+                children.append((g_cost + 1, _Node(new_packed, node, (zero_idx, move_idx))))
+
+        h_values = batch_shift_heuristic([child.state for _, child in children], puzzle.goal)
+        for (g_cost, child), h_value in zip(children, h_values):
+            heapq.heappush(queue, (g_cost + h_value, -g_cost, next(tie), child))
+        stats.record_sizes(len(queue), len(best_g))
+        if progress is not None:
+            progress.update(stats)
+        if limits is not None:
+            limits.check(stats)
+    return None
+
+def heuristic_swap(puzzle, stats=None, progress=None, limits=None):
+    """
+    Solves the swapping puzzle, where any 2 neighbouring tiles can be swapped,
+    with A*. The frontier is ordered by swaps taken plus half the manhattan
+    distance of every tile (rounded up), since one swap moves 2 tiles 1 step
+    each. That never overestimates, so with a closed set of expanded states the
+    first completed state popped is an optimal solution. Each neighbouring pair
+    of tiles is swapped once per state, using the pairs in board.swap_edges.
+    Nodes carry the manhattan distance of every tile, which a swap changes by
+    _get_swap_delta.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        puzzle at current state (2d list of ints).
+    stats : SearchStats
+        counters to fill in while searching, optional.
+    progress : ProgressReporter
+        reporter updated as states are expanded, optional.
+    limits : SearchLimits
+        limits checked as states are expanded, optional.
+
+    Returns
+    -------
+    Puzzle
+        Returns a puzzle that has been solved with the fewest swaps.
+
+    """
+    #base case
+    if puzzle.puzzle_check() is True:
+        return puzzle
+
+    #initialize data structures, ties go to the deeper node and then to the
+    #order nodes were generated in, so nodes are never compared
+    if stats is None:
+        stats = SearchStats()
+    board = puzzle.board
+    goal = puzzle.goal
+    tie = count()
+    node = _Node(puzzle.get_packed_state(), h=_get_heuristic(puzzle.get_puzzle_state(), goal))
+    queue = [((node.h + 1) // 2, 0, next(tie), node)]
+    best_g = {node.state: 0}
+    closed = set()
+
+    while queue:
+        _, neg_g, _, node = heapq.heappop(queue)
+        if node.state in closed:
+            continue
+        if puzzle.packed_check(node.state):
+            return _build_solution(puzzle, node, stats=stats)
+        closed.add(node.state)
+        stats.expanded += 1
+
+        new_g = 1 - neg_g
+        for idx1, idx2 in board.swap_edges:
+            new_packed = board.swap(node.state, idx1, idx2)
+            stats.generated += 1
+            if new_packed in closed or best_g.get(new_packed, new_g + 1) <= new_g:
+                stats.deduped += 1
+                continue
+            best_g[new_packed] = new_g
+
+            #half the manhattan distance rounded up, as in _get_swap_heuristic
+            h_value = node.h + _get_swap_delta(node.state, idx1, idx2, goal)
+            heapq.heappush(queue, (new_g + (h_value + 1) // 2, -new_g, next(tie),
+                                   _Node(new_packed, node, (idx1, idx2), h_value)))
+        stats.record_sizes(len(queue), len(best_g))
+        if progress is not None:
+            progress.update(stats)
+        if limits is not None:
+            limits.check(stats)
+    return None
+
+class AnytimeSearch:
+    """
+    The AnytimeSearch class runs anytime weighted A* on a shifting or swapping
+    puzzle. Nodes are expanded in order of moves taken plus weight times the
+    heuristic, which finds a solution after far fewer expansions than A* but
+    not always the shortest. The search keeps going after a solution: every
+    shorter one found replaces it, and the weight is lowered towards 1 each
+    time. Nodes that can't beat the best solution are dropped, and the lowest
+    moves plus heuristic left to expand is a lower bound on the optimal
+    length, so the best solution is known to be at most bound times optimal.
+    The search ends once nothing left can beat the best solution, which is
+    then optimal, or when its limits stop it, which returns the best solution
+    so far instead of aborting.
+
+    best, bound and lower_bound can be read from another thread while run()
+    is going, e.g. to show the current solution.
+
+    Attributes
+    ----------
+    puzzle : Puzzle
+        initial puzzle configuration to solve.
+    mode : str
+        'shift' or 'swap'.
+    weight : float
+        weight of the heuristic used for the nodes being expanded.
+    weight_step : float
+        amount the weight is lowered by after each solution, down to 1.
+    on_solution : function
+        called with the new best solution as a Puzzle and its bound each time
+        one is found, optional.
+    lower_bound : int
+        fewest moves any solution can have, as far as the search has proven.
+    best_length : int
+        number of moves of the best solution, None before one is found.
+
+    Methods
+    -------
+    best -> Puzzle:
+        property, returns a copy of the puzzle holding the best solution.
+    bound -> float:
+        property, returns the proven ratio of the best solution to optimal.
+    run(SearchStats stats, ProgressReporter progress, SearchLimits limits) -> Puzzle:
+        searches until optimal or stopped and returns the best solution.
+    """
+
+    def __init__(self, puzzle, mode='shift', weight=3.0, weight_step=0.5, on_solution=None): # pylint: disable=too-many-arguments
+        self.puzzle = puzzle
+        self.mode = mode
+        self.weight = weight
+        self.weight_step = weight_step
+        self.on_solution = on_solution
+        self.lower_bound = 0
+        self.best_length = None
+        self._best_node = None
+
+    @property
+    def best(self):
+        """
+        Builds a copy of the initial puzzle holding the best solution so far.
+
+        Returns
+        -------
+        Puzzle
+            Returns the solved copy, or None if no solution was found yet.
+
+        """
+        node = self._best_node
+        if node is None:
+            return None
+        puzzle = self.puzzle
+        copy = Puzzle(puzzle.board.unpack_tiles(puzzle.get_packed_state()),
+                      puzzle.board.rows, puzzle.board.cols, puzzle.goal)
+        return _add_moves(copy, _get_path(node))
+
+    @property
+    def bound(self):
+        """
+        Gets how far from optimal the best solution can be, as the ratio of its
+        moves to the lower bound.
+
+        Returns
+        -------
+        float
+            Returns 1.0 once the best solution is proven optimal, inf before a
+            solution is found.
+
+        """
+        if self.best_length is None:
+            return float('inf')
+        if self.best_length <= self.lower_bound:
+            return 1.0
+        return self.best_length / self.lower_bound
+
+    def run(self, stats=None, progress=None, limits=None):
+        """
+        Searches until the best solution is proven optimal or the limits stop
+        the search. Shifting puzzles that can't be solved are rejected by a
+        parity check before searching.
+
+        Parameters
+        ----------
+        stats : SearchStats
+            counters to fill in while searching, its bound is set to the bound
+            of the returned solution. Optional.
+        progress : ProgressReporter
+            reporter updated as states are expanded, optional.
+        limits : SearchLimits
+            limits checked as states are expanded, optional.
+
+        Raises
+        ------
+        SearchAborted
+            if the limits stop the search before any solution was found.
+
+        Returns
+        -------
+        Puzzle
+            Returns puzzle with the moves of the best solution added, or None
+            if the puzzle can't be solved.
+
+        """
+        puzzle = self.puzzle
+        if stats is None:
+            stats = SearchStats()
+        if puzzle.puzzle_check() is True:
+            self.best_length = 0
+            stats.bound = 1.0
+            return puzzle
+        is_swap = self.mode == 'swap'
+        if not is_swap and not puzzle.is_solvable():
+            return None
+
+        board = puzzle.board
+        goal = puzzle.goal
+        tie = count()
+        if is_swap:
+            node = _Node(puzzle.get_packed_state(), h=_get_heuristic(puzzle.get_puzzle_state(), goal))
+            estimate = (node.h + 1) // 2
+        else:
+            node = _Node(puzzle.get_packed_state(),
+                         h=_get_shift_heuristic(puzzle.get_puzzle_state(), goal))
+            estimate = node.h
+        #queue is ordered by the weighted cost, lower by the unweighted one
+        queue = [(self.weight * estimate, next(tie), 0, estimate, node)]
+        lower = [(estimate, next(tie), 0, node)]
+        best_g = {node.state: 0}
+        #g cost each state was last expanded at, expanded again if reached cheaper
+        closed = {}
+        self.lower_bound = estimate
+        best_length = float('inf')
+
+        try:
+            while queue:
+                _, _, g_cost, estimate, node = heapq.heappop(queue)
+                if best_g[node.state] != g_cost or closed.get(node.state) == g_cost \
+                   or g_cost + estimate >= best_length:
+                    continue
+                closed[node.state] = g_cost
+                stats.expanded += 1
+
+                new_g = g_cost + 1
+                if is_swap:
+                    moves = board.swap_edges
+                else:
+                    zero_idx = board.zero_pos(node.state)
+                    moves = [(zero_idx, move_idx) for move_idx in board.neighbours[zero_idx]]
+                for idx1, idx2 in moves:
+                    new_packed = board.swap(node.state, idx1, idx2)
+                    stats.generated += 1
+                    if best_g.get(new_packed, new_g + 1) <= new_g:
+                        stats.deduped += 1
+                        continue
+                    if is_swap:
+                        h_value = node.h + _get_swap_delta(node.state, idx1, idx2, goal)
+                        estimate = (h_value + 1) // 2
+                    else:
+                        h_value = node.h + _get_shift_delta(node.state, new_packed, idx1, idx2, goal)
+                        estimate = h_value
+                    if new_g + estimate >= best_length:
                         continue
-                    found_states.add(str(new_puzzle.get_puzzle_state()))
-                    new_puzzle.add_move([[i, j], move])
-                    if new_puzzle.puzzle_check():
-                        return new_puzzle
-                    queue.put((new_heuristic, new_puzzle))
+                    best_g[new_packed] = new_g
+                    new_node = _Node(new_packed, node, (idx1, idx2), h_value)
+                    if puzzle.packed_check(new_packed):
+                        best_length = new_g
+                        queue = self._improve(new_node, new_g, queue, best_g, closed)
+                        continue
+                    heapq.heappush(queue, (new_g + self.weight * estimate, next(tie),
+                                           new_g, estimate, new_node))
+                    heapq.heappush(lower, (new_g + estimate, next(tie), new_g, new_node))
+
+                #drop nodes from the top of lower that are stale or can't win
+                while lower and (best_g[lower[0][3].state] != lower[0][2]
+                                 or closed.get(lower[0][3].state) == lower[0][2]
+                                 or lower[0][0] >= best_length):
+                    heapq.heappop(lower)
+                self.lower_bound = min(lower[0][0], best_length) if lower else best_length
+                if self.lower_bound >= best_length:
+                    break
+                stats.record_sizes(len(queue), len(best_g))
+                if progress is not None:
+                    progress.update(stats)
+                if limits is not None:
+                    limits.check(stats)
+        except SearchAborted:
+            if self._best_node is None:
+                raise
+        if self._best_node is None:
+            return None
+        if not queue:
+            self.lower_bound = self.best_length
+        stats.bound = self.bound
+        return _build_solution(puzzle, self._best_node, stats=stats)
+
+    def _improve(self, node, g_cost, queue, best_g, closed): # pylint: disable=too-many-arguments
+        """
+        Makes node the best solution, lowers the weight and rebuilds the queue
+        with the new weight, leaving out the nodes that can't beat it.
+
+        Parameters
+        ----------
+        node : _Node
+            node holding the completed state.
+        g_cost : int
+            moves taken to reach node.
+        queue : list[tuple]
+            heap of nodes to expand.
+        best_g : dict[int] -> int
+            fewest moves each state was reached with.
+        closed : dict[int] -> int
+            moves each state was last expanded with.
 
-def _generate_moves(x_cord, y_cord):
+        Returns
+        -------
+        list[tuple]
+            Returns the rebuilt heap.
+        """
+        self._best_node = node
+        self.best_length = g_cost
+        self.weight = max(1.0, self.weight - self.weight_step)
+        queue = [(entry_g + self.weight * estimate, tie, entry_g, estimate, entry)
+                 for _, tie, entry_g, estimate, entry in queue
+                 if best_g[entry.state] == entry_g and closed.get(entry.state) != entry_g
+                 and entry_g + estimate < g_cost]
+        heapq.heapify(queue)
+        if self.on_solution is not None:
+            self.on_solution(self.best, self.bound)
+        return queue
+
+def anytime_shift(puzzle, stats=None, progress=None, limits=None, weight=3.0, on_solution=None): # pylint: disable=too-many-arguments
     """
-    Generates all moves from x,y location.
+    Solves the shifting puzzle with anytime weighted A*, see AnytimeSearch. A
+    first solution comes back quickly and is improved until it's proven
+    optimal or the limits stop the search, which returns the best one found.
+    Create an AnytimeSearch instead to read the best solution while it runs.
 
     Parameters
     ----------
-    x_cord : int
-        int representing x coordinate in the puzzle grid.
-    y_cord : int
-        int representing x coordinate in the puzzle grid.
+    puzzle : Puzzle
+        initial puzzle configuration to begin searching.
+    stats : SearchStats
+        counters to fill in while searching, optional.
+    progress : ProgressReporter
+        reporter updated as states are expanded, optional.
+    limits : SearchLimits
+        limits checked as states are expanded, optional.
+    weight : float
+        weight of the heuristic until the first solution is found.
+    on_solution : function
+        called with each better solution as a Puzzle and its bound, optional.
 
     Returns
     -------
-    moves : list[list[int]]
-        returns a list of coordinate ints of tiles that tile x_cord, y_cord can
-        move to.
+    Puzzle
+        Returns puzzle with moves/solution state attributes filled, or None if
+        the puzzle can't be solved.
+
+    """
+    search = AnytimeSearch(puzzle, 'shift', weight, on_solution=on_solution)
+    return search.run(stats, progress, limits)
 
+def anytime_swap(puzzle, stats=None, progress=None, limits=None, weight=3.0, on_solution=None): # pylint: disable=too-many-arguments
     """
-    moves = []
+    Solves the swapping puzzle with anytime weighted A*, see AnytimeSearch and
+    anytime_shift.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        initial puzzle configuration to begin searching.
+    stats : SearchStats
+        counters to fill in while searching, optional.
+    progress : ProgressReporter
+        reporter updated as states are expanded, optional.
+    limits : SearchLimits
+        limits checked as states are expanded, optional.
+    weight : float
+        weight of the heuristic until the first solution is found.
+    on_solution : function
+        called with each better solution as a Puzzle and its bound, optional.
 
-    #north
-    if x_cord != 0:
-        moves.append([x_cord-1, y_cord])
-    #south
-    if x_cord != 2:
-        moves.append([x_cord+1, y_cord])
-    #east
-    if y_cord != 2:
-        moves.append([x_cord, y_cord+1])
-    #west
-    if y_cord != 0:
-        moves.append([x_cord, y_cord-1])
+    Returns
+    -------
+    Puzzle
+        Returns puzzle with the fewest swaps found added.
 
-    return moves
+    """
+    search = AnytimeSearch(puzzle, 'swap', weight, on_solution=on_solution)
+    return search.run(stats, progress, limits)
 
-def _get_tile_loc_dict():
+def _build_solution(puzzle, node, goal_node=None, stats=None):
     """
-    Method to get a lookup dictionary to find where a tile number should be by
-    using a completed puzzle as a reference.
-    0---1---2
-    |   |   |
-    3---4---5
-    |   |   |
-    6---7---8
+    Adds the moves leading to node (and on from goal_node when given) to puzzle,
+    so get_soln_states() can replay them. The time taken is added to the
+    reconstruct_time of stats.
 
     Parameters
     ----------
-    None
+    puzzle : Puzzle
+        initial puzzle the search started from.
+    node : _Node
+        node holding the completed state, or the meeting state when goal_node
+        is given.
+    goal_node : _Node
+        node holding the same state as node, reached from the completed state.
+    stats : SearchStats
+        record of the search, optional.
 
     Returns
     -------
-    tiles : dict[int] -> list[int]
-        returns a lookup dict for where each tile should be.
+    Puzzle
+        Returns puzzle with the moves to the completed state added.
     """
-    tiles = {}
-    tiles[1] = [0,0]
-    tiles[2] = [0,1]
-    tiles[3] = [0,2]
-    tiles[4] = [1,0]
-    tiles[5] = [1,1]
-    tiles[6] = [1,2]
-    tiles[7] = [2,0]
-    tiles[8] = [2,1]
-    tiles[0] = [2,2]
+    start_time = perf_counter()
+    puzzle = _add_moves(puzzle, _get_path(node, goal_node))
+    if stats is not None:
+        stats.reconstruct_time += perf_counter() - start_time
+    return puzzle
 
-    return tiles
+def _get_path(node, goal_node=None):
+    """
+    Walks the parent pointers from node back to the initial state to get the
+    moves in order. If a node from a search going backwards from the completed
+    state is given, its parent pointers are walked forwards to finish the path.
 
-def _get_heuristic(puzzle):
+    Parameters
+    ----------
+    node : _Node
+        node holding the completed state, or the meeting state when goal_node
+        is given.
+    goal_node : _Node
+        node holding the same state as node, reached from the completed state.
+
+    Returns
+    -------
+    list[tuple[int]]
+        Returns the moves as pairs of flat indices.
+    """
+    path = []
+    while node.parent is not None:
+        path.append(node.move)
+        node = node.parent
+    path.reverse()
+    while goal_node is not None and goal_node.parent is not None:
+        #moving back towards the completed state undoes the backwards move
+        path.append((goal_node.move[1], goal_node.move[0]))
+        goal_node = goal_node.parent
+    return path
+
+def _get_flat_moves(puzzle):
+    """
+    Converts the moves stored in puzzle back into pairs of flat indices.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        solved puzzle.
+
+    Returns
+    -------
+    list[tuple[int]]
+        Returns the moves as pairs of flat indices.
+    """
+    return puzzle.moves.flat()
+
+def _add_moves(puzzle, path):
+    """
+    Adds moves given as pairs of flat indices to puzzle.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        initial puzzle the search started from.
+    path : list[tuple[int]]
+        moves as pairs of flat indices.
+
+    Returns
+    -------
+    Puzzle
+        Returns puzzle with the moves added.
+    """
+    for idx1, idx2 in path:
+        puzzle.moves.append_flat(idx1, idx2)
+    return puzzle
+
+def _get_heuristic(puzzle, goal=None):
     """
     Determines heuristic value of puzzle by adding up how far each tile in the
     puzzle is from it's proper position.
@@ -204,18 +1208,326 @@ def _get_heuristic(puzzle):
     ----------
     puzzle : list[list[int]] (state not puzzle class)
         puzzle at current state (2d list of ints).
+    goal : Goal
+        completed puzzle, the standard one if not given.
 
     Returns
     -------
     h_sum : int
         returns heuristic for current puzzle state.
     """
-    tile_dic = _get_tile_loc_dict()
+    if goal is None:
+        goal = get_goal(len(puzzle), len(puzzle[0]))
+    distances = goal.distances
+    h_sum = 0
+    idx = 0
+    for row in puzzle:
+        for value in row:
+            #distance from (i,j) to where the tile lying there should be
+            h_sum += distances[idx][value]
+            idx += 1
+    return h_sum
+
+def _get_swap_heuristic(puzzle, goal=None):
+    """
+    Determines the heuristic value of a swapping puzzle state. A swap moves 2
+    tiles 1 step each, so at least half of the manhattan distance of all the
+    tiles (0 included) is left to do.
+
+    Parameters
+    ----------
+    puzzle : list[list[int]] (state not puzzle class)
+        puzzle at current state (2d list of ints).
+    goal : Goal
+        completed puzzle, the standard one if not given.
+
+    Returns
+    -------
+    int
+        returns heuristic for current puzzle state.
+    """
+    return (_get_heuristic(puzzle, goal) + 1) // 2
+
+def _get_manhattan(puzzle, goal=None):
+    """
+    Determines the manhattan distance of a shifting puzzle state by adding up
+    how far every tile other than 0 is from it's proper position.
+
+    Parameters
+    ----------
+    puzzle : list[list[int]] (state not puzzle class)
+        puzzle at current state (2d list of ints).
+    goal : Goal
+        completed puzzle, the standard one if not given.
+
+    Returns
+    -------
+    h_sum : int
+        returns manhattan distance of the current puzzle state.
+    """
+    if goal is None:
+        goal = get_goal(len(puzzle), len(puzzle[0]))
+    distances = goal.distances
     h_sum = 0
-    for i in range(3):
-        for j in range(3):
-            proper = [i,j] #what should lie at (i,j)
-            current = tile_dic[puzzle[i][j]] #what actually lies at (i,j)
-            #add x and y distances of tile to proper to heuristic
-            h_sum += abs(current[0] - proper[0]) + abs(current[1] - proper[1])
+    idx = 0
+    for row in puzzle:
+        for value in row:
+            if value != 0:
+                h_sum += distances[idx][value]
+            idx += 1
     return h_sum
+
+def _get_shift_heuristic(puzzle, goal=None):
+    """
+    Determines the heuristic value of a shifting puzzle state. Adds up how far
+    every tile other than 0 is from it's proper position and adds the linear
+    conflicts on top. 0 is left out since moving it is what moves the tiles,
+    which keeps the value from overestimating the moves left.
+
+    Parameters
+    ----------
+    puzzle : list[list[int]] (state not puzzle class)
+        puzzle at current state (2d list of ints).
+    goal : Goal
+        completed puzzle, the standard one if not given.
+
+    Returns
+    -------
+    int
+        returns heuristic for current puzzle state.
+    """
+    if goal is None:
+        goal = get_goal(len(puzzle), len(puzzle[0]))
+    return _get_manhattan(puzzle, goal) + _get_linear_conflict(puzzle, goal)
+
+def _get_linear_conflict(puzzle, goal=None):
+    """
+    Determines the linear conflicts of a puzzle state. Tiles that are in their
+    proper row (or column) but in the wrong order relative to each other have
+    to leave the row to pass each other, costing 2 extra moves per tile that
+    has to leave. The fewest tiles that have to leave is the number of tiles
+    outside of the longest run already in the right order.
+
+    Parameters
+    ----------
+    puzzle : list[list[int]] (state not puzzle class)
+        puzzle at current state (2d list of ints).
+    goal : Goal
+        completed puzzle, the standard one if not given.
+
+    Returns
+    -------
+    int
+        returns the extra moves needed to resolve the conflicts.
+    """
+    if goal is None:
+        goal = get_goal(len(puzzle), len(puzzle[0]))
+    board = goal.board
+    goal_coords = goal.coords
+    conflicts = 0
+    for i in range(board.rows):
+        #proper columns of the tiles in row i that belong in row i
+        row = [goal_coords[v][1] for v in puzzle[i] if v != 0 and goal_coords[v][0] == i]
+        conflicts += len(row) - _longest_increasing(row)
+    for i in range(board.cols):
+        #proper rows of the tiles in column i that belong in column i
+        col = [goal_coords[puzzle[j][i]][0] for j in range(board.rows)
+               if puzzle[j][i] != 0 and goal_coords[puzzle[j][i]][1] == i]
+        conflicts += len(col) - _longest_increasing(col)
+    return 2 * conflicts
+
+def _get_shift_delta(state, new_state, zero_idx, move_idx, goal):
+    """
+    Determines how much the shift heuristic changes when the tile at move_idx
+    shifts into the blank at zero_idx, without rescanning the state. Only the
+    moved tile's manhattan distance changes. A tile moving sideways stays in
+    its row and 0 isn't counted, so the order of the tiles in the row is kept
+    and only the column it leaves or enters can change conflicts (the other
+    way round for moving up or down), and only if that is the tile's proper
+    column. So at most one line is looked at, and most moves look at none.
+
+    Parameters
+    ----------
+    state : int
+        packed state before the move.
+    new_state : int
+        packed state after the move.
+    zero_idx : int
+        flat index of 0 before the move.
+    move_idx : int
+        flat index of the tile shifted into 0.
+    goal : Goal
+        completed puzzle.
+
+    Returns
+    -------
+    int
+        returns the heuristic of new_state minus the heuristic of state.
+    """
+    board = goal.board
+    tile = (state >> (move_idx * board.cell_bits)) & board.cell_mask
+    delta = goal.distances[zero_idx][tile] - goal.distances[move_idx][tile]
+    #a sideways move changes the tile's column (axis 1), otherwise its row
+    axis = 1 if zero_idx // board.cols == move_idx // board.cols else 0
+    line = goal.coords[tile][axis]
+    if line in (board.coords[zero_idx][axis], board.coords[move_idx][axis]):
+        delta += (_get_line_conflict(new_state, goal, axis, line)
+                  - _get_line_conflict(state, goal, axis, line))
+    return delta
+
+def _get_manhattan_delta(state, new_state, zero_idx, move_idx, goal): # pylint: disable=unused-argument
+    """
+    Determines how much the manhattan distance changes when the tile at
+    move_idx shifts into the blank at zero_idx, from the moved tile alone.
+
+    Parameters
+    ----------
+    state : int
+        packed state before the move.
+    new_state : int
+        packed state after the move.
+    zero_idx : int
+        flat index of 0 before the move.
+    move_idx : int
+        flat index of the tile shifted into 0.
+    goal : Goal
+        completed puzzle.
+
+    Returns
+    -------
+    int
+        returns the distance of new_state minus the distance of state.
+    """
+    board = goal.board
+    tile = (state >> (move_idx * board.cell_bits)) & board.cell_mask
+    return goal.distances[zero_idx][tile] - goal.distances[move_idx][tile]
+
+def _get_swap_delta(state, idx1, idx2, goal):
+    """
+    Determines how much the manhattan distance of every tile (0 included)
+    changes when the tiles at idx1 and idx2 are swapped, from the distances of
+    just those 2 tiles. Linear conflicts don't apply to swaps since tiles can
+    pass each other without leaving their line.
+
+    Parameters
+    ----------
+    state : int
+        packed state before the swap.
+    idx1 : int
+        flat index of the first tile.
+    idx2 : int
+        flat index of the second tile.
+    goal : Goal
+        completed puzzle.
+
+    Returns
+    -------
+    int
+        returns the distance after the swap minus the distance before it.
+    """
+    board = goal.board
+    distances = goal.distances
+    tile1 = (state >> (idx1 * board.cell_bits)) & board.cell_mask
+    tile2 = (state >> (idx2 * board.cell_bits)) & board.cell_mask
+    return (distances[idx2][tile1] + distances[idx1][tile2]
+            - distances[idx1][tile1] - distances[idx2][tile2])
+
+def _get_line_conflict(state, goal, axis, line):
+    """
+    Determines the linear conflicts of one row or column of a packed state, the
+    part _get_linear_conflict adds for that line.
+
+    Parameters
+    ----------
+    state : int
+        packed puzzle state.
+    goal : Goal
+        completed puzzle.
+    axis : int
+        0 for a row, 1 for a column.
+    line : int
+        index of the row or column.
+
+    Returns
+    -------
+    int
+        returns the extra moves needed to resolve the conflicts in the line.
+    """
+    board = goal.board
+    if axis == 0:
+        cells = range(line * board.cols, (line + 1) * board.cols)
+    else:
+        cells = range(line, board.size, board.cols)
+    goal_coords = goal.coords
+    proper = []
+    for cell in cells:
+        tile = (state >> (cell * board.cell_bits)) & board.cell_mask
+        if tile != 0 and goal_coords[tile][axis] == line:
+            proper.append(goal_coords[tile][1 - axis])
+    return 2 * _count_conflicts(tuple(proper))
+
+@lru_cache(maxsize=65536)
+def _count_conflicts(proper):
+    """
+    Counts the tiles that have to leave a line to let the others into order.
+    Lines repeat a lot between states, so results are cached.
+
+    Parameters
+    ----------
+    proper : tuple[int]
+        proper positions along the line of the tiles that belong in it, in the
+        order they're in.
+
+    Returns
+    -------
+    int
+        returns the number of tiles outside the longest increasing run.
+    """
+    return len(proper) - _longest_increasing(proper)
+
+def _longest_increasing(values):
+    """
+    Finds the length of the longest strictly increasing subsequence.
+
+    Parameters
+    ----------
+    values : list[int]
+        list of ints to examine.
+
+    Returns
+    -------
+    int
+        returns the length of the longest increasing subsequence.
+    """
+    lengths = []
+    for idx, value in enumerate(values):
+        lengths.append(1 + max([lengths[j] for j in range(idx) if values[j] < value],
+                               default=0))
+    return max(lengths, default=0)
+
+SHIFT_ENGINES = {
+    'anytime': anytime_shift,
+    'astar': astar_shift,
+    'astar-batch': batch_astar_shift,
+    'bfs': bfs_shift,
+    'bidirectional': bidirectional_shift,
+    'hda': hda_shift,
+    'ida': ida_shift,
+    'table': table_shift,
+}
+
+SWAP_ENGINES = {
+    'anytime': anytime_swap,
+    'astar': heuristic_swap,
+}
+
+SHIFT_HEURISTICS = {
+    'linear-conflict': _get_shift_heuristic,
+    'manhattan': _get_manhattan,
+}
+
+#named heuristics that can be updated move by move
+_SHIFT_DELTAS = {
+    _get_shift_heuristic: _get_shift_delta,
+    _get_manhattan: _get_manhattan_delta,
+}
@@ -1,31 +1,59 @@
 """
 Module puzzle contains the class that holds the data and performs the operations
 for the shifting puzzle. Inside the class are 2 static methods used for validating
-and converting lists of 9 ints into puzzle objects.
+and converting lists of ints into puzzle objects. Puzzles default to 3x3 but any
+number of rows and columns is supported, with the size specific tables shared
+through board.Board.
 
 Classes:
     Puzzle:
         Constructor:
-            Puzzle(list[int])
+            Puzzle(list[int], int rows, int cols, Goal goal)
 
         Attributes:
             puzzle : list[list[int]]
-            soln_states: list[puzzles]
-            moves : list[list[int]]
+            soln_states : SolutionView
+            moves : MoveList
             correct_puzzle list[list[int]]
+            board : Board
+            goal : Goal
 
         Methods:
             get_puzzle_state() -> list[list[int]]
             puzzle_check() -> boolean
-            static validate(list[int]) -> boolean
+            is_solvable() -> boolean
+            static validate(list[int], int, int) -> boolean
             add_move(list[list[int]]) -> none
             puzzle_converter(list[str) -> none
             swap(list[list[int]], list[list[int]]) -> none
             static puzzle_printer(list[list[int]]) -> none
-            get_soln_states() -> list[list[list[int]]]
+            get_soln_states() -> SolutionView
+            get_packed_state() -> int
+            get_canonical_state() -> int, int
+            set_packed_state(int) -> none
+            packed_check(int) -> boolean
+            static pack(list[list[int]]) -> int
+            static unpack(int, int, int) -> list[list[int]]
+            static packed_swap(int, int, int, int) -> int
+            static packed_zero_pos(int, int) -> int
+
+Globals
+-------
+CELL_BITS : int
+    number of bits used to store a single tile in a packed puzzle state of up
+    to 16 tiles. Larger boards use board.cell_bits.
+CELL_MASK : int
+    mask used to read a single tile out of a packed puzzle state.
 """
 from collections import Counter
-from copy import deepcopy
+from math import isqrt
+from board import get_board, MIN_CELL_BITS
+from goal import get_goal, Goal, DEFAULT_GOAL
+from symmetry import canonicalize
+from solution import MoveList, SolutionView
+
+CELL_BITS = MIN_CELL_BITS
+CELL_MASK = (1 << CELL_BITS) - 1
 
 class Puzzle:
     """
@@ -35,10 +63,15 @@ class Puzzle:
     -----
     Possible puzzle states can be validated by calling the static method validate,
     eg. validate([0,1,2,3,4,5,6,7,8]). It will work while populated with 9 ints
-    or 9 strs that are the unique numbers 0-8 in some order.
+    or 9 strs that are the unique numbers 0-8 in some order. Other sizes are
+    validated by passing the rows and columns, eg. validate(tiles, 4, 4).
 
     Once the input has been validated, you can create the class by calling
-    Puzzle(arg) with the input from validate as arg.
+    Puzzle(arg) with the input from validate as arg. The size is taken as square
+    unless rows or cols are given, eg. Puzzle(tiles, 2, 3), and a ValueError is
+    raised if the tiles don't fill that size exactly. The completed puzzle
+    is the standard one unless a goal is given, either a Goal or a layout
+    accepted by goal.get_goal(), eg. Puzzle(tiles, goal='snake').
 
     The main methods for manipulating the puzzles are swap() and add_move().
     Swap takes in 2 x,y coordinate ints in a list to swap the values at both
@@ -50,19 +83,33 @@ class Puzzle:
 
     e.g. calling add_move([[0,1], [1,0]]) adds the move.
 
+    Puzzle states can also be handled in a packed form, a single int holding
+    board.cell_bits bits per tile with the tile at flat index i
+    (row * columns + column) stored at bits i * board.cell_bits. Packed states
+    are cheap to hash and compare, so the solvers use them for duplicate
+    detection and goal tests.
+
+    e.g. pack([[1,2,3],[4,5,6],[7,8,0]]) returns 0x087654321.
+
     Attributes
     ----------
     puzzle : list[list[int]]
         current state of the puzzle
-    soln_states : list[list[list[int]]]
-        list of puzzle states representing optimal solution. Filled when
-        get_soln_states() is called.
-    moves : list[list[list[int]]]
-        list of moves taken to get to current puzzle state. A move is 2 list of
-        x, y coordinate value pairs.
+    soln_states : SolutionView
+        sequence of puzzle states from the initial state through every move,
+        built from the moves when indexed (see solution).
+    moves : MoveList
+        moves taken to get to current puzzle state, stored as flat indices and
+        read back as 2 lists of x, y coordinate value pairs.
     correct_puzzle : list[list[int]]
         puzzle state representing the end/solved state to compare the current
-        state to.
+        state to, shared with every puzzle with the same goal.
+    correct_packed : int
+        packed form of correct_puzzle.
+    board : Board
+        shared tables for the size of the puzzle.
+    goal : Goal
+        shared tables for the completed puzzle.
 
     Methods
     -------
@@ -71,36 +118,65 @@ class Puzzle:
     puzzle_check() -> boolean:
         returns a boolean if the current puzzle state equals the completed puzzle
         state.
-    static validate(list[int] puzzle_input) -> boolean:
+    is_solvable() -> boolean:
+        returns a boolean if the completed puzzle state can be reached from
+        the current state by shifting tiles into the blank.
+    static validate(list[int] puzzle_input, int rows, int cols) -> boolean:
         returns a boolean if the puzzle_input is a valid shifting puzzle combination.
-        Requires [0-8] or ['0'-'8'] uniquely in some order.
+        Requires [0-8] or ['0'-'8'] uniquely in some order for a 3x3 puzzle.
     add_move(list[list[int]] move) -> none:
         adds a move to the moves attr.
     puzzle_converter(list[str) -> none:
-        converts puzzle_input from validate() into a valid 2d 3x3 shifting puzzle
+        converts puzzle_input from validate() into a valid 2d shifting puzzle
         and sets self.puzzle to the valid puzzle.
     swap(list[list[int]] tile1, list[list[int]] tile2) -> none:
         swaps the values of the puzzle attr at the x,y location at tile1 with the
         x,y location attile2.
     static puzzle_printer(list[list[int]] puzzle) -> none:
         prints the inputted puzzle state to console.
-    get_soln_states() -> list[list[list[int]]]:
-        takes initial puzzle and applies all the moves in the moves attr. recording
-        the states along the way and returns a list of the puzzle states needed
-        to solve the puzzle.
+    get_soln_states() -> SolutionView:
+        sets the puzzle to the state after all the moves in the moves attr. and
+        returns the sequence of puzzle states needed to solve the puzzle.
+    get_packed_state() -> int:
+        returns the current puzzle state in packed form.
+    get_canonical_state() -> int, int:
+        returns the representative of the current state's symmetry class and
+        the transform that maps the state onto it.
+    set_packed_state(int packed) -> none:
+        sets the current puzzle state from a packed state.
+    packed_check(int packed) -> boolean:
+        returns a boolean if the packed state equals the completed puzzle state.
+    static pack(list[list[int]] puzzle) -> int:
+        converts a 2d puzzle state into its packed form.
+    static unpack(int packed, int row_len, int col_len) -> list[list[int]]:
+        converts a packed state back into a 2d puzzle state.
+    static packed_swap(int packed, int idx1, int idx2, int cell_bits) -> int:
+        returns the packed state with the tiles at flat indices idx1 and idx2
+        swapped.
+    static packed_zero_pos(int packed, int cell_bits) -> int:
+        returns the flat index of 0 in the packed state.
     """
 
-    def __init__(self, puzzle):
+    def __init__(self, puzzle, rows=None, cols=None, goal=None):
+        if rows is None and cols is None:
+            rows = cols = isqrt(len(puzzle))
+        elif rows is None:
+            rows = len(puzzle) // cols
+        elif cols is None:
+            cols = len(puzzle) // rows
+        if rows * cols != len(puzzle):
+            raise ValueError(f"{len(puzzle)} tiles don't fit a {rows}x{cols} puzzle.")
+        self.board = get_board(rows, cols)
         self.puzzle = []
         self.puzzle_converter(puzzle)
-        self.soln_states = [deepcopy(self.puzzle)]
-        self.moves = []
-        self.correct_puzzle =  [
-                                    [1,2,3],
-                                    [4,5,6],
-                                    [7,8,0]
-                                ]
-        
+        self.moves = MoveList(self.board)
+        self.soln_states = SolutionView(self.board, self.get_packed_state(), self.moves)
+        if not isinstance(goal, Goal):
+            goal = get_goal(rows, cols, DEFAULT_GOAL if goal is None else goal)
+        self.goal = goal
+        self.correct_puzzle = goal.puzzle
+        self.correct_packed = goal.packed
+
     def __lt__(self, other):
         return len(self.moves) < len(other.moves)
 
@@ -144,17 +220,58 @@ class Puzzle:
         """
         return self.puzzle == self.correct_puzzle
 
+    def is_solvable(self):
+        """
+        Determines in O(n) if the completed state can be reached by shifting
+        tiles into the blank. Every shift swaps 0 with a neighbour, so it flips
+        both the parity of the tile permutation and the parity of the row +
+        column of 0. The puzzle is solvable exactly when the permutation taking
+        the current state to the completed state has the same parity as the
+        distance 0 has to travel. Covers the inversion count and blank row
+        rules for both odd and even width puzzles.
+
+        Returns
+        -------
+        Boolean
+            Returns a boolean if the puzzle can be solved by shifting.
+
+        """
+        row_len = self.board.cols
+        goal_idx = self.goal.cells
+        perm = [goal_idx[v] for row in self.puzzle for v in row]
+
+        #parity of a permutation is (length - number of cycles) % 2
+        seen = [False] * len(perm)
+        cycles = 0
+        for start in range(len(perm)):
+            if not seen[start]:
+                cycles += 1
+                idx = start
+                while not seen[idx]:
+                    seen[idx] = True
+                    idx = perm[idx]
+        perm_parity = (len(perm) - cycles) % 2
+
+        zero = self.get_zero_pos()
+        goal_zero = divmod(goal_idx[0], row_len)
+        zero_parity = (abs(zero[0] - goal_zero[0]) + abs(zero[1] - goal_zero[1])) % 2
+        return perm_parity == zero_parity
+
     @staticmethod
-    def validate(puzzle_input):
+    def validate(puzzle_input, rows=3, cols=3):
         """
         Examines an input list to determine if the list represents a valid
-        shifting puzzle (ensures values are 0-8 uniquely in some order). Function
-        static bc it's called BEFORE a puzzle object is created.
+        shifting puzzle (ensures values are 0-8 uniquely in some order for a 3x3
+        puzzle). Function static bc it's called BEFORE a puzzle object is created.
 
         Parameters
         ----------
         puzzle_input : list[str]
             List of strs representing ints for a possible shifting puzzle object.
+        rows : int
+            number of rows of the puzzle.
+        cols : int
+            number of columns of the puzzle.
 
         Returns
         -------
@@ -162,7 +279,7 @@ class Puzzle:
             Returns a boolean if input list is a valid shifting puzzle.
 
         """
-        valid_list = [0, 1, 2, 3, 4, 5, 6, 7, 8]
+        valid_list = list(range(rows * cols))
         return Counter(puzzle_input) == Counter(valid_list)
 
     def add_move(self, move):
@@ -184,8 +301,8 @@ class Puzzle:
 
     def puzzle_converter(self, args):
         """
-        Converts a list of strings into a 2d, 3x3 puzzle of ints and sets it to
-        puzzle.puzzle.
+        Converts a list of strings into a 2d puzzle of ints, one row per
+        board.cols values, and sets it to puzzle.puzzle.
 
         Parameters
         ----------
@@ -201,7 +318,7 @@ class Puzzle:
         row = []
         for value in args:
             row.append(int(value))
-            if len(row) == 3:
+            if len(row) == self.board.cols:
                 puzzle.append(row)
                 row = []
         self.puzzle = puzzle
@@ -235,23 +352,173 @@ class Puzzle:
         None.
 
         """
-        for i in range(3):
-            print(puzzle[i])
+        for row in puzzle:
+            print(row)
 
     def get_soln_states(self):
         """
-        Converts the initial puzzle using the stored list of moves to create
-        and return a list of puzzle states representing a solution.
+        Applies the stored list of moves to the initial puzzle and returns the
+        puzzle states representing a solution. The states are replayed from
+        the moves as they're read rather than stored.
 
         Returns
         -------
-        List[List[List[int]]]
-            Returns a list of puzzle states.
+        SolutionView
+            Returns the sequence of puzzle states.
 
         """
-        self.puzzle = deepcopy(self.soln_states[0])
-        for step in self.moves:
-            self.swap(step[0], step[1])
-            self.soln_states.append(deepcopy(self.puzzle))
-
+        self.puzzle = self.soln_states[-1]
         return self.soln_states
+
+    def get_packed_state(self):
+        """
+        Gets the current state of the puzzle in packed form.
+
+        Returns
+        -------
+        int
+            Returns int representing the current puzzle state.
+
+        """
+        return self.board.pack(self.puzzle)
+
+    def get_canonical_state(self):
+        """
+        Gets the representative of the current state's symmetry class in packed
+        form, see symmetry.canonicalize().
+
+        Returns
+        -------
+        int, int
+            Returns the packed representative and the transform that maps the
+            current state onto it.
+
+        """
+        return canonicalize(self.get_packed_state(), self.goal)
+
+    def set_packed_state(self, packed):
+        """
+        Sets the current state of the puzzle from a packed state.
+
+        Parameters
+        ----------
+        packed : int
+            int representing a puzzle state.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.puzzle = self.board.unpack(packed)
+
+    def packed_check(self, packed):
+        """
+        Compares a packed state to the completed state to determine if it is
+        solved. Used by the solvers so the goal test never builds a 2d list.
+
+        Parameters
+        ----------
+        packed : int
+            int representing a puzzle state.
+
+        Returns
+        -------
+        Boolean
+            Returns a boolean if the packed state is completed.
+
+        """
+        return packed == self.correct_packed
+
+    @staticmethod
+    def pack(puzzle):
+        """
+        Packs a 2d puzzle state into a single int using the board for its size.
+
+        Parameters
+        ----------
+        puzzle : list[list[int]]
+            2d list representing a puzzle state.
+
+        Returns
+        -------
+        int
+            Returns int representing the puzzle state.
+
+        """
+        return get_board(len(puzzle), len(puzzle[0])).pack(puzzle)
+
+    @staticmethod
+    def unpack(packed, row_len=3, col_len=None):
+        """
+        Unpacks a packed state back into a 2d puzzle state.
+
+        Parameters
+        ----------
+        packed : int
+            int representing a puzzle state.
+        row_len : int
+            number of rows.
+        col_len : int
+            number of columns, same as row_len if not given.
+
+        Returns
+        -------
+        list[list[int]]
+            Returns 2d list representing the puzzle state.
+
+        """
+        return get_board(row_len, col_len or row_len).unpack(packed)
+
+    @staticmethod
+    def packed_swap(packed, idx1, idx2, cell_bits=CELL_BITS):
+        """
+        Swaps the tiles at 2 flat indices of a packed state.
+
+        Parameters
+        ----------
+        packed : int
+            int representing a puzzle state.
+        idx1 : int
+            flat index (row * columns + column) of the first tile.
+        idx2 : int
+            flat index (row * columns + column) of the second tile.
+        cell_bits : int
+            number of bits per tile in the packed state.
+
+        Returns
+        -------
+        int
+            Returns int representing the puzzle state after the swap.
+
+        """
+        cell_mask = (1 << cell_bits) - 1
+        shift1 = idx1 * cell_bits
+        shift2 = idx2 * cell_bits
+        diff = ((packed >> shift1) ^ (packed >> shift2)) & cell_mask
+        return packed ^ ((diff << shift1) | (diff << shift2))
+
+    @staticmethod
+    def packed_zero_pos(packed, cell_bits=CELL_BITS):
+        """
+        Gets the flat index of 0 in a packed state.
+
+        Parameters
+        ----------
+        packed : int
+            int representing a puzzle state.
+        cell_bits : int
+            number of bits per tile in the packed state.
+
+        Returns
+        -------
+        int
+            Returns flat index (row * columns + column) of 0.
+
+        """
+        cell_mask = (1 << cell_bits) - 1
+        idx = 0
+        while packed & cell_mask:
+            packed >>= cell_bits
+            idx += 1
+        return idx
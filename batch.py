@@ -0,0 +1,258 @@
+"""
+The batch module solves a stream of puzzles, one per line, on a pool of worker
+processes. Lines are read lazily and handed to the pool in chunks, with only a
+few chunks per worker in flight at a time, so memory stays bounded no matter
+how long the input is. Results are yielded in input order, or in the order the
+chunks finish when ordered is False.
+
+Every result is a tab separated line holding the input, the status and, for
+solved puzzles, the number of moves and the moves as the directions 0 moves
+in (U, D, L, R), e.g. 123456708<tab>solved<tab>1<tab>R. Aborted and failed
+puzzles give the reason after the status instead. With a timeout or expansion
+budget, a puzzle that runs past it can't hold a worker up.
+
+Usage
+-----
+Call batch_solve() with any iterable of lines, e.g. an open file or sys.stdin,
+or run the program with --batch FILE (- for stdin).
+
+Methods
+-------
+batch_solve(iterable lines, str engine, list[int] size, int workers, int chunksize,
+            bool ordered, float timeout, int max_expanded, str goal) -> iterator[str]:
+    solves every puzzle in lines and yields a result line for each.
+_collect(deque pending, bool ordered) -> iterator[str]:
+    yields the result lines of the next finished chunks.
+_read_chunks(iterable lines, int chunksize) -> iterator[list[str]]:
+    groups the non-empty lines into lists of chunksize lines.
+_solve_chunk(list[str] lines, str engine, list[int] size, float timeout,
+             int max_expanded, str goal) -> list[str]:
+    solves a chunk of lines inside a worker process.
+_solve_line(str line, str engine, list[int] size, float timeout,
+            int max_expanded, str goal) -> str:
+    solves a single puzzle line and formats the result.
+_move_string(list[list[list[int]]] moves) -> str:
+    converts moves into the directions 0 moves in.
+
+Globals
+-------
+SOLVED : str
+    status of puzzles that were solved.
+UNSOLVABLE : str
+    status of puzzles that can't be solved.
+INVALID : str
+    status of lines that aren't a valid puzzle.
+ERROR : str
+    status of puzzles the engine failed on.
+ABORTED : str
+    status of puzzles that ran out of time or expansions.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import heuristic as H
+from console import parse_puzzle
+from cache import SolutionCache
+from goal import DEFAULT_GOAL
+from limits import SearchLimits
+from puzzle import Puzzle
+
+SOLVED = "solved"
+UNSOLVABLE = "unsolvable"
+INVALID = "invalid"
+ERROR = "error"
+ABORTED = "aborted"
+
+#chunks in flight per worker, enough to keep every worker busy
+_CHUNKS_PER_WORKER = 2
+#each worker process answers repeated puzzles from its own cache
+_cache = SolutionCache(maxsize=4096)
+
+def batch_solve(lines, engine="astar", size=None, workers=None, chunksize=64, ordered=True, # pylint: disable=too-many-arguments
+                timeout=None, max_expanded=None, goal=DEFAULT_GOAL):
+    """
+    Solves every puzzle in lines on a pool of worker processes and yields a
+    result line for each. At most workers * 2 chunks are submitted at a time,
+    new chunks are only read from lines as results are handed back.
+
+    Parameters
+    ----------
+    lines : iterable[str]
+        puzzles, one per line, in the same format as the command line input.
+        Blank lines are skipped.
+    engine : str
+        name of the engine in heuristic.SHIFT_ENGINES used to solve the puzzles.
+    size : list[int]
+        rows and columns of every puzzle, square if not given.
+    workers : int
+        number of worker processes, defaults to the number of cores.
+    chunksize : int
+        number of lines sent to a worker at a time.
+    ordered : boolean
+        yield results in input order if True, otherwise as chunks finish.
+    timeout : float
+        seconds each puzzle may search for, no limit if not given.
+    max_expanded : int
+        states each puzzle may expand, no limit if not given.
+    goal : str
+        name of the layout in goal.GOAL_LAYOUTS every puzzle is solved to.
+
+    Returns
+    -------
+    iterator[str]
+        Returns an iterator over the result lines.
+
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * _CHUNKS_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _read_chunks(lines, chunksize):
+            pending.append(pool.submit(_solve_chunk, chunk, engine, size, timeout,
+                                       max_expanded, goal))
+            if len(pending) >= max_pending:
+                yield from _collect(pending, ordered)
+        while pending:
+            yield from _collect(pending, ordered)
+
+def _collect(pending, ordered):
+    """
+    Waits for submitted chunks and yields their result lines. Takes the oldest
+    chunk if ordered, otherwise every chunk that has finished.
+
+    Parameters
+    ----------
+    pending : deque[concurrent.futures.Future]
+        chunks that have been submitted, oldest first. Collected chunks are
+        removed.
+    ordered : boolean
+        collect the oldest chunk if True, otherwise the finished ones.
+
+    Returns
+    -------
+    iterator[str]
+        Returns an iterator over the result lines.
+    """
+    if ordered:
+        yield from pending.popleft().result()
+        return
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield from future.result()
+
+def _read_chunks(lines, chunksize):
+    """
+    Groups the non-empty lines into chunks, reading lines only as chunks are
+    asked for.
+
+    Parameters
+    ----------
+    lines : iterable[str]
+        puzzles, one per line.
+    chunksize : int
+        number of lines per chunk.
+
+    Returns
+    -------
+    iterator[list[str]]
+        Returns an iterator over the chunks.
+    """
+    chunk = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        chunk.append(line)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _solve_chunk(lines, engine, size, timeout=None, max_expanded=None, goal=DEFAULT_GOAL):
+    """
+    Solves a chunk of lines. Runs inside a worker process.
+
+    Parameters
+    ----------
+    lines : list[str]
+        puzzles, one per line.
+    engine : str
+        name of the engine in heuristic.SHIFT_ENGINES.
+    size : list[int]
+        rows and columns of every puzzle, square if not given.
+    timeout : float
+        seconds each puzzle may search for.
+    max_expanded : int
+        states each puzzle may expand.
+    goal : str
+        name of the layout every puzzle is solved to.
+
+    Returns
+    -------
+    list[str]
+        Returns the result lines in the same order as lines.
+    """
+    return [_solve_line(line, engine, size, timeout, max_expanded, goal) for line in lines]
+
+def _solve_line(line, engine, size, timeout=None, max_expanded=None, goal=DEFAULT_GOAL):
+    """
+    Solves a single puzzle line and formats the result.
+
+    Parameters
+    ----------
+    line : str
+        puzzle in the same format as the command line input.
+    engine : str
+        name of the engine in heuristic.SHIFT_ENGINES.
+    size : list[int]
+        rows and columns of the puzzle, square if not given.
+    timeout : float
+        seconds the puzzle may search for.
+    max_expanded : int
+        states the puzzle may expand.
+    goal : str
+        name of the layout the puzzle is solved to.
+
+    Returns
+    -------
+    str
+        Returns the tab separated result line.
+    """
+    try:
+        tiles, rows, cols = parse_puzzle(line, size)
+    except ValueError:
+        return f"{line}\t{INVALID}"
+    if tiles is None:
+        return f"{line}\t{INVALID}"
+    puzzle = Puzzle(tiles, rows, cols, goal)
+    if not puzzle.is_solvable():
+        return f"{line}\t{UNSOLVABLE}"
+    try:
+        puzzle, stats = H.solve(puzzle, engine, cache=_cache,
+                                limits=SearchLimits(timeout, max_expanded))
+    except ValueError as error:
+        return f"{line}\t{ERROR}\t{error}"
+    if stats.aborted:
+        return f"{line}\t{ABORTED}\t{stats.aborted}"
+    return f"{line}\t{SOLVED}\t{len(puzzle.moves)}\t{_move_string(puzzle.moves)}"
+
+def _move_string(moves):
+    """
+    Converts shifting moves into the directions 0 moves in, U, D, L or R.
+
+    Parameters
+    ----------
+    moves : list[list[list[int]]]
+        moves from a solved puzzle, the first x,y coordinate holding 0.
+
+    Returns
+    -------
+    str
+        Returns one letter per move.
+    """
+    letters = {(-1, 0): "U", (1, 0): "D", (0, -1): "L", (0, 1): "R"}
+    return "".join(letters[(move[1][0] - move[0][0], move[1][1] - move[0][1])]
+                   for move in moves)
@@ -0,0 +1,532 @@
+"""
+The benchmark module times the solvers on a fixed corpus of 3x3 puzzles and
+compares the results against a stored baseline. The corpus groups puzzles by
+their optimal number of moves, so a change that only helps easy puzzles (or
+only hurts the hardest ones) shows up in its own row.
+
+Shift mode groups are easy (4-10 moves), medium (18-22 moves), hardest (the 2
+states 31 moves away) and unsolvable. Swap mode groups are easy (2-5 swaps),
+medium (8-10 swaps) and hardest (16 swaps).
+
+Every engine is run on every puzzle of a group. The fastest of --repeat runs
+is kept for the wall time, and a separate run under tracemalloc measures peak
+memory, so tracing doesn't slow down the timed runs. Solutions are checked
+against the stored optimal number of moves. Engines are run with the options
+in ENGINE_OPTIONS, which keeps hda on 1 worker: with more, the order workers
+reach states in changes from run to run and so does the number expanded.
+
+Usage
+-----
+Run python benchmark.py to benchmark every engine and compare against
+benchmarks/baseline.json. --save-baseline replaces the baseline with the new
+results and --make-corpus regenerates the corpus from its seed.
+
+--startup times the command line instead: a fresh `python main.py` solving
+an easy puzzle, less a bare interpreter starting, has to stay under
+STARTUP_TARGET seconds so scripts calling the program many times are paying
+for the solve rather than imports.
+
+Methods
+-------
+main(list argv) -> int:
+    runs the benchmarks from the command line, returns the exit code.
+make_corpus(int seed) -> dict:
+    generates the corpus of puzzles grouped by mode and optimal depth.
+load_corpus(str path) -> dict:
+    reads the corpus stored at path.
+run_benchmarks(dict corpus, list[str] engines, int repeat) -> list[dict]:
+    benchmarks every engine on every group of the corpus.
+compare(list[dict] results, list[dict] baseline, float tolerance) -> list[str]:
+    returns the rows that got slower or changed node counts.
+measure_startup(int repeat) -> float, float:
+    returns the fastest run of the command line and of a bare interpreter.
+_get_parser() -> argparse.ArgumentParser:
+    returns the parser for the command line options.
+_engines() -> dict[str] -> dict[str] -> function:
+    returns the engines of each mode keyed by name.
+_bench_group(str mode, str engine, list[dict] puzzles, int repeat) -> dict:
+    benchmarks one engine on one group of puzzles.
+_total_time(SearchStats stats) -> float:
+    returns the search plus reconstruction time of a record.
+_random_walk(Board board, random.Random rng, int steps, bool swap) -> list[int]:
+    returns the tiles after random moves from the completed puzzle.
+_tile_string(list[int] tiles) -> str:
+    returns the tiles in the command line format.
+_print_results(list[dict] results) -> None:
+    prints the results as a table.
+
+Globals
+-------
+BENCH_DIR : str
+    directory holding the corpus and baseline.
+CORPUS_PATH : str
+    default location of the corpus.
+BASELINE_PATH : str
+    default location of the baseline results.
+RESULTS_PATH : str
+    default location the results are written to.
+CORPUS_SEED : int
+    seed the corpus is generated from.
+STARTUP_TARGET : float
+    most seconds the command line may take to start on top of the
+    interpreter.
+STARTUP_PUZZLE : str
+    puzzle solved by the timed command line runs.
+ENGINE_OPTIONS : dict[str] -> dict
+    options passed to heuristic.solve() for each engine name, so the number
+    of states each engine expands doesn't depend on the machine.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+from time import perf_counter
+import heuristic as H
+from board import get_board
+from goal import get_goal
+from distance_table import get_table, table_shift
+from puzzle import Puzzle
+from stats import SearchStats
+from vectorized import batch_shift_heuristic
+
+BENCH_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+CORPUS_PATH = os.path.join(BENCH_DIR, "corpus.json")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+RESULTS_PATH = os.path.join(BENCH_DIR, "results.json")
+CORPUS_SEED = 2021
+STARTUP_TARGET = 0.1
+STARTUP_PUZZLE = "413726058"
+ENGINE_OPTIONS = {"hda": {"workers": 1}}
+
+#puzzles per group and the depth range of each group
+_GROUP_SIZE = 8
+_UNSOLVABLE_SIZE = 4
+_SHIFT_RANGES = {"easy": (4, 10), "medium": (18, 22)}
+_SWAP_RANGES = {"easy": (2, 5), "medium": (8, 10)}
+_SHIFT_HARDEST = ([8, 6, 7, 2, 5, 4, 3, 0, 1], [6, 4, 7, 8, 5, 0, 3, 2, 1])
+_SWAP_HARDEST = ([0, 8, 7, 6, 5, 4, 3, 2, 1],)
+
+def main(argv):
+    """
+    Runs the benchmarks from the command line, prints the results, writes them
+    to --output and compares them against --baseline if it exists.
+
+    Parameters
+    ----------
+    argv : list[str]
+        command line arguments, program name left out.
+
+    Returns
+    -------
+    int
+        Returns 1 if a row regressed against the baseline, otherwise 0.
+
+    """
+    args = _get_parser().parse_args(argv)
+    if args.startup:
+        startup, interpreter = measure_startup(args.repeat)
+        overhead = startup - interpreter
+        print(f"Startup: {startup:.4f}s, interpreter: {interpreter:.4f}s, "
+              f"overhead: {overhead:.4f}s (target {STARTUP_TARGET}s).")
+        return 1 if overhead > STARTUP_TARGET else 0
+    if args.make_corpus:
+        os.makedirs(os.path.dirname(args.corpus), exist_ok=True)
+        with open(args.corpus, "w") as corpus_file:
+            json.dump(make_corpus(CORPUS_SEED), corpus_file, indent=1)
+        print(f"Corpus written to {args.corpus}.")
+        return 0
+
+    results = run_benchmarks(load_corpus(args.corpus), args.engine, args.repeat)
+    _print_results(results)
+    report = {"python": platform.python_version(), "platform": platform.platform(),
+              "repeat": args.repeat, "results": results}
+    output = args.baseline if args.save_baseline else args.output
+    with open(output, "w") as output_file:
+        json.dump(report, output_file, indent=1)
+    print(f"Results written to {output}.")
+    if args.save_baseline or not os.path.exists(args.baseline):
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(line)
+    print(f"{len(regressions)} regressions against {args.baseline}.")
+    return 1 if regressions else 0
+
+def _get_parser():
+    """
+    Builds the parser for the command line options.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Returns parser for the command line inputs.
+
+    """
+    parser = argparse.ArgumentParser(prog="benchmark.py",
+                                     description="Benchmarks the puzzle solvers.")
+    parser.add_argument("--engine", action="append", default=None,
+                        help="only run this engine, can be given more than once.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per puzzle, the fastest is kept.")
+    parser.add_argument("--corpus", default=CORPUS_PATH,
+                        help="corpus of puzzles to run.")
+    parser.add_argument("--output", default=RESULTS_PATH,
+                        help="file the results are written to as JSON.")
+    parser.add_argument("--baseline", default=BASELINE_PATH,
+                        help="results to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="fraction a group can get slower before it counts as "
+                             "a regression.")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write the results to --baseline instead of --output.")
+    parser.add_argument("--make-corpus", action="store_true",
+                        help="regenerate the corpus from its seed and exit.")
+    parser.add_argument("--startup", action="store_true",
+                        help="time the command line starting up instead and fail "
+                             "if it's over the target.")
+    return parser
+
+def measure_startup(repeat=3):
+    """
+    Times fresh processes solving STARTUP_PUZZLE through main.py and fresh
+    bare interpreters, keeping the fastest of repeat runs of each.
+
+    Parameters
+    ----------
+    repeat : int
+        runs of each command.
+
+    Returns
+    -------
+    float, float
+        Returns the seconds taken by the command line and by the interpreter.
+
+    """
+    main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    commands = [[sys.executable, main_path, STARTUP_PUZZLE], [sys.executable, "-c", "pass"]]
+    times = []
+    for command in commands:
+        best = float('inf')
+        for _ in range(repeat):
+            start_time = perf_counter()
+            subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+            best = min(best, perf_counter() - start_time)
+        times.append(best)
+    return times[0], times[1]
+
+def _engines():
+    """
+    Gets the engines of each mode keyed by their names.
+
+    Returns
+    -------
+    dict[str] -> dict[str] -> function
+        Returns the engines of the shift and swap modes.
+
+    """
+    return {"shift": H.SHIFT_ENGINES, "swap": H.SWAP_ENGINES}
+
+def make_corpus(seed=CORPUS_SEED):
+    """
+    Generates the corpus. Easy puzzles come from short random walks from the
+    completed puzzle, medium puzzles from random permutations, and each is kept
+    only if its optimal depth falls in the group's range. Shift depths are read
+    from the distance table and swap depths come from heuristic_swap, which is
+    optimal.
+
+    Parameters
+    ----------
+    seed : int
+        seed for the random puzzles.
+
+    Returns
+    -------
+    dict
+        Returns {"seed": seed, mode: {group: [{"tiles": str, "depth": int}]}},
+        tiles in the command line format and depth None for unsolvable
+        puzzles.
+
+    """
+    rng = random.Random(seed)
+    board = get_board(3, 3)
+    get_table()
+
+    def shift_depth(tiles):
+        puzzle = table_shift(Puzzle(tiles))
+        return None if puzzle is None else len(puzzle.moves)
+
+    def swap_depth(tiles):
+        return len(H.heuristic_swap(Puzzle(tiles)).moves)
+
+    corpus = {"seed": seed, "shift": {}, "swap": {}}
+    for mode, ranges, get_depth in (("shift", _SHIFT_RANGES, shift_depth),
+                                    ("swap", _SWAP_RANGES, swap_depth)):
+        for group, (low, high) in ranges.items():
+            puzzles = []
+            seen = set()
+            while len(puzzles) < _GROUP_SIZE:
+                if group == "easy":
+                    tiles = _random_walk(board, rng, rng.randint(low, 3 * high), mode == "swap")
+                else:
+                    tiles = rng.sample(range(9), 9)
+                depth = get_depth(tiles)
+                if depth is not None and low <= depth <= high and tuple(tiles) not in seen:
+                    seen.add(tuple(tiles))
+                    puzzles.append({"tiles": _tile_string(tiles), "depth": depth})
+            corpus[mode][group] = puzzles
+
+    corpus["shift"]["hardest"] = [{"tiles": _tile_string(tiles), "depth": shift_depth(tiles)}
+                                  for tiles in _SHIFT_HARDEST]
+    corpus["swap"]["hardest"] = [{"tiles": _tile_string(tiles), "depth": swap_depth(tiles)}
+                                 for tiles in _SWAP_HARDEST]
+    unsolvable = []
+    while len(unsolvable) < _UNSOLVABLE_SIZE:
+        tiles = rng.sample(range(9), 9)
+        if not Puzzle(tiles).is_solvable():
+            unsolvable.append({"tiles": _tile_string(tiles), "depth": None})
+    corpus["shift"]["unsolvable"] = unsolvable
+    return corpus
+
+def _random_walk(board, rng, steps, swap):
+    """
+    Makes random moves from the completed puzzle. Shift walks never undo the
+    move they just made.
+
+    Parameters
+    ----------
+    board : Board
+        board of the puzzle.
+    rng : random.Random
+        source of the random moves.
+    steps : int
+        number of moves to make.
+    swap : boolean
+        swap any 2 neighbouring tiles if True, otherwise shift 0.
+
+    Returns
+    -------
+    list[int]
+        Returns the tiles in flat index order.
+
+    """
+    packed = get_goal(board.rows, board.cols).packed
+    zero_idx = board.zero_pos(packed)
+    last_idx = None
+    for _ in range(steps):
+        if swap:
+            packed = board.swap(packed, *rng.choice(board.swap_edges))
+            continue
+        move_idx = rng.choice([idx for idx in board.neighbours[zero_idx] if idx != last_idx])
+        packed = board.swap(packed, zero_idx, move_idx)
+        last_idx, zero_idx = zero_idx, move_idx
+    return board.unpack_tiles(packed)
+
+def _tile_string(tiles):
+    """
+    Converts tiles into the command line format, e.g. 123456780.
+
+    Parameters
+    ----------
+    tiles : list[int]
+        tiles in flat index order.
+
+    Returns
+    -------
+    str
+        Returns the tiles as a string.
+
+    """
+    return "".join(str(tile) for tile in tiles)
+
+def load_corpus(path=CORPUS_PATH):
+    """
+    Reads the corpus stored at path.
+
+    Parameters
+    ----------
+    path : str
+        location of the corpus.
+
+    Returns
+    -------
+    dict
+        Returns the corpus in the format of make_corpus().
+
+    """
+    with open(path) as corpus_file:
+        return json.load(corpus_file)
+
+def run_benchmarks(corpus, engines=None, repeat=3):
+    """
+    Benchmarks every engine on every group of the corpus. The table is loaded
+    and a batch heuristic is run before timing, so building or mapping the
+    table, importing NumPy and building the batch tables aren't counted.
+
+    Parameters
+    ----------
+    corpus : dict
+        corpus in the format of make_corpus().
+    engines : list[str]
+        names of the engines to run, every engine if not given.
+    repeat : int
+        timed runs per puzzle.
+
+    Returns
+    -------
+    list[dict]
+        Returns one record per mode, engine and group.
+
+    """
+    get_table()
+    goal = get_goal(3, 3)
+    batch_shift_heuristic([goal.packed], goal)
+    results = []
+    for mode, mode_engines in _engines().items():
+        for name in mode_engines:
+            if engines and name not in engines:
+                continue
+            for group, puzzles in corpus[mode].items():
+                record = {"mode": mode, "engine": name, "group": group}
+                record.update(_bench_group(mode, name, puzzles, repeat))
+                results.append(record)
+    return results
+
+def _bench_group(mode, engine, puzzles, repeat):
+    """
+    Benchmarks one engine on a group of puzzles through heuristic.solve(). The
+    record of the fastest run of each puzzle is kept and the group's records
+    are added together, so the times are sums of the fastest runs and the sizes
+    and peak memory are the largest of any puzzle.
+
+    Parameters
+    ----------
+    mode : str
+        'shift' or 'swap'.
+    engine : str
+        name of the engine in the mode's engine dict.
+    puzzles : list[dict]
+        puzzles of the group.
+    repeat : int
+        timed runs per puzzle.
+
+    Returns
+    -------
+    dict
+        Returns the puzzles, time, nodes_per_sec and SearchStats record of the
+        group.
+
+    Raises
+    ------
+    ValueError
+        if the engine returns a wrong number of moves.
+
+    """
+    stats = SearchStats()
+    peak_memory = 0
+    for entry in puzzles:
+        tiles = [int(tile) for tile in entry["tiles"]]
+        best_stats = None
+        options = ENGINE_OPTIONS.get(engine, {})
+        for _ in range(repeat):
+            puzzle, run_stats = H.solve(Puzzle(tiles), engine, mode, **options)
+            if best_stats is None or _total_time(run_stats) < _total_time(best_stats):
+                best_stats = run_stats
+        stats.add(best_stats)
+
+        depth = None if puzzle is None else len(puzzle.moves)
+        if depth != entry["depth"]:
+            raise ValueError(f"{entry['tiles']} solved in {depth} moves, "
+                             f"expected {entry['depth']}.")
+
+        _, traced_stats = H.solve(Puzzle(tiles), engine, mode, trace_memory=True, **options)
+        peak_memory = max(peak_memory, traced_stats.peak_memory)
+    stats.peak_memory = peak_memory
+
+    total_time = _total_time(stats)
+    record = {"puzzles": len(puzzles), "time": total_time,
+              "nodes_per_sec": stats.expanded / total_time if total_time else 0.0}
+    record.update(stats.as_dict())
+    return record
+
+def _total_time(stats):
+    """
+    Adds up the search and reconstruction time of a record.
+
+    Parameters
+    ----------
+    stats : SearchStats
+        record of a search.
+
+    Returns
+    -------
+    float
+        Returns the total time in seconds.
+
+    """
+    return stats.search_time + stats.reconstruct_time
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Compares results against a baseline. A row regresses if it's more than
+    tolerance slower or if it expands a different number of nodes, since the
+    searches are deterministic and a change there means the search changed.
+
+    Parameters
+    ----------
+    results : list[dict]
+        new results from run_benchmarks().
+    baseline : list[dict]
+        stored results from run_benchmarks().
+    tolerance : float
+        fraction a row can get slower before it counts.
+
+    Returns
+    -------
+    list[str]
+        Returns a line describing each regression.
+
+    """
+    stored = {(row["mode"], row["engine"], row["group"]): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = stored.get((row["mode"], row["engine"], row["group"]))
+        if old is None:
+            continue
+        name = f"{row['mode']}/{row['engine']}/{row['group']}"
+        if old["time"] and row["time"] > old["time"] * (1 + tolerance):
+            regressions.append(f"{name}: {row['time']:.4f}s, baseline {old['time']:.4f}s")
+        if row["expanded"] != old["expanded"]:
+            regressions.append(f"{name}: expanded {row['expanded']}, "
+                               f"baseline {old['expanded']}")
+    return regressions
+
+def _print_results(results):
+    """
+    Prints the results as a table.
+
+    Parameters
+    ----------
+    results : list[dict]
+        results from run_benchmarks().
+
+    Returns
+    -------
+    None.
+
+    """
+    print(f"{'mode':6} {'engine':14} {'group':11} {'time (s)':>10} {'expanded':>10} "
+          f"{'generated':>10} {'visited':>10} {'nodes/s':>10} {'peak (KiB)':>11}")
+    for row in results:
+        print(f"{row['mode']:6} {row['engine']:14} {row['group']:11} {row['time']:10.4f} "
+              f"{row['expanded']:10} {row['generated']:10} {row['max_visited']:10} "
+              f"{row['nodes_per_sec']:10.0f} {row['peak_memory'] / 1024:11.1f}")
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,266 @@
+"""
+Board is the module that holds everything about a puzzle that only depends on
+its dimensions, the completed puzzle being left to goal.Goal. A Board is built
+once per size and shared by every puzzle and search node of that size, so the
+solvers look moves, tile positions and distances up in precomputed tables
+instead of checking the dimensions for every state they generate.
+
+Usage
+-----
+Call get_board(rows, cols) to get the shared board for a size. Flat indices
+number the tiles row by row, so the tile at (row, column) has flat index
+row * cols + column.
+
+Classes:
+    Board:
+        Constructor:
+            Board(int rows, int cols)
+
+        Attributes:
+            rows : int
+            cols : int
+            size : int
+            cell_bits : int
+            cell_mask : int
+            coords : list[list[int]]
+            neighbours : list[list[int]]
+            swap_edges : list[tuple[int]]
+            distances : list[list[int]]
+
+        Methods:
+            pack(list[list[int]]) -> int
+            pack_tiles(list[int]) -> int
+            unpack(int) -> list[list[int]]
+            unpack_tiles(int) -> list[int]
+            swap(int, int, int) -> int
+            zero_pos(int) -> int
+
+Methods
+-------
+get_board(int rows, int cols) -> Board:
+    returns the shared board for the size.
+
+Globals
+-------
+MIN_CELL_BITS : int
+    fewest bits used to store a tile in a packed state.
+"""
+
+from functools import lru_cache
+
+MIN_CELL_BITS = 4
+
+class Board:
+    """
+    The Board class holds the tables for one puzzle size. Boards are treated as
+    immutable and shared, so get_board() should be used instead of building
+    them directly.
+
+    Packed states store the tile at flat index i at bits i * cell_bits. Boards up
+    to 4x4 use 4 bits per tile, larger boards use as many as the largest tile
+    needs.
+
+    Attributes
+    ----------
+    rows : int
+        number of rows.
+    cols : int
+        number of columns.
+    size : int
+        number of tiles, 0 included.
+    cell_bits : int
+        number of bits used to store a tile in a packed state.
+    cell_mask : int
+        mask used to read a single tile out of a packed state.
+    coords : list[list[int]]
+        [row, column] of each flat index.
+    neighbours : list[list[int]]
+        flat indices next to each flat index, in north, south, east, west order.
+    swap_edges : list[tuple[int]]
+        every pair of neighbouring flat indices, each pair once.
+    distances : list[list[int]]
+        manhattan distance between every pair of flat indices.
+
+    Methods
+    -------
+    pack(list[list[int]] puzzle) -> int:
+        converts a 2d puzzle state into its packed form.
+    pack_tiles(list[int] tiles) -> int:
+        converts a flat list of tiles into its packed form.
+    unpack(int packed) -> list[list[int]]:
+        converts a packed state back into a 2d puzzle state.
+    unpack_tiles(int packed) -> list[int]:
+        converts a packed state into a flat list of tiles.
+    swap(int packed, int idx1, int idx2) -> int:
+        returns the packed state with the tiles at idx1 and idx2 swapped.
+    zero_pos(int packed) -> int:
+        returns the flat index of 0 in the packed state.
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.cell_bits = max(MIN_CELL_BITS, (self.size - 1).bit_length())
+        self.cell_mask = (1 << self.cell_bits) - 1
+        self.coords = [list(divmod(idx, cols)) for idx in range(self.size)]
+
+        self.neighbours = []
+        for row, col in self.coords:
+            moves = []
+            #north, south, east, west
+            if row != 0:
+                moves.append((row - 1) * cols + col)
+            if row != rows - 1:
+                moves.append((row + 1) * cols + col)
+            if col != cols - 1:
+                moves.append(row * cols + col + 1)
+            if col != 0:
+                moves.append(row * cols + col - 1)
+            self.neighbours.append(moves)
+        self.swap_edges = [(idx, idx + 1) for idx in range(self.size) if idx % cols != cols - 1] + \
+                          [(idx, idx + cols) for idx in range(self.size - cols)]
+
+        self.distances = [[abs(row1 - row2) + abs(col1 - col2) for row2, col2 in self.coords]
+                          for row1, col1 in self.coords]
+
+    def pack(self, puzzle):
+        """
+        Packs a 2d puzzle state into a single int.
+
+        Parameters
+        ----------
+        puzzle : list[list[int]]
+            2d list representing a puzzle state.
+
+        Returns
+        -------
+        int
+            Returns int representing the puzzle state.
+
+        """
+        return self.pack_tiles([value for row in puzzle for value in row])
+
+    def pack_tiles(self, tiles):
+        """
+        Packs a flat list of tiles into a single int.
+
+        Parameters
+        ----------
+        tiles : list[int]
+            tiles in flat index order.
+
+        Returns
+        -------
+        int
+            Returns int representing the puzzle state.
+
+        """
+        packed = 0
+        for idx, value in enumerate(tiles):
+            packed |= value << (idx * self.cell_bits)
+        return packed
+
+    def unpack(self, packed):
+        """
+        Unpacks a packed state back into a 2d puzzle state.
+
+        Parameters
+        ----------
+        packed : int
+            int representing a puzzle state.
+
+        Returns
+        -------
+        list[list[int]]
+            Returns 2d list representing the puzzle state.
+
+        """
+        tiles = self.unpack_tiles(packed)
+        return [tiles[row * self.cols:(row + 1) * self.cols] for row in range(self.rows)]
+
+    def unpack_tiles(self, packed):
+        """
+        Unpacks a packed state into a flat list of tiles.
+
+        Parameters
+        ----------
+        packed : int
+            int representing a puzzle state.
+
+        Returns
+        -------
+        list[int]
+            Returns tiles in flat index order.
+
+        """
+        tiles = []
+        for _ in range(self.size):
+            tiles.append(packed & self.cell_mask)
+            packed >>= self.cell_bits
+        return tiles
+
+    def swap(self, packed, idx1, idx2):
+        """
+        Swaps the tiles at 2 flat indices of a packed state.
+
+        Parameters
+        ----------
+        packed : int
+            int representing a puzzle state.
+        idx1 : int
+            flat index of the first tile.
+        idx2 : int
+            flat index of the second tile.
+
+        Returns
+        -------
+        int
+            Returns int representing the puzzle state after the swap.
+
+        """
+        shift1 = idx1 * self.cell_bits
+        shift2 = idx2 * self.cell_bits
+        diff = ((packed >> shift1) ^ (packed >> shift2)) & self.cell_mask
+        return packed ^ ((diff << shift1) | (diff << shift2))
+
+    def zero_pos(self, packed):
+        """
+        Gets the flat index of 0 in a packed state.
+
+        Parameters
+        ----------
+        packed : int
+            int representing a puzzle state.
+
+        Returns
+        -------
+        int
+            Returns flat index of 0.
+
+        """
+        idx = 0
+        while packed & self.cell_mask:
+            packed >>= self.cell_bits
+            idx += 1
+        return idx
+
+@lru_cache(maxsize=None)
+def get_board(rows, cols):
+    """
+    Gets the shared board for a puzzle size, building it the first time the
+    size is used.
+
+    Parameters
+    ----------
+    rows : int
+        number of rows.
+    cols : int
+        number of columns.
+
+    Returns
+    -------
+    Board
+        Returns the board for the size.
+    """
+    return Board(rows, cols)
@@ -0,0 +1,296 @@
+"""
+Cache is the module that keeps solutions around so a puzzle that has been
+solved before is answered without searching again. Solutions are keyed by the
+mode, the size, the completed puzzle and the canonical packed state (see
+symmetry), and stored as the compact flat indices of their moves rather than
+the states along the way. A state and its reflection share one entry, the
+moves being mapped through the reflection on the way in and out.
+
+A SolutionCache holds a least recently used in-memory tier of a fixed size
+and, when given a path, a shelve file underneath it that survives restarts.
+Lookups check memory first, then the file, moving file hits into memory.
+
+Usage
+-----
+Create a SolutionCache and pass it to heuristic.solve() with cache=, or run
+the program with --cache to use the file at CACHE_PATH. Call close() when done
+with a cache that has a file.
+
+Classes:
+    SolutionCache:
+        Constructor:
+            SolutionCache(int maxsize, str path)
+
+        Attributes:
+            maxsize : int
+            path : str
+            hits : int
+            disk_hits : int
+            misses : int
+
+        Methods:
+            get(Puzzle, str) -> list[tuple[int]]
+            put(Puzzle, str, list[tuple[int]]) -> none
+            counters() -> dict[str] -> int
+            close() -> none
+
+Methods
+-------
+make_key(Puzzle puzzle, str mode) -> tuple, int:
+    returns the cache key of a puzzle and the transform onto its canonical
+    state.
+_disk_key(tuple key) -> str:
+    returns the key used by the file.
+_encode(list[tuple[int]] path, Board board) -> bytes:
+    packs moves into 1 or 2 bytes per flat index.
+_decode(bytes data, Board board) -> list[tuple[int]]:
+    unpacks moves packed by _encode().
+
+Globals
+-------
+CACHE_PATH : str
+    default location of the cache file.
+"""
+
+import os
+import shelve
+from array import array
+from collections import OrderedDict
+from symmetry import map_moves
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "solutions")
+
+class SolutionCache:
+    """
+    The SolutionCache class stores the moves that solve puzzles. Only solved
+    puzzles are stored, since unsolvable ones are rejected by a parity check
+    faster than a lookup.
+
+    Attributes
+    ----------
+    maxsize : int
+        most solutions kept in memory, the least recently used are dropped
+        first.
+    path : str
+        location of the shelve file backing the cache, None for memory only.
+    hits : int
+        number of lookups answered from memory.
+    disk_hits : int
+        number of lookups answered from the file.
+    misses : int
+        number of lookups that weren't cached.
+
+    Methods
+    -------
+    get(Puzzle puzzle, str mode) -> list[tuple[int]]:
+        returns the cached moves of puzzle, None if not cached.
+    put(Puzzle puzzle, str mode, list[tuple[int]] path) -> none:
+        stores the moves that solve puzzle.
+    counters() -> dict[str] -> int:
+        returns the hit and miss counters.
+    close() -> none:
+        closes the file.
+    """
+
+    def __init__(self, maxsize=1024, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._disk = None
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._disk = shelve.open(path)
+
+    def get(self, puzzle, mode):
+        """
+        Looks the moves that solve puzzle up, checking memory before the file.
+
+        Parameters
+        ----------
+        puzzle : Puzzle
+            puzzle to look up, at its initial state.
+        mode : str
+            'shift' or 'swap'.
+
+        Returns
+        -------
+        list[tuple[int]]
+            Returns the moves as pairs of flat indices, or None if the puzzle
+            isn't cached.
+
+        """
+        key, transform = make_key(puzzle, mode)
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+        elif self._disk is not None:
+            data = self._disk.get(_disk_key(key))
+            if data is not None:
+                self._remember(key, data)
+                self.disk_hits += 1
+        if data is None:
+            self.misses += 1
+            return None
+        return map_moves(_decode(data, puzzle.board), puzzle.board, transform)
+
+    def put(self, puzzle, mode, path):
+        """
+        Stores the moves that solve puzzle in memory and in the file.
+
+        Parameters
+        ----------
+        puzzle : Puzzle
+            puzzle that was solved, at its initial state.
+        mode : str
+            'shift' or 'swap'.
+        path : list[tuple[int]]
+            moves as pairs of flat indices.
+
+        Returns
+        -------
+        None.
+
+        """
+        key, transform = make_key(puzzle, mode)
+        data = _encode(map_moves(path, puzzle.board, transform), puzzle.board)
+        self._remember(key, data)
+        if self._disk is not None:
+            self._disk[_disk_key(key)] = data
+
+    def _remember(self, key, data):
+        """
+        Adds a solution to the memory tier, dropping the least recently used
+        one if it's full.
+
+        Parameters
+        ----------
+        key : tuple
+            key from make_key().
+        data : bytes
+            moves packed by _encode().
+
+        Returns
+        -------
+        None.
+
+        """
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def counters(self):
+        """
+        Gets the hit and miss counters, e.g. for display.
+
+        Returns
+        -------
+        dict[str] -> int
+            Returns the hits, disk_hits, misses and number of solutions held
+            in memory.
+
+        """
+        return {"hits": self.hits, "disk_hits": self.disk_hits,
+                "misses": self.misses, "size": len(self._memory)}
+
+    def close(self):
+        """
+        Closes the file, if the cache has one. The memory tier stays usable.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+def make_key(puzzle, mode):
+    """
+    Builds the cache key of a puzzle from its mode, size, completed puzzle and
+    canonical packed state.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        puzzle at its initial state.
+    mode : str
+        'shift' or 'swap'.
+
+    Returns
+    -------
+    tuple, int
+        Returns (mode, rows, cols, completed packed state, canonical packed
+        state) and the transform that maps the puzzle onto its canonical state.
+
+    """
+    board = puzzle.board
+    state, transform = puzzle.get_canonical_state()
+    return (mode, board.rows, board.cols, puzzle.correct_packed, state), transform
+
+def _disk_key(key):
+    """
+    Converts a key from make_key() into the string key used by the file.
+
+    Parameters
+    ----------
+    key : tuple
+        key from make_key().
+
+    Returns
+    -------
+    str
+        Returns the key as text, e.g. shift/3x3/<goal>/<state> in hex.
+
+    """
+    mode, rows, cols, goal, state = key
+    return f"{mode}/{rows}x{cols}/{goal:x}/{state:x}"
+
+def _encode(path, board):
+    """
+    Packs moves into 1 byte per flat index on boards up to 256 tiles and 2
+    bytes on larger ones, like solution.MoveList. The size is part of every
+    key, so entries are always read back with the width they were written
+    with.
+
+    Parameters
+    ----------
+    path : list[tuple[int]]
+        moves as pairs of flat indices.
+    board : Board
+        board of the puzzle.
+
+    Returns
+    -------
+    bytes
+        Returns the packed moves.
+
+    """
+    typecode = "B" if board.size <= 256 else "H"
+    return array(typecode, [idx for move in path for idx in move]).tobytes()
+
+def _decode(data, board):
+    """
+    Unpacks moves packed by _encode().
+
+    Parameters
+    ----------
+    data : bytes
+        packed moves.
+    board : Board
+        board of the puzzle.
+
+    Returns
+    -------
+    list[tuple[int]]
+        Returns the moves as pairs of flat indices.
+
+    """
+    cells = array("B" if board.size <= 256 else "H")
+    cells.frombytes(data)
+    return list(zip(cells[::2], cells[1::2]))
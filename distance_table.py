@@ -0,0 +1,405 @@
+"""
+Distance table is the module that stores the optimal number of moves for every
+3x3 shifting puzzle state. The table is built once with a breadth first search
+going backwards from the completed puzzle and written to a binary file that
+holds 1 byte per permutation of the 9 tiles, indexed by the permutation's rank
+(see ranking). Later runs memory map the file, so processes sharing it pay
+almost nothing to load it and every lookup is constant time.
+
+Each byte holds the distance of the state in the low 5 bits and the direction
+0 should move to get 1 step closer to the completed puzzle in the next 2 bits.
+States that can't be solved hold UNSOLVABLE.
+
+Besides the table for the standard completed puzzle, there is one for each
+other cell 0 can end in, with 1 to 8 in order around it. Any 2 states can be
+compared through them: relabelling the tiles so the end state becomes the
+completed puzzle with 0 in the same cell, and relabelling the start state the
+same way, keeps every move between them the same. So the distance is 1 lookup
+and the path 1 lookup per move, without a search.
+
+Usage
+-----
+Call table_shift() with a 3x3 puzzle to get it back with an optimal solution
+stored inside. Call query() with 2 states to get the distance and moves
+between them. Tables are built on first use if their file doesn't exist yet,
+or ahead of time by running this module directly.
+
+Methods
+-------
+build_table(str path, int blank) -> none:
+    runs the backwards search and writes the table to path.
+load_table(str path) -> mmap.mmap:
+    memory maps the table stored at path.
+get_table(str path, int blank) -> mmap.mmap:
+    returns the table at path, building it first if needed.
+table_path(int blank, str directory) -> str:
+    returns the location of the table for a cell of 0.
+table_shift(Puzzle puzzle, SearchStats stats) -> Puzzle:
+    solves the shifting puzzle by following the best moves in the table.
+query(Puzzle start, Puzzle end, str directory, bool with_path)
+        -> int, list[tuple[int]]:
+    returns the fewest moves between 2 states and the moves themselves.
+_get_blank_goal(int blank) -> Goal:
+    returns the completed puzzle with 0 at a cell.
+_relabel(Puzzle start, Puzzle end, str directory) -> mmap.mmap, int:
+    returns the table and relabelled start state that answer a query.
+_follow(mmap.mmap table, int packed, SearchStats stats) -> list[tuple[int]]:
+    returns the moves stored in the table from a state.
+
+Globals
+-------
+TABLE_DIR : str
+    default directory of the table files.
+TABLE_PATH : str
+    default location of the table file for the standard completed puzzle.
+TABLE_SIZE : int
+    number of entries in the table, one per permutation of 9 tiles.
+UNSOLVABLE : int
+    value stored for states that can't be solved.
+DIST_MASK : int
+    mask used to read the distance out of a table entry.
+DIR_SHIFT : int
+    bit position of the best move direction in a table entry.
+"""
+
+import mmap
+import os
+from collections import deque
+from board import get_board
+from goal import get_goal
+from puzzle import Puzzle
+from ranking import rank
+from stats import SearchStats
+
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables")
+TABLE_PATH = os.path.join(TABLE_DIR, "shift_3x3.bin")
+TABLE_SIZE = 362880
+UNSOLVABLE = 0xFF
+DIST_MASK = 0x1F
+DIR_SHIFT = 5
+
+#north, south, east, west: same order as board.Board.neighbours
+_DIRECTIONS = ((-1, 0), (1, 0), (0, 1), (0, -1))
+#_OPPOSITE[d] is the direction that undoes a move in direction d
+_OPPOSITE = (1, 0, 3, 2)
+_BOARD = get_board(3, 3)
+#cell of 0 in the standard completed puzzle
+_STANDARD_BLANK = 8
+
+_tables = {}
+
+def _neighbours(idx):
+    """
+    Finds the flat indices next to a flat index in a 3x3 puzzle.
+
+    Parameters
+    ----------
+    idx : int
+        flat index (row * 3 + column) of a tile.
+
+    Returns
+    -------
+    list[tuple[int]]
+        returns a list of (direction, flat index) pairs.
+    """
+    row, col = divmod(idx, 3)
+    neighbours = []
+    for direction, (d_row, d_col) in enumerate(_DIRECTIONS):
+        if 0 <= row + d_row < 3 and 0 <= col + d_col < 3:
+            neighbours.append((direction, (row + d_row) * 3 + col + d_col))
+    return neighbours
+
+_NEIGHBOURS = [_neighbours(idx) for idx in range(9)]
+
+def _get_blank_goal(blank):
+    """
+    Gets the completed puzzle a table is built from, 1 to 8 in order with 0 at
+    the cell blank, e.g. the standard one for cell 8.
+
+    Parameters
+    ----------
+    blank : int
+        flat index of 0.
+
+    Returns
+    -------
+    Goal
+        returns the shared goal.
+    """
+    tiles = list(range(1, 9))
+    tiles.insert(blank, 0)
+    return get_goal(3, 3, tiles)
+
+def table_path(blank, directory=TABLE_DIR):
+    """
+    Gets the location of the table whose completed puzzle has 0 at the cell
+    blank. The standard one keeps the name TABLE_PATH uses.
+
+    Parameters
+    ----------
+    blank : int
+        flat index of 0 in the completed puzzle.
+    directory : str
+        directory of the table files.
+
+    Returns
+    -------
+    str
+        returns the location of the table file.
+    """
+    if blank == _STANDARD_BLANK:
+        return os.path.join(directory, "shift_3x3.bin")
+    return os.path.join(directory, f"shift_3x3_blank{blank}.bin")
+
+def build_table(path=TABLE_PATH, blank=_STANDARD_BLANK):
+    """
+    Runs a breadth first search backwards from the completed puzzle, recording
+    the distance of every reachable state and the direction 0 moves to undo
+    the move that reached it, then writes the table to path.
+
+    Parameters
+    ----------
+    path : str
+        location to write the table file to.
+    blank : int
+        flat index of 0 in the completed puzzle, see _get_blank_goal().
+
+    Returns
+    -------
+    None.
+
+    """
+    table = bytearray([UNSOLVABLE]) * TABLE_SIZE
+    goal = _get_blank_goal(blank).packed
+    table[rank(goal, _BOARD)] = 0
+    queue = deque([(goal, Puzzle.packed_zero_pos(goal), 0)])
+    while queue:
+        packed, zero_idx, dist = queue.popleft()
+        for direction, move_idx in _NEIGHBOURS[zero_idx]:
+            new_packed = Puzzle.packed_swap(packed, zero_idx, move_idx)
+            idx = rank(new_packed, _BOARD)
+            if table[idx] != UNSOLVABLE:
+                continue
+            table[idx] = (dist + 1) | (_OPPOSITE[direction] << DIR_SHIFT)
+            queue.append((new_packed, move_idx, dist + 1))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    #write to a temp file first so readers never map a partial table
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as table_file:
+        table_file.write(table)
+    os.replace(tmp_path, path)
+
+def load_table(path=TABLE_PATH):
+    """
+    Memory maps the table stored at path read only.
+
+    Parameters
+    ----------
+    path : str
+        location of the table file.
+
+    Returns
+    -------
+    mmap.mmap
+        returns the mapped table.
+    """
+    with open(path, "rb") as table_file:
+        table = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(table) != TABLE_SIZE:
+        table.close()
+        raise ValueError(f"{path} is not a 3x3 distance table.")
+    return table
+
+def get_table(path=TABLE_PATH, blank=_STANDARD_BLANK):
+    """
+    Gets the table at path, building it first if the file doesn't exist. Tables
+    are mapped once per process.
+
+    Parameters
+    ----------
+    path : str
+        location of the table file.
+    blank : int
+        flat index of 0 in the completed puzzle of the table, used if it has
+        to be built.
+
+    Returns
+    -------
+    mmap.mmap
+        returns the mapped table.
+    """
+    if path not in _tables:
+        if not os.path.exists(path):
+            build_table(path, blank)
+        _tables[path] = load_table(path)
+    return _tables[path]
+
+def table_shift(puzzle, stats=None, progress=None, limits=None, path=TABLE_PATH): # pylint: disable=unused-argument
+    """
+    Solves the shifting puzzle by following the best move stored in the table
+    from each state, taking one lookup per move of the optimal solution.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        initial puzzle configuration to solve.
+    stats : SearchStats
+        counters to fill in, optional. Every state looked up counts as
+        expanded.
+    progress : ProgressReporter
+        unused, accepted so the function matches the other shift engines.
+    limits : SearchLimits
+        unused, the table answers in at most 32 lookups.
+    path : str
+        location of the table file.
+
+    Returns
+    -------
+    Puzzle
+        Returns puzzle with moves/solution state attributes filled, or None if
+        the puzzle can't be solved.
+
+    Raises
+    ------
+    ValueError
+        if the puzzle isn't 3x3.
+
+    """
+    if puzzle.goal is not get_goal(3, 3):
+        raise ValueError("The table engine only solves 3x3 puzzles with the standard goal.")
+    if stats is None:
+        stats = SearchStats()
+    moves = _follow(get_table(path), puzzle.get_packed_state(), stats)
+    if moves is None:
+        return None
+    for zero_idx, move_idx in moves:
+        puzzle.moves.append_flat(zero_idx, move_idx)
+    return puzzle
+
+def query(start, end, directory=TABLE_DIR, with_path=True):
+    """
+    Finds the fewest moves between 2 3x3 states and the moves themselves,
+    answered from the table of the cell 0 ends in after relabelling both
+    states (see the module docstring). The distance takes 1 lookup and the
+    path 1 more per move.
+
+    Parameters
+    ----------
+    start : Puzzle or list[int]
+        state the moves start from, a Puzzle or anything Puzzle() takes.
+    end : Puzzle or list[int]
+        state the moves end in.
+    directory : str
+        directory of the table files, built there if missing.
+    with_path : boolean
+        also follow the table for the moves if True.
+
+    Raises
+    ------
+    ValueError
+        if either state isn't 3x3.
+
+    Returns
+    -------
+    int, list[tuple[int]]
+        Returns the number of moves and the moves as pairs of flat indices
+        (None if with_path is False), or None if end can't be reached from
+        start.
+
+    """
+    table, packed = _relabel(start, end, directory)
+    if not with_path:
+        entry = table[rank(packed, _BOARD)]
+        return None if entry == UNSOLVABLE else (entry & DIST_MASK, None)
+    path = _follow(table, packed)
+    return None if path is None else (len(path), path)
+
+def _relabel(start, end, directory):
+    """
+    Relabels the tiles so end becomes the completed puzzle with 0 in the same
+    cell and applies the same relabelling to start. Moves swap cells, not
+    labels, so the moves from the relabelled start to that completed puzzle
+    are the moves from start to end.
+
+    Parameters
+    ----------
+    start : Puzzle or list[int]
+        state the moves start from.
+    end : Puzzle or list[int]
+        state the moves end in.
+    directory : str
+        directory of the table files.
+
+    Raises
+    ------
+    ValueError
+        if either state isn't 3x3.
+
+    Returns
+    -------
+    mmap.mmap, int
+        returns the table for the cell 0 ends in and the relabelled packed
+        start state.
+    """
+    tiles = []
+    for state in (start, end):
+        if not isinstance(state, Puzzle):
+            state = Puzzle(state)
+        if state.board is not _BOARD:
+            raise ValueError("Distance queries only compare 3x3 puzzles.")
+        tiles.append(_BOARD.unpack_tiles(state.get_packed_state()))
+    start_tiles, end_tiles = tiles
+    blank = end_tiles.index(0)
+    #give each tile of end the label of the tile in its cell of the goal
+    labels = [0] * _BOARD.size
+    for tile, goal_tile in zip(end_tiles, _get_blank_goal(blank).tiles):
+        labels[tile] = goal_tile
+    packed = _BOARD.pack_tiles([labels[tile] for tile in start_tiles])
+    return get_table(table_path(blank, directory), blank), packed
+
+def _follow(table, packed, stats=None):
+    """
+    Follows the best move stored in the table from packed to the completed
+    puzzle of the table.
+
+    Parameters
+    ----------
+    table : mmap.mmap
+        distance table.
+    packed : int
+        packed state to start from.
+    stats : SearchStats
+        counters to fill in, optional. Every state looked up counts as
+        expanded.
+
+    Returns
+    -------
+    list[tuple[int]]
+        Returns the moves as pairs of flat indices, or None if the completed
+        puzzle can't be reached.
+    """
+    if stats is None:
+        stats = SearchStats()
+    entry = table[rank(packed, _BOARD)]
+    stats.expanded += 1
+    if entry == UNSOLVABLE:
+        return None
+
+    path = []
+    zero_idx = Puzzle.packed_zero_pos(packed)
+    while entry & DIST_MASK:
+        d_row, d_col = _DIRECTIONS[entry >> DIR_SHIFT]
+        move_idx = zero_idx + d_row * 3 + d_col
+        path.append((zero_idx, move_idx))
+        packed = Puzzle.packed_swap(packed, zero_idx, move_idx)
+        zero_idx = move_idx
+        entry = table[rank(packed, _BOARD)]
+        stats.expanded += 1
+        stats.generated += 1
+    return path
+
+if __name__ == "__main__":
+    for cell in range(9):
+        build_table(table_path(cell), cell)
+    print(f"Tables written to {TABLE_DIR}.")
@@ -0,0 +1,237 @@
+"""
+Goal is the module that holds the completed puzzle a search is heading for. A
+Goal is built once per size and layout and shared by every puzzle and search
+node aiming for it, with where each tile belongs and how far each tile is
+from there from every cell precomputed, so heuristics for any goal are table
+lookups.
+
+Besides any layout of the tiles, named layouts can be picked from
+GOAL_LAYOUTS:
+    standard: 1 to n - 1 row by row with 0 last, e.g. 123/456/780.
+    blank-first: 0 first then 1 to n - 1, e.g. 012/345/678.
+    snake: 1 to n - 1 going back and forth along the rows with 0 at the end
+        of the snake, e.g. 123/654/780.
+
+Usage
+-----
+Call get_goal(rows, cols, layout) with a layout name or a list of tiles to get
+the shared goal. Puzzle takes the same layout with goal=.
+
+Classes:
+    Goal:
+        Constructor:
+            Goal(Board board, tuple[int] tiles, str name)
+
+        Attributes:
+            board : Board
+            name : str
+            tiles : tuple[int]
+            packed : int
+            puzzle : list[list[int]]
+            cells : list[int]
+            coords : list[list[int]]
+            distances : list[list[int]]
+
+Methods
+-------
+get_goal(int rows, int cols, str layout) -> Goal:
+    returns the shared goal for a size and layout.
+_build_goal(int rows, int cols, str name, tuple[int] tiles) -> Goal:
+    builds the goal once per size and layout.
+_standard(int size, int cols) -> list[int]:
+    returns the tiles of the standard layout.
+_blank_first(int size, int cols) -> list[int]:
+    returns the tiles of the blank-first layout.
+_snake(int size, int cols) -> list[int]:
+    returns the tiles of the snake layout.
+
+Globals
+-------
+DEFAULT_GOAL : str
+    name of the layout used when none is given.
+GOAL_LAYOUTS : dict[str] -> function
+    maps layout names to the functions listing their tiles.
+"""
+
+from functools import lru_cache
+from board import get_board
+
+DEFAULT_GOAL = "standard"
+
+class Goal:
+    """
+    The Goal class holds the tables for one completed puzzle. Goals are
+    treated as immutable and shared, so get_goal() should be used instead of
+    building them directly.
+
+    Attributes
+    ----------
+    board : Board
+        shared tables for the size of the puzzle.
+    name : str
+        name of the layout in GOAL_LAYOUTS, None for other layouts.
+    tiles : tuple[int]
+        tiles of the completed puzzle in flat index order.
+    packed : int
+        packed form of the completed puzzle.
+    puzzle : list[list[int]]
+        2d form of the completed puzzle, not to be modified.
+    cells : list[int]
+        flat index each tile sits at in the completed puzzle.
+    coords : list[list[int]]
+        x,y coordinate each tile sits at in the completed puzzle.
+    distances : list[list[int]]
+        distances[cell][tile] is the manhattan distance from cell to where
+        tile belongs.
+    """
+
+    def __init__(self, board, tiles, name=None):
+        self.board = board
+        self.name = name
+        self.tiles = tiles
+        self.packed = board.pack_tiles(tiles)
+        self.puzzle = [list(tiles[row * board.cols:(row + 1) * board.cols])
+                       for row in range(board.rows)]
+        self.cells = [0] * board.size
+        for idx, tile in enumerate(tiles):
+            self.cells[tile] = idx
+        self.coords = [board.coords[cell] for cell in self.cells]
+        self.distances = [[board.distances[cell][self.cells[tile]] for tile in range(board.size)]
+                          for cell in range(board.size)]
+
+    def __repr__(self):
+        return f"Goal({self.board.rows}x{self.board.cols}, {self.name or list(self.tiles)})"
+
+def get_goal(rows, cols, layout=DEFAULT_GOAL):
+    """
+    Gets the shared goal for a size and layout.
+
+    Parameters
+    ----------
+    rows : int
+        rows of the puzzle.
+    cols : int
+        columns of the puzzle.
+    layout : str or list[int]
+        name of a layout in GOAL_LAYOUTS, or the tiles of the completed puzzle
+        in flat index order.
+
+    Raises
+    ------
+    ValueError
+        if the layout isn't a known name or an arrangement of every tile.
+
+    Returns
+    -------
+    Goal
+        Returns the shared goal.
+
+    """
+    size = rows * cols
+    if isinstance(layout, str):
+        if layout not in GOAL_LAYOUTS:
+            raise ValueError(f"Unknown goal {layout}, expected one of "
+                             f"{', '.join(sorted(GOAL_LAYOUTS))}.")
+        return _build_goal(rows, cols, layout, tuple(GOAL_LAYOUTS[layout](size, cols)))
+    tiles = tuple(int(tile) for tile in layout)
+    if sorted(tiles) != list(range(size)):
+        raise ValueError(f"A goal needs the numbers 0-{size - 1} once each.")
+    #named layouts given as tiles share the named goal
+    for name, make_tiles in GOAL_LAYOUTS.items():
+        if tuple(make_tiles(size, cols)) == tiles:
+            return _build_goal(rows, cols, name, tiles)
+    return _build_goal(rows, cols, None, tiles)
+
+@lru_cache(maxsize=None)
+def _build_goal(rows, cols, name, tiles):
+    """
+    Builds the goal for a size and layout the first time it's asked for.
+
+    Parameters
+    ----------
+    rows : int
+        rows of the puzzle.
+    cols : int
+        columns of the puzzle.
+    name : str
+        name of the layout, None if it has none.
+    tiles : tuple[int]
+        tiles of the completed puzzle in flat index order.
+
+    Returns
+    -------
+    Goal
+        Returns the shared goal.
+
+    """
+    return Goal(get_board(rows, cols), tiles, name)
+
+def _standard(size, cols): # pylint: disable=unused-argument
+    """
+    Lists the tiles of the standard layout, 1 to n - 1 then 0.
+
+    Parameters
+    ----------
+    size : int
+        number of tiles.
+    cols : int
+        columns of the puzzle.
+
+    Returns
+    -------
+    list[int]
+        Returns the tiles in flat index order.
+
+    """
+    return list(range(1, size)) + [0]
+
+def _blank_first(size, cols): # pylint: disable=unused-argument
+    """
+    Lists the tiles of the blank-first layout, 0 then 1 to n - 1.
+
+    Parameters
+    ----------
+    size : int
+        number of tiles.
+    cols : int
+        columns of the puzzle.
+
+    Returns
+    -------
+    list[int]
+        Returns the tiles in flat index order.
+
+    """
+    return list(range(size))
+
+def _snake(size, cols):
+    """
+    Lists the tiles of the snake layout, 1 to n - 1 left to right along the
+    first row, right to left along the second and so on, with 0 at the end of
+    the snake.
+
+    Parameters
+    ----------
+    size : int
+        number of tiles.
+    cols : int
+        columns of the puzzle.
+
+    Returns
+    -------
+    list[int]
+        Returns the tiles in flat index order.
+
+    """
+    order = _standard(size, cols)
+    tiles = []
+    for start in range(0, size, cols):
+        row = order[start:start + cols]
+        tiles += row if start // cols % 2 == 0 else row[::-1]
+    return tiles
+
+GOAL_LAYOUTS = {
+    "standard": _standard,
+    "blank-first": _blank_first,
+    "snake": _snake,
+}
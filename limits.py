@@ -0,0 +1,165 @@
+"""
+Limits is the module that lets a running search be stopped. Engines take an
+optional SearchLimits and check it as they expand states. Once the cancel
+token is set, the deadline has passed or the expansion budget is used up, the
+check raises SearchAborted, which heuristic.solve() turns into an aborted
+result holding the statistics gathered so far.
+
+Usage
+-----
+Create a CancelToken to stop a search from another thread and a SearchLimits
+holding it and/or a timeout and expansion budget, then pass the limits to
+heuristic.solve() or an engine with limits=. Call cancel() on the token to
+stop the search.
+
+Classes:
+    CancelToken:
+        Constructor:
+            CancelToken()
+
+        Methods:
+            cancel() -> none
+            is_cancelled() -> bool
+
+    SearchLimits:
+        Constructor:
+            SearchLimits(float timeout, int max_expanded, CancelToken token)
+
+        Attributes:
+            deadline : float
+            max_expanded : int
+            token : CancelToken
+
+        Methods:
+            check(SearchStats) -> none
+
+    SearchAborted:
+        Constructor:
+            SearchAborted(str reason)
+
+        Attributes:
+            reason : str
+
+Globals
+-------
+CANCELLED : str
+    reason given when the token was cancelled.
+TIMED_OUT : str
+    reason given when the deadline passed.
+OUT_OF_EXPANSIONS : str
+    reason given when the expansion budget was used up.
+"""
+
+import threading
+from time import perf_counter
+
+CANCELLED = "cancelled"
+TIMED_OUT = "timed out"
+OUT_OF_EXPANSIONS = "expansion limit reached"
+
+class SearchAborted(Exception):
+    """
+    Raised by SearchLimits.check() to stop a search.
+
+    Attributes
+    ----------
+    reason : str
+        CANCELLED, TIMED_OUT or OUT_OF_EXPANSIONS.
+    """
+
+    def __init__(self, reason):
+        Exception.__init__(self, reason)
+        self.reason = reason
+
+class CancelToken:
+    """
+    The CancelToken class is a flag one thread sets to stop a search running on
+    another.
+
+    Methods
+    -------
+    cancel() -> none:
+        asks the search to stop.
+    is_cancelled() -> bool:
+        returns True once cancel() has been called.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """
+        Asks the search holding this token to stop at its next check.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._event.set()
+
+    def is_cancelled(self):
+        """
+        Checks if cancel() has been called.
+
+        Returns
+        -------
+        bool
+            Returns True if the search should stop.
+
+        """
+        return self._event.is_set()
+
+class SearchLimits:
+    """
+    The SearchLimits class holds everything that can stop a search. Any of
+    them can be left out. The deadline is counted from when the limits are
+    created.
+
+    Attributes
+    ----------
+    deadline : float
+        perf_counter() time the search must stop by, None for no deadline.
+    max_expanded : int
+        most states the search may expand, None for no budget.
+    token : CancelToken
+        token that stops the search when cancelled, optional.
+
+    Methods
+    -------
+    check(SearchStats stats) -> none:
+        raises SearchAborted if the search has to stop.
+    """
+
+    def __init__(self, timeout=None, max_expanded=None, token=None):
+        self.deadline = None if timeout is None else perf_counter() + timeout
+        self.max_expanded = max_expanded
+        self.token = token
+
+    def check(self, stats):
+        """
+        Checks the limits against a running search. Engines call this as they
+        expand states.
+
+        Parameters
+        ----------
+        stats : SearchStats
+            record of the running search.
+
+        Raises
+        ------
+        SearchAborted
+            if the token was cancelled, the deadline passed or the expansion
+            budget is used up.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.token is not None and self.token.is_cancelled():
+            raise SearchAborted(CANCELLED)
+        if self.max_expanded is not None and stats.expanded >= self.max_expanded:
+            raise SearchAborted(OUT_OF_EXPANSIONS)
+        if self.deadline is not None and perf_counter() >= self.deadline:
+            raise SearchAborted(TIMED_OUT)
@@ -8,14 +8,19 @@ This 1 input needs to be an input of 0-8 non-repeating.
     An input of 012345678 or 81427653 will work as they have all the numbers from
     zero to eight, while 012345670 or 81234543 will not as they have duplicate
     numbers.
+
+Other sizes are input with commas between the numbers and --size, e.g.
+1,2,3,4,5,6,7,8,9,10,11,12,13,14,0,15 --size 4x4. Square sizes can leave out
+--size.
 """
 
 import sys
 import console
-from puzzle_gui import ShiftingPuzzleGUI
 
 if __name__ == "__main__":
     if len(sys.argv) == 1:
+        #imported here so command line runs don't load tkinter
+        from puzzle_gui import ShiftingPuzzleGUI # pylint: disable=import-outside-toplevel
         gui = ShiftingPuzzleGUI()
         gui.title("Shifting Puzzle Solver")
         gui.eval('tk::PlaceWindow . center')
@@ -0,0 +1,501 @@
+"""
+Parallel is the module that solves the shifting puzzle with hash distributed
+A* (HDA*) on several worker processes, so a single search can use every core
+instead of the one the GIL allows. Every state is owned by the worker its hash
+picks. Each worker keeps the open and closed lists of the states it owns,
+expands its best nodes and sends the children it doesn't own to their owners
+in batches, one message per owner after every round of expansions. Incoming
+children are deduplicated by their owner and their heuristic is evaluated in
+one call to vectorized.batch_shift_heuristic.
+
+The first solution found only bounds the search. The coordinating process
+passes the best bound to every worker, which drop nodes that can't beat it,
+and the search ends once every worker is idle and every batch sent has been
+received, confirmed by a second round of counts. The solution is then optimal
+and its moves are rebuilt by asking the owner of each state for its parent.
+
+Usage
+-----
+Call hda_shift() with a puzzle, or heuristic.solve() with engine='hda'. The
+workers option picks the number of worker processes. Worth it for 4x4 and
+larger puzzles, smaller ones are solved before the workers have started.
+
+Methods
+-------
+hda_shift(Puzzle puzzle, SearchStats stats, ProgressReporter progress,
+          SearchLimits limits, int workers, int batch_size) -> Puzzle:
+    solves the shifting puzzle with HDA*. returns a puzzle with the optimal
+    steps stored inside.
+_stop(list inboxes, multiprocessing.Queue results, list processes,
+      list worker_stats) -> none:
+    stops the worker processes and collects their records.
+_owner(int state, int workers) -> int:
+    returns the worker that owns a state.
+_worker(int wid, int workers, int rows, int cols, tuple[int] tiles, list inboxes,
+        multiprocessing.Queue results, int batch_size) -> none:
+    runs the search of one worker process.
+_next_message(multiprocessing.Queue inbox) -> tuple:
+    returns the next message in an inbox, None if it's empty.
+_add_nodes(dict seen, list heap, list nodes, Goal goal, float bound,
+           SearchStats stats, itertools.count tie) -> none:
+    adds new nodes to a worker's open list.
+_is_quiet(dict status) -> bool:
+    returns True if every worker reported idle and no batch looks in flight.
+_total(SearchStats stats, list[SearchStats] worker_stats) -> none:
+    sets the counters of stats to the totals of the workers.
+_get_path(list inboxes, multiprocessing.Queue results, int initial,
+          int goal) -> list[tuple[int]]:
+    asks the workers for the moves leading to the completed state.
+
+Globals
+-------
+POLL_SECONDS : float
+    longest the coordinating process waits for a message before checking the
+    limits again.
+REPORT_ROUNDS : int
+    rounds of expansions between the statistics a busy worker reports.
+STOP_SECONDS : float
+    longest wait for a worker to stop before it's terminated.
+"""
+
+import heapq
+import os
+import queue
+from copy import copy
+from itertools import count
+from time import perf_counter
+from goal import get_goal
+from stats import SearchStats
+from vectorized import batch_shift_heuristic
+
+POLL_SECONDS = 0.05
+REPORT_ROUNDS = 16
+STOP_SECONDS = 1.0
+
+def hda_shift(puzzle, stats=None, progress=None, limits=None, workers=None, batch_size=64): # pylint: disable=too-many-arguments
+    """
+    Solves the shifting puzzle with hash distributed A* on worker processes,
+    see the module docstring. The counters of stats are the totals of the
+    workers, which are also kept one record per worker in stats.workers.
+    Limits are checked by the coordinating process between messages, so a
+    search can run a little past its expansion budget.
+
+    Parameters
+    ----------
+    puzzle : Puzzle
+        initial puzzle configuration to begin searching.
+    stats : SearchStats
+        counters to fill in while searching, optional.
+    progress : ProgressReporter
+        reporter updated as the workers report, optional.
+    limits : SearchLimits
+        limits checked as the workers report, optional.
+    workers : int
+        number of worker processes, defaults to the number of cores.
+    batch_size : int
+        nodes each worker expands between exchanges.
+
+    Returns
+    -------
+    Puzzle
+        Returns puzzle with moves/solution state attributes filled, or None if
+        the puzzle can't be solved.
+
+    """
+    #base case
+    if puzzle.puzzle_check() is True:
+        return puzzle
+    if not puzzle.is_solvable():
+        return None
+
+    #imported here so the console starts without it
+    import multiprocessing # pylint: disable=import-outside-toplevel
+
+    if stats is None:
+        stats = SearchStats()
+    workers = workers or os.cpu_count() or 1
+    board = puzzle.board
+    initial = puzzle.get_packed_state()
+    inboxes = [multiprocessing.Queue() for _ in range(workers)]
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(
+        target=_worker,
+        args=(wid, workers, board.rows, board.cols, puzzle.goal.tiles,
+              inboxes, results, batch_size),
+        daemon=True) for wid in range(workers)]
+    for process in processes:
+        process.start()
+
+    #latest (idle, sent, received) of every worker
+    status = {wid: (False, 0, 0) for wid in range(workers)}
+    worker_stats = [SearchStats() for _ in range(workers)]
+    bound = float('inf')
+    #counts being confirmed by the current round of probes and the replies
+    probe, snapshot, replies = 0, None, {}
+    try:
+        inboxes[_owner(initial, workers)].put(("nodes", [(initial, 0, None, None)]))
+        while True:
+            try:
+                message = results.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                message = ("idle",)
+            if message[0] == "solution" and message[1] < bound:
+                bound = message[1]
+                for inbox in inboxes:
+                    inbox.put(("bound", bound))
+            elif message[0] == "status":
+                _, wid, idle, sent, received, record = message
+                status[wid] = (idle, sent, received)
+                worker_stats[wid] = record
+                _total(stats, worker_stats)
+                if progress is not None:
+                    progress.update(stats)
+            elif message[0] == "probe" and message[2] == probe:
+                replies[message[1]] = message[3:]
+                if len(replies) == workers:
+                    if replies == snapshot:
+                        break
+                    snapshot = None
+            if snapshot is None and _is_quiet(status):
+                #probes are answered after everything already in an inbox, so
+                #the same counts from idle workers mean nothing was in flight
+                probe, snapshot, replies = probe + 1, dict(status), {}
+                for inbox in inboxes:
+                    inbox.put(("probe", probe))
+            if limits is not None:
+                limits.check(stats)
+
+        if bound == float('inf'):
+            return None
+        start_time = perf_counter()
+        for idx1, idx2 in _get_path(inboxes, results, initial, puzzle.correct_packed):
+            puzzle.moves.append_flat(idx1, idx2)
+        stats.reconstruct_time += perf_counter() - start_time
+        return puzzle
+    finally:
+        _stop(inboxes, results, processes, worker_stats)
+        _total(stats, worker_stats)
+        stats.workers = worker_stats
+
+def _stop(inboxes, results, processes, worker_stats):
+    """
+    Stops the worker processes, collecting their final records. Messages
+    still on results are read while waiting, since a worker can't exit before
+    everything it put there has been taken. Workers that don't stop in time
+    are terminated.
+
+    Parameters
+    ----------
+    inboxes : list[multiprocessing.Queue]
+        inbox of every worker.
+    results : multiprocessing.Queue
+        queue read by the coordinating process.
+    processes : list[multiprocessing.Process]
+        the worker processes.
+    worker_stats : list[SearchStats]
+        latest record of every worker, replaced by the final ones.
+
+    Returns
+    -------
+    None.
+
+    """
+    for inbox in inboxes:
+        inbox.put(("stop",))
+    stopped = 0
+    while stopped < len(processes):
+        try:
+            message = results.get(timeout=STOP_SECONDS)
+        except queue.Empty:
+            break
+        if message[0] == "stopped":
+            worker_stats[message[1]] = message[2]
+            stopped += 1
+    for process in processes:
+        process.join(timeout=STOP_SECONDS)
+        if process.is_alive():
+            process.terminate()
+
+def _owner(state, workers):
+    """
+    Picks the worker that owns a state. The tiles at the start of a packed
+    state vary the least, so the state is hashed as a tuple to mix every bit
+    in. Int hashes aren't randomized, so every process agrees on the owner.
+
+    Parameters
+    ----------
+    state : int
+        packed puzzle state.
+    workers : int
+        number of worker processes.
+
+    Returns
+    -------
+    int
+        Returns the index of the owning worker.
+
+    """
+    return hash((state,)) % workers
+
+def _worker(wid, workers, rows, cols, tiles, inboxes, results, batch_size): # pylint: disable=too-many-arguments, too-many-locals, too-many-branches, too-many-statements
+    """
+    Runs the search of one worker process until it's told to stop. A busy
+    worker expands up to batch_size of its best nodes, sends the children
+    owned by other workers off in one batch per owner and then takes the
+    messages waiting in its inbox. It's idle when it has no node that could
+    beat the bound, then it blocks on its inbox instead. The coordinating
+    process is told whenever the worker turns busy, turns idle or its counts
+    change while idle.
+
+    Messages in its inbox are ("nodes", list of (state, moves, parent, move)),
+    ("bound", moves), ("probe", round), ("parent", state) and ("stop",).
+    Messages it puts on results are ("solution", moves), ("status", wid, idle,
+    sent, received, SearchStats), ("probe", wid, round, idle, sent, received),
+    ("parent", parent, move) and ("stopped", wid, SearchStats).
+
+    Parameters
+    ----------
+    wid : int
+        index of this worker.
+    workers : int
+        number of worker processes.
+    rows : int
+        rows of the puzzle.
+    cols : int
+        columns of the puzzle.
+    tiles : tuple[int]
+        tiles of the completed puzzle.
+    inboxes : list[multiprocessing.Queue]
+        inbox of every worker.
+    results : multiprocessing.Queue
+        queue read by the coordinating process.
+    batch_size : int
+        nodes expanded between exchanges.
+
+    Returns
+    -------
+    None.
+
+    """
+    goal = get_goal(rows, cols, tiles)
+    board = goal.board
+    stats = SearchStats()
+    tie = count()
+    #state -> (moves, parent state, move) of every state owned and seen
+    seen = {}
+    heap = []
+    outboxes = [[] for _ in range(workers)]
+    bound = float('inf')
+    sent = received = rounds = 0
+    #counts of the last idle status, None while busy
+    reported = None
+    while True:
+        idle = not heap or heap[0][0] >= bound
+        if idle and reported != (sent, received):
+            reported = (sent, received)
+            results.put(("status", wid, True, sent, received, copy(stats)))
+        elif not idle and reported is not None:
+            reported = None
+            results.put(("status", wid, False, sent, received, copy(stats)))
+
+        if idle:
+            message = inboxes[wid].get()
+        else:
+            local = []
+            for _ in range(batch_size):
+                if not heap or heap[0][0] >= bound:
+                    break
+                _, _, g_cost, state = heapq.heappop(heap)
+                if g_cost > seen[state][0]:
+                    continue
+                if state == goal.packed:
+                    bound = g_cost
+                    results.put(("solution", g_cost))
+                    continue
+                stats.expanded += 1
+                parent = seen[state][1]
+                zero_idx = board.zero_pos(state)
+                for move_idx in board.neighbours[zero_idx]:
+                    new_packed = board.swap(state, zero_idx, move_idx)
+                    stats.generated += 1
+                    #undoing the last move never helps
+                    if new_packed == parent:
+                        stats.deduped += 1
+                        continue
+                    node = (new_packed, g_cost + 1, state, (zero_idx, move_idx))
+                    owner = _owner(new_packed, workers)
+                    if owner == wid:
+                        local.append(node)
+                    else:
+                        outboxes[owner].append(node)
+            _add_nodes(seen, heap, local, goal, bound, stats, tie)
+            for owner, nodes in enumerate(outboxes):
+                if nodes:
+                    inboxes[owner].put(("nodes", nodes))
+                    outboxes[owner] = []
+                    sent += 1
+            stats.record_sizes(len(heap), len(seen))
+            rounds += 1
+            if rounds % REPORT_ROUNDS == 0:
+                results.put(("status", wid, False, sent, received, copy(stats)))
+            message = _next_message(inboxes[wid])
+
+        while message is not None:
+            if message[0] == "nodes":
+                received += 1
+                _add_nodes(seen, heap, message[1], goal, bound, stats, tie)
+            elif message[0] == "bound":
+                bound = min(bound, message[1])
+            elif message[0] == "probe":
+                idle = not heap or heap[0][0] >= bound
+                results.put(("probe", wid, message[1], idle, sent, received))
+            elif message[0] == "parent":
+                _, parent, move = seen[message[1]]
+                results.put(("parent", parent, move))
+            else:
+                #batches left for stopped workers are dropped on exit
+                for inbox in inboxes:
+                    inbox.cancel_join_thread()
+                results.put(("stopped", wid, stats))
+                return
+            message = _next_message(inboxes[wid])
+
+def _next_message(inbox):
+    """
+    Takes the next message from an inbox without waiting.
+
+    Parameters
+    ----------
+    inbox : multiprocessing.Queue
+        inbox of a worker.
+
+    Returns
+    -------
+    tuple
+        Returns the message, None if the inbox is empty.
+
+    """
+    try:
+        return inbox.get_nowait()
+    except queue.Empty:
+        return None
+
+def _add_nodes(seen, heap, nodes, goal, bound, stats, tie): # pylint: disable=too-many-arguments
+    """
+    Adds nodes owned by a worker to its open list, dropping those seen before
+    at the same or fewer moves and those that can't beat the bound.
+
+    Parameters
+    ----------
+    seen : dict[int] -> tuple
+        (moves, parent state, move) of every state the worker has seen.
+    heap : list[tuple]
+        open list of the worker.
+    nodes : list[tuple]
+        (state, moves, parent state, move) of the new nodes.
+    goal : Goal
+        goal of the states.
+    bound : float
+        moves of the best solution found so far.
+    stats : SearchStats
+        counters of the worker.
+    tie : itertools.count
+        breaks ties between nodes with the same f cost.
+
+    Returns
+    -------
+    None.
+
+    """
+    fresh = []
+    for state, g_cost, parent, move in nodes:
+        if seen.get(state, (g_cost + 1,))[0] <= g_cost:
+            stats.deduped += 1
+            continue
+        seen[state] = (g_cost, parent, move)
+        fresh.append((state, g_cost))
+    h_values = batch_shift_heuristic([state for state, _ in fresh], goal)
+    for (state, g_cost), h_value in zip(fresh, h_values):
+        if g_cost + h_value < bound:
+            heapq.heappush(heap, (g_cost + h_value, next(tie), g_cost, state))
+
+def _is_quiet(status):
+    """
+    Checks if the latest status of every worker is idle and the batches sent
+    add up to the batches received. Status messages can be overtaken by
+    batches still in flight, so this only says the search may be over.
+
+    Parameters
+    ----------
+    status : dict[int] -> tuple
+        latest (idle, sent, received) of every worker.
+
+    Returns
+    -------
+    bool
+        Returns True if every worker looks done.
+
+    """
+    if not all(idle for idle, _, _ in status.values()):
+        return False
+    #the coordinating process sent the first batch
+    return 1 + sum(counts[1] for counts in status.values()) == \
+           sum(counts[2] for counts in status.values())
+
+def _total(stats, worker_stats):
+    """
+    Sets the counters of stats to the totals of the workers, keeping the
+    largest frontier and visited sizes of any worker.
+
+    Parameters
+    ----------
+    stats : SearchStats
+        record of the whole search.
+    worker_stats : list[SearchStats]
+        latest record of every worker.
+
+    Returns
+    -------
+    None.
+
+    """
+    stats.expanded = stats.generated = stats.deduped = 0
+    for record in worker_stats:
+        stats.expanded += record.expanded
+        stats.generated += record.generated
+        stats.deduped += record.deduped
+        stats.record_sizes(record.max_frontier, record.max_visited)
+
+def _get_path(inboxes, results, initial, goal):
+    """
+    Rebuilds the moves of the solution by asking the owner of each state on
+    the way back from the completed state for its parent.
+
+    Parameters
+    ----------
+    inboxes : list[multiprocessing.Queue]
+        inbox of every worker.
+    results : multiprocessing.Queue
+        queue read by the coordinating process.
+    initial : int
+        packed initial state.
+    goal : int
+        packed completed puzzle.
+
+    Returns
+    -------
+    list[tuple[int]]
+        Returns the moves as pairs of flat indices.
+
+    """
+    path = []
+    state = goal
+    while state != initial:
+        inboxes[_owner(state, len(inboxes))].put(("parent", state))
+        message = results.get()
+        while message[0] != "parent":
+            message = results.get()
+        _, state, move = message
+        path.append(move)
+    path.reverse()
+    return path
@@ -0,0 +1,114 @@
+"""
+Progress is the module that carries progress from a running search to whoever
+is watching it, e.g. the GUI. Engines take an optional ProgressReporter and
+call update() as they expand states. The reporter only passes a snapshot of
+the search statistics on when enough states have been expanded and enough time
+has passed since the last one, so the search loop only pays for a cheap check
+instead of a callback every state.
+
+Callbacks run on the thread doing the search, so they shouldn't touch tkinter.
+queue_reporter() builds a reporter that puts the snapshots on a thread safe
+queue for another thread to drain.
+
+Usage
+-----
+Create a ProgressReporter with a callback (or queue_reporter() with a queue)
+and pass it to heuristic.solve() or an engine with progress=.
+
+Classes:
+    ProgressReporter:
+        Constructor:
+            ProgressReporter(function callback, int every_nodes, float every_seconds)
+
+        Attributes:
+            callback : function
+            every_nodes : int
+            every_seconds : float
+
+        Methods:
+            update(SearchStats) -> none
+
+Methods
+-------
+queue_reporter(queue.Queue progress_queue, int every_nodes, float every_seconds)
+        -> ProgressReporter:
+    returns a reporter that puts ("progress", snapshot) on progress_queue.
+"""
+
+from time import perf_counter
+
+class ProgressReporter:
+    """
+    The ProgressReporter class throttles the progress a search reports. A
+    snapshot is passed to callback at most once every every_nodes expanded
+    states and every every_seconds seconds, whichever is rarer.
+
+    Attributes
+    ----------
+    callback : function
+        called with SearchStats.as_dict() of the running search.
+    every_nodes : int
+        fewest states expanded between 2 snapshots.
+    every_seconds : float
+        fewest seconds between 2 snapshots.
+
+    Methods
+    -------
+    update(SearchStats stats) -> none:
+        passes a snapshot of stats to callback if it's due.
+    """
+
+    def __init__(self, callback, every_nodes=1000, every_seconds=0.1):
+        self.callback = callback
+        self.every_nodes = every_nodes
+        self.every_seconds = every_seconds
+        self._next_nodes = 0
+        self._next_time = 0.0
+
+    def update(self, stats):
+        """
+        Passes a snapshot of the statistics to callback if every_nodes states
+        have been expanded and every_seconds have passed since the last one.
+        The clock is only read once the node count is due.
+
+        Parameters
+        ----------
+        stats : SearchStats
+            record of the running search.
+
+        Returns
+        -------
+        None.
+
+        """
+        if stats.expanded < self._next_nodes:
+            return
+        self._next_nodes = stats.expanded + self.every_nodes
+        now = perf_counter()
+        if now < self._next_time:
+            return
+        self._next_time = now + self.every_seconds
+        self.callback(stats.as_dict())
+
+def queue_reporter(progress_queue, every_nodes=1000, every_seconds=0.1):
+    """
+    Builds a reporter that puts ("progress", snapshot) tuples on a queue, so a
+    search running on a worker thread can be watched from the tkinter thread.
+
+    Parameters
+    ----------
+    progress_queue : queue.Queue
+        queue the snapshots are put on.
+    every_nodes : int
+        fewest states expanded between 2 snapshots.
+    every_seconds : float
+        fewest seconds between 2 snapshots.
+
+    Returns
+    -------
+    ProgressReporter
+        Returns the reporter.
+
+    """
+    return ProgressReporter(lambda snapshot: progress_queue.put(("progress", snapshot)),
+                            every_nodes, every_seconds)
@@ -5,10 +5,10 @@ the main frame that is viewed is alternated between the other 2 classes, Puzzle
 Frame and Soln Frame.
 
 Puzzle Frame is in control of the view where the user can input their shifting
-puzzle. It consists of 9 buttons representing tiles and 1 button to start the
-algorithm. The algorithm itself is called from within the solve method when the
-solve button is clicked and then it changes the frame to the SolnFrame after
-getting the solution set.
+puzzle. It consists of 1 button per tile (9 for the default 3x3 puzzle, the size
+is picked from a menu) and 1 button to start the algorithm. The algorithm
+itself is called from within the solve method when the solve button is clicked
+and then it changes the frame to the SolnFrame after getting the solution set.
 
 Soln Frame is in control of viewing solution set that shows the optimal path from
 the inputed puzzle frame to a completed puzzle frame. The frame consists of the
@@ -23,11 +23,15 @@ Classes:
 
         Attributes:
             box_size : int
+            cache : SolutionCache
+            rows : int
+            cols : int
             _frame : tkinter.frame
 
         Methods:
             get_puzzle_frame() -> none
-            get_soln_frame(list[list[list[int]]]) -> none
+            get_soln_frame(list[list[list[int]]], SearchStats) -> none
+            set_size(int, int) -> none
 
     PuzzleFrame:
         Constructor:
@@ -37,26 +41,41 @@ Classes:
             _tiles_list : list[tkinter.Button]
             shift_btn : tkinter.Button
             swap_btn : tkinter.Button
+            shift_engine : tkinter.StringVar
+            swap_engine : tkinter.StringVar
+            size : tkinter.StringVar
+            cancel_btn : tkinter.Button
+            _messages : queue.Queue
+            _progress_btn : tkinter.Button
+            _token : CancelToken
 
         Methods:
             _init_tiles() -> none
+            _init_engine_menu(tkinter.StringVar, dict) -> tkinter.OptionMenu
+            _init_size_menu() -> tkinter.OptionMenu
             _init_random_btn() -> tkinter.Button
             _randomize -> none
             _init_solve_btn() -> tkinter.Button
-            _button_increment(tkinter.Button) -> none
+            _button_increment(tkinter.Button, int) -> none
             shift_solve() -> none
             swap_solve() -> none
+            _start_solve(str, str, tkinter.Button) -> none
+            _set_controls(str) -> none
+            _cancel() -> none
+            _solve_worker(Puzzle, str, str, SearchLimits) -> none
+            _poll() -> none
             _get_tiles() -> list[str]
 
     SolnFrame:
         Attributes:
              _pointer : int
              _tiles_list : list[tkinter.Button]
-             _soln_set : list[list[list[int]]]
+             _soln_set : SolutionView
 
         Methods:
             _init_tiles() -> none
             _init_btns() -> none
+            _init_stats(SearchStats) -> none
             _update_tiles() -> none
             _update_btns() -> none
             _update_text() -> none
@@ -72,21 +91,36 @@ Global Variables:
         global string representing hex color; used for font/foregrounds.
     ERROR_MSG : str
         error message that is displayed when the _tiles_list buttons aren't 0-8
-        non-repeating.
+        (0 to tiles - 1 for other sizes) non-repeating. Formatted with the
+        largest tile.
+    SIZES : list[str]
+        puzzle sizes that can be picked in the puzzle frame.
+    POLL_MS : int
+        milliseconds between checks on a running search.
+    ANYTIME_SECONDS : float
+        seconds the anytime engines get to improve their solution before the
+        best one found is shown.
 """
 
+import queue
 import threading
 import tkinter
 import random
 from math import floor
 from tkinter import messagebox
 from puzzle import Puzzle
+from progress import queue_reporter
+from limits import CancelToken, SearchLimits
+from cache import SolutionCache
 import heuristic as H
 
 BG_COLOR = '#181a19'
-ERROR_MSG = "Tiles must represent 0-8, not repeating. Tiles 0-2 represents " +\
-                         "the top row, 3-5 the middle, and 6-8 the bottom row."
+ERROR_MSG = "Tiles must represent 0-{}, not repeating. Tiles are read left " +\
+                         "to right starting from the top row."
 FONT_COLOR = 'red'
+SIZES = ['2x3', '3x3', '4x4', '5x5']
+POLL_MS = 50
+ANYTIME_SECONDS = 5.0
 
 class ShiftingPuzzleGUI(tkinter.Tk):
     """
@@ -99,6 +133,13 @@ class ShiftingPuzzleGUI(tkinter.Tk):
     ----------
     box_size : int
         used for padding sizing for gui button elements
+    cache : SolutionCache
+        solutions of puzzles solved this session, so solving one again is
+        instant.
+    rows : int
+        number of rows of the puzzle being input.
+    cols : int
+        number of columns of the puzzle being input.
     _frame : tkinter.frame
         currently displayed tkinter frame
 
@@ -106,13 +147,18 @@ class ShiftingPuzzleGUI(tkinter.Tk):
     -------
     get_puzzle_frame() -> none:
         sets main tkinter window to 'puzzle frame' for puzzle inputing.
-    get_soln_frame(list[list[list[int]]] soln_set) -> none:
+    get_soln_frame(SolutionView soln_set, SearchStats stats) -> none:
         sets maifn tkinter window to view inputed solution (puzzle states).
+    set_size(int rows, int cols) -> none:
+        changes the puzzle size and resets the puzzle frame.
 
     """
     def __init__(self):
         tkinter.Tk.__init__(self)
         self.box_size = 50
+        self.cache = SolutionCache()
+        self.rows = 3
+        self.cols = 3
         self.configure(background='black')
         self._frame = None
         self.get_puzzle_frame()
@@ -133,18 +179,41 @@ class ShiftingPuzzleGUI(tkinter.Tk):
         self._frame = new_frame
         self._frame.pack()
 
+    def set_size(self, rows, cols):
+        """
+        Changes the size of the puzzle being input and shows a new puzzle frame
+        with that many tiles.
+
+        Parameters
+        ----------
+        rows : int
+            number of rows.
+        cols : int
+            number of columns.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.rows = rows
+        self.cols = cols
+        self.get_puzzle_frame()
+
     #switch to frame to view soln set
-    def get_soln_frame(self, soln_set):
+    def get_soln_frame(self, soln_set, stats=None):
         """
         Sets tkinter window to solution frame which allows viewing solutions
         to the inputed shifting puzzle.
 
         Parameters
         ----------
-        soln_set : list[list[list[int]]]
-            list of puzzle states for solution
+        soln_set : SolutionView
+            sequence of puzzle states for solution
+        stats : SearchStats
+            record of the search shown under the solution, optional.
         """
-        new_frame = SolnFrame(self, soln_set)
+        new_frame = SolnFrame(self, soln_set, stats)
         if self._frame is not None:
             self._frame.destroy()
         self._frame = new_frame
@@ -155,8 +224,8 @@ class PuzzleFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
     Class for showing puzzle frame. Puzzle frame is the display that lets users
     set the shifting puzzle up and initiate the algorithm to solve the puzzle.
     To run a shifting puzzle, the buttons need to be displaying the numbers 0-8
-    non-repeating. Frame includes 9 buttons representing the shifting puzzle tiles
-    and 1 button to initate solving.
+    non-repeating. Frame includes 9 buttons (1 per tile for other sizes)
+    representing the shifting puzzle tiles and 1 button to initate solving.
 
     Attributes
     ----------
@@ -168,23 +237,53 @@ class PuzzleFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
     swap_btn : tkinter.Button
         button used to initiate the heuristic swap algorithm used to find the
         solution set.
+    shift_engine : tkinter.StringVar
+        name of the engine in heuristic.SHIFT_ENGINES used by the shift button.
+    swap_engine : tkinter.StringVar
+        name of the engine in heuristic.SWAP_ENGINES used by the swap button.
+    size : tkinter.StringVar
+        size of the puzzle picked in the size menu, e.g. 3x3.
+    _messages : queue.Queue
+        progress and result of the running search, filled by the worker thread
+        and drained on the tkinter thread.
+    _progress_btn : tkinter.Button
+        solve button showing the progress of the running search.
+    cancel_btn : tkinter.Button
+        button used to stop the running search.
+    _token : CancelToken
+        token cancelled by cancel_btn.
 
     Methods
     -------
     _init_tiles() -> none:
         initializes the tkinter.buttons used for the shifting puzzle tiles.
+    _init_engine_menu(tkinter.StringVar variable, dict engines) -> tkinter.OptionMenu:
+        initializes a menu used to pick the shift or swap engine.
+    _init_size_menu() -> tkinter.OptionMenu:
+        initializes the menu used to pick the puzzle size.
     _init_random_btn() -> tkinter.Button:
         button that randomizes tile buttons to a new puzzle state on click.
     _randomize() -> none:
         randomizes the tile buttons to a new puzzle.
     _init_solve_btn() -> tkinter.Button:
         initializes the solve button for starting the algorithm.
-    _button_increment(tkinter.button button) -> none:
+    _button_increment(tkinter.button button, int tile_count) -> none:
         increments input button text by 1.
     swap_solve() -> none:
-        validates button tiles, runs main swap solving algorithm, and changes frame.
+        starts the swap solving algorithm picked in the swap engine menu.
     shift_solve() -> none:
-        validates button tiles, runs main shift solving algorithm, and changes frame.
+        starts the shift solving algorithm picked in the engine menu.
+    _start_solve(str mode, str engine, tkinter.Button button) -> none:
+        validates button tiles and starts solving on a worker thread, giving
+        the anytime engines ANYTIME_SECONDS.
+    _set_controls(str state) -> none:
+        enables or disables the controls that can't be used during a search.
+    _cancel() -> none:
+        stops the running search.
+    _solve_worker(Puzzle puzzle, str engine, str mode, SearchLimits limits) -> none:
+        runs the search on the worker thread.
+    _poll() -> none:
+        shows the search progress and changes frame once it's done.
     _get_tiles() -> list[str]:
         returns a list of strings from the tile button texts.
     """
@@ -200,13 +299,29 @@ class PuzzleFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
         self._tiles_list = []
         self.configure(background=BG_COLOR)
         self._init_tiles()
+        btn_row = self.master.rows
         self.shift_btn = self._init_solve_btn('Shift', self.shift_solve)
-        self.shift_btn.grid(row=3, column=0)
+        self.shift_btn.grid(row=btn_row, column=0)
         self.swap_btn = self._init_solve_btn('Swap', self.swap_solve)
-        self.swap_btn.grid(row=3, column=1)
+        self.swap_btn.grid(row=btn_row, column=1)
         self.random_btn = self._init_random_btn()
-        self.random_btn.grid(row=3, column=2)
-        self.grid_rowconfigure(3, minsize=50)
+        self.random_btn.grid(row=btn_row, column=2)
+        self.grid_rowconfigure(btn_row, minsize=50)
+        self.shift_engine = tkinter.StringVar(self, value='astar')
+        self.engine_menu = self._init_engine_menu(self.shift_engine, H.SHIFT_ENGINES)
+        self.engine_menu.grid(row=btn_row + 1, column=0)
+        self.swap_engine = tkinter.StringVar(self, value='astar')
+        self.swap_engine_menu = self._init_engine_menu(self.swap_engine, H.SWAP_ENGINES)
+        self.swap_engine_menu.grid(row=btn_row + 1, column=1)
+        self.size = tkinter.StringVar(self, value=f"{self.master.rows}x{self.master.cols}")
+        self.size_menu = self._init_size_menu()
+        self.size_menu.grid(row=btn_row + 1, column=2)
+        self.cancel_btn = self._init_solve_btn('Cancel', self._cancel)
+        self.cancel_btn.grid(row=btn_row + 2, column=1)
+        self.cancel_btn['state'] = 'disabled'
+        self._messages = None
+        self._progress_btn = None
+        self._token = None
 
 
     def _init_tiles(self):
@@ -219,8 +334,10 @@ class PuzzleFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
         None.
 
         """
-        tile_size = 9
-        row_len = 3
+        tile_size = self.master.rows * self.master.cols
+        row_len = self.master.cols
+        #shrink the tiles of larger puzzles so the window stays the same size
+        pad = self.master.box_size * 3 // max(self.master.rows, self.master.cols)
         for i in range(tile_size):
             self._tiles_list.append(tkinter.Button(
               self,
@@ -229,14 +346,71 @@ class PuzzleFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
               activebackground=BG_COLOR,
               activeforeground=FONT_COLOR,
               fg=FONT_COLOR,
-              padx=self.master.box_size,
-              pady=self.master.box_size,
+              padx=pad,
+              pady=pad,
                 font=("Times New Roman", 20),
               #index = i needed to maintain mapping to correct tile
-              command=lambda index=i: PuzzleFrame._button_increment(self._tiles_list[index])
+              command=lambda index=i: PuzzleFrame._button_increment(self._tiles_list[index],
+                                                                    tile_size)
             ))
             self._tiles_list[i].grid(row=floor(i/row_len), column=i%row_len)
 
+    def _init_engine_menu(self, variable, engines):
+        """
+        Method used for initializing a menu that picks which engine the shift
+        or swap button runs.
+
+        Parameters
+        ----------
+        variable : tkinter.StringVar
+            holds the name of the picked engine.
+        engines : dict[str] -> function
+            engines of the mode, e.g. heuristic.SHIFT_ENGINES.
+
+        Returns
+        -------
+        tkinter.OptionMenu
+            returns a set-up menu listing the engines.
+
+        """
+        menu = tkinter.OptionMenu(self, variable, *sorted(engines))
+        menu.configure(
+              bg=BG_COLOR,
+              fg=FONT_COLOR,
+              activebackground=BG_COLOR,
+              activeforeground=FONT_COLOR,
+              highlightthickness=0,
+              font=("Times New Roman", 12)
+         )
+        return menu
+
+    def _init_size_menu(self):
+        """
+        Method used for initializing the menu that picks the puzzle size. Picking
+        a size resets the frame with that many tiles.
+
+        Returns
+        -------
+        tkinter.OptionMenu
+            returns a set-up menu listing the puzzle sizes.
+
+        """
+        menu = tkinter.OptionMenu(
+              self,
+              self.size,
+              *SIZES,
+              command=lambda size: self.master.set_size(*[int(i) for i in size.split('x')])
+         )
+        menu.configure(
+              bg=BG_COLOR,
+              fg=FONT_COLOR,
+              activebackground=BG_COLOR,
+              activeforeground=FONT_COLOR,
+              highlightthickness=0,
+              font=("Times New Roman", 12)
+         )
+        return menu
+
     def _init_random_btn(self):
         """
         Method used for initializing the swapping solve button. When clicked,
@@ -271,7 +445,7 @@ class PuzzleFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
         None.
 
         """
-        nums = [0,1,2,3,4,5,6,7,8]
+        nums = list(range(len(self._tiles_list)))
         random.shuffle(nums)
         for idx, tile in enumerate(self._tiles_list):
             tile['text'] = nums[idx]
@@ -295,19 +469,22 @@ class PuzzleFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
               activebackground=BG_COLOR,
               activeforeground=FONT_COLOR,
               font=("Times New Roman", 12),
-              command=threading.Thread(target=command, daemon=True).start
+              command=command
          )
 
     @staticmethod
-    def _button_increment(button):
+    def _button_increment(button, tile_count=9):
         """
-        Increments button text by 1. Valid numbers are 0-8 and if the current
-        number on the button is 8, sets the number to 0.
+        Increments button text by 1. Valid numbers are 0 to tile_count - 1 (0-8
+        for a 3x3 puzzle) and if the current number on the button is the largest,
+        sets the number to 0.
 
         Parameters
         ----------
         button : tkinter.Button
             input button to have text incremented by 1.
+        tile_count : int
+            number of tiles in the puzzle.
 
         Returns
         -------
@@ -316,68 +493,180 @@ class PuzzleFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
         """
         num = button.cget('text')
         num += 1
-        if num > 8:
+        if num >= tile_count:
             num = 0
         button.config(text=num)
 
     def shift_solve(self):
         """
-        shift solve is the method called when the swap_button is clicked. Once clicked,
-        makes sure that the buttons representing the shifting puzzle tiles are
-        a valid puzzle. If they are, it initializes the solving algorithm
-        and sets the resulting solution set as the input to change from a puzzle
-        frame to a soln frame. If the tiles aren't validated, produces an error
-        message box.
+        shift solve is the method called when the shift_button is clicked. Once
+        clicked, starts solving the puzzle with the engine picked in the engine
+        menu on a worker thread.
 
         Returns
         -------
         None.
 
         """
-        self.swap_btn['state'] = 'disabled'
-        self.shift_btn['state'] = 'disabled'
-        self.shift_btn['text'] = 'Running'
-        if Puzzle.validate(self._get_tiles()):
-            puzzle = Puzzle(self._get_tiles())
-            new_puzzle = H.bfs_shift(puzzle, self.random_btn)
-            if not new_puzzle:
-                messagebox.showerror(title="No solution", message="No solution found.")
-                self.master.get_soln_frame(puzzle.get_soln_states())
-            else:
-                soln_set = new_puzzle.get_soln_states()
-                self.master.get_soln_frame(soln_set)
-        else:
-            #input that's failed validation throws error messagebox
-            messagebox.showerror(title="Input error", message=ERROR_MSG)
-            self.swap_btn['state'] = 'normal'
-            self.shift_btn['state'] = 'normal'
+        self._start_solve('shift', self.shift_engine.get(), self.shift_btn)
 
     def swap_solve(self):
         """
-        swap solve is the method called when the swap_button is clicked. Once clicked,
-        makes sure that the buttons representing the swapping puzzle tiles are
-        a valid puzzle. If they are, it initializes the solving algorithm
-        and sets the resulting solution set as the input to change from a puzzle
-        frame to a soln frame. If the tiles aren't validated, produces an error
-        message box.
+        swap solve is the method called when the swap_button is clicked. Once
+        clicked, starts solving the swapping puzzle with the engine picked in
+        the swap engine menu on a worker thread.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._start_solve('swap', self.swap_engine.get(), self.swap_btn)
+
+    def _start_solve(self, mode, engine, button):
+        """
+        Makes sure that the buttons representing the puzzle tiles are a valid
+        puzzle. If they are, disables the controls and starts the search on a
+        worker thread, then polls for its progress and result with after(). If
+        the tiles aren't validated, produces an error message box. The anytime
+        engines keep improving their solution until they're stopped, so they
+        get ANYTIME_SECONDS and then the best solution found is shown.
+
+        Parameters
+        ----------
+        mode : str
+            'shift' or 'swap'.
+        engine : str
+            name of the engine in the mode's engine dict.
+        button : tkinter.Button
+            button that was clicked, shows the progress of the search.
 
         Returns
         -------
         None.
 
         """
-        self.swap_btn['state'] = 'disabled'
-        self.shift_btn['state'] = 'disabled'
-        if Puzzle.validate(self._get_tiles()):
-            puzzle = Puzzle(self._get_tiles())
-            puzzle = H.heuristic_swap(puzzle)
-            soln_set = puzzle.get_soln_states()
-            self.master.get_soln_frame(soln_set)
-        else:
+        rows, cols = self.master.rows, self.master.cols
+        if not Puzzle.validate(self._get_tiles(), rows, cols):
             #input that's failed validation throws error messagebox
-            messagebox.showerror(title="Input error", message=ERROR_MSG)
-            self.swap_btn['state'] = 'normal'
-            self.shift_btn['state'] = 'normal'
+            messagebox.showerror(title="Input error", message=ERROR_MSG.format(rows * cols - 1))
+            return
+
+        self._set_controls('disabled')
+        self.cancel_btn['state'] = 'normal'
+        button['text'] = 'Running'
+        self._progress_btn = button
+        self._messages = queue.Queue()
+        self._token = CancelToken()
+        puzzle = Puzzle(self._get_tiles(), rows, cols)
+        timeout = ANYTIME_SECONDS if engine == 'anytime' else None
+        limits = SearchLimits(timeout, token=self._token)
+        threading.Thread(target=self._solve_worker,
+                         args=(puzzle, engine, mode, limits),
+                         daemon=True).start()
+        self.after(POLL_MS, self._poll)
+
+    def _set_controls(self, state):
+        """
+        Sets the state of every control that can't be used while a search runs.
+
+        Parameters
+        ----------
+        state : str
+            'normal' or 'disabled'.
+
+        Returns
+        -------
+        None.
+
+        """
+        for control in (self.shift_btn, self.swap_btn, self.random_btn,
+                        self.engine_menu, self.swap_engine_menu, self.size_menu):
+            control['state'] = state
+
+    def _cancel(self):
+        """
+        cancel is the method called when the cancel_btn is clicked. Asks the
+        running search to stop, _poll() picks up the aborted result.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._token.cancel()
+        self.cancel_btn['state'] = 'disabled'
+
+    def _solve_worker(self, puzzle, engine, mode, limits):
+        """
+        Runs the search on the worker thread and puts the result on _messages.
+        Makes no tkinter calls.
+
+        Parameters
+        ----------
+        puzzle : Puzzle
+            puzzle to solve.
+        engine : str
+            name of the engine in the mode's engine dict.
+        mode : str
+            'shift' or 'swap'.
+        limits : SearchLimits
+            limits holding the token cancelled by the cancel button and the
+            deadline of the anytime engines.
+
+        Returns
+        -------
+        None.
+
+        """
+        try:
+            #solve() leaves puzzle untouched if it can't be solved
+            result = H.solve(puzzle, engine, mode, cache=self.master.cache,
+                             progress=queue_reporter(self._messages), limits=limits)
+        except ValueError as error:
+            self._messages.put(('error', error))
+            return
+        self._messages.put(('done', (puzzle,) + result))
+
+    def _poll(self):
+        """
+        Drains _messages on the tkinter thread, showing the latest progress on
+        the clicked button, and changes frame once the search is done. Polls
+        again after POLL_MS until then.
+
+        Returns
+        -------
+        None.
+
+        """
+        snapshot = None
+        while not self._messages.empty():
+            kind, value = self._messages.get_nowait()
+            if kind == 'progress':
+                snapshot = value
+            elif kind == 'error':
+                messagebox.showerror(title="Engine error", message=str(value))
+                self.master.get_puzzle_frame()
+                return
+            else:
+                puzzle, new_puzzle, stats = value
+                if stats.aborted:
+                    #keep the tiles so the puzzle can be run again
+                    messagebox.showinfo(title="Aborted", message=f"{stats.aborted.capitalize()} after "
+                                        f"{stats.expanded} expanded states.")
+                    self._set_controls('normal')
+                    self.cancel_btn['state'] = 'disabled'
+                    self.shift_btn['text'] = 'Shift'
+                    self.swap_btn['text'] = 'Swap'
+                elif not new_puzzle:
+                    messagebox.showerror(title="No solution", message="No solution found.")
+                    self.master.get_soln_frame(puzzle.get_soln_states(), stats)
+                else:
+                    self.master.get_soln_frame(new_puzzle.get_soln_states(), stats)
+                return
+        if snapshot is not None:
+            self._progress_btn['text'] = snapshot['expanded']
+        self.after(POLL_MS, self._poll)
 
     def _get_tiles(self):
         """
@@ -406,8 +695,9 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
         pointer used to show which puzzle frame is displayed.
     _tiles_list : list[tkinter.Button]
         list of buttons used to represent shifting puzzle tiles.
-    _soln_set : list[list[list[int]]]
-        list of puzzle frames representing optimal shifting puzzle solution.
+    _soln_set : SolutionView
+        sequence of puzzle frames representing optimal shifting puzzle
+        solution, each built when it's displayed.
 
     (3 below are initialized in init_btns)
     forward : tkinter.Button
@@ -430,6 +720,8 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
     _init_btns() -> none:
         initializes the forward, backwards, and to_puzzle buttons that control
         the frame.
+    _init_stats(SearchStats stats) -> none:
+        initializes the label showing the record of the search.
     _update_tiles() -> none:
         updates buttons representing tiles to the new puzzle state.
     _update_btns() -> none:
@@ -445,14 +737,16 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
 
     """
 
-    def __init__(self, master, soln_set):
+    def __init__(self, master, soln_set, stats=None):
         """
         Parameters
         ----------
         master : tkinter.TK
             TK that calls frame.
-        soln_set : list[list[list[int]]]
-            list of puzzle states for solution
+        soln_set : SolutionView
+            sequence of puzzle states for solution
+        stats : SearchStats
+            record of the search shown under the solution, optional.
         """
         tkinter.Frame.__init__(self, master)
         self.configure(background=BG_COLOR)
@@ -462,8 +756,34 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
 
         self._init_tiles()
         self._init_btns()
+        if stats is not None:
+            self._init_stats(stats)
         self._update()
 
+    def _init_stats(self, stats):
+        """
+        Initializes the label showing the record of the search under the
+        to_puzzle button.
+
+        Parameters
+        ----------
+        stats : SearchStats
+            record of the search.
+
+        Returns
+        -------
+        None.
+
+        """
+        stats_label = tkinter.Label(
+            self,
+            fg=FONT_COLOR,
+            bg=BG_COLOR,
+            justify=tkinter.LEFT,
+            text=stats.summary())
+        stats_label.grid(row=self._soln_set.board.rows + 2, column=0,
+                         columnspan=self._soln_set.board.cols)
+
     def _init_tiles(self):
         """
         Initializes the buttons used to represent the shifting puzzle tiles.
@@ -475,15 +795,16 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
         None.
 
         """
-        col_len = 3
-        row_len = 3
+        col_len = self._soln_set.board.cols
+        row_len = self._soln_set.board.rows
+        pad = self.master.box_size * 3 // max(row_len, col_len)
         for col in range(col_len):
             self._tiles_list.append([])
             for row in range(row_len):
                 self._tiles_list[col].append(tkinter.Button(
                   self,
-                  padx=self.master.box_size,
-                  pady=self.master.box_size,
+                  padx=pad,
+                  pady=pad,
                   bg=BG_COLOR,
                   fg=FONT_COLOR,
                   activebackground=BG_COLOR,
@@ -517,7 +838,8 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
             activebackground=BG_COLOR,
             command=self._forward
         )
-        self.forward.grid(row=3, column=2)
+        btn_row = self._soln_set.board.rows
+        self.forward.grid(row=btn_row, column=2)
 
         #setup backwards button
         self.backwards = tkinter.Button(
@@ -527,8 +849,8 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
             activebackground=BG_COLOR,
             command=self._backwards
         )
-        self.backwards.grid(row=3, column=0)
-        self.grid_rowconfigure(3, minsize=50)
+        self.backwards.grid(row=btn_row, column=0)
+        self.grid_rowconfigure(btn_row, minsize=50)
 
         #setup to_puzzle button
         self.to_puzzle = tkinter.Button(
@@ -541,7 +863,7 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
                 font=("Times New Roman", 16),
                 command=self.master.get_puzzle_frame
         )
-        self.to_puzzle.grid(row=4, column=1)
+        self.to_puzzle.grid(row=btn_row + 1, column=1)
 
     def _update_tiles(self):
         """
@@ -552,10 +874,10 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
         -------
         None.
         """
-        for col in range(3):
-            for row in range(3):
-                self._tiles_list[col][row]["text"] = \
-                    self._soln_set[self._pointer][row][col]
+        state = self._soln_set[self._pointer]
+        for col, tiles in enumerate(self._tiles_list):
+            for row, tile in enumerate(tiles):
+                tile["text"] = state[row][col]
 
     def _update_btns(self):
         """
@@ -588,7 +910,7 @@ class SolnFrame(tkinter.Frame): # pylint: disable=too-many-ancestors
             fg=FONT_COLOR,
             bg=BG_COLOR,
             text=step_text)
-        step_label.grid(row=3, column=1)
+        step_label.grid(row=self._soln_set.board.rows, column=1)
 
     def _update(self):
         """
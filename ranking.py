@@ -0,0 +1,394 @@
+"""
+Ranking is the module that numbers the states of a board. Every arrangement of
+the n tiles of a board is a permutation, so it can be given a unique rank from
+0 to n! - 1 and rebuilt from it. Ranks index flat tables such as the distance
+table and the bitset of a VisitedSet.
+
+2 rankings are provided. rank() and unrank() use the lexicographic (Lehmer
+code) order, where the completed puzzle with 0 first is rank 0 and ranks follow
+the order the states sort in. mr_rank() and mr_unrank() use the Myrvold-Ruskey
+order, which isn't sorted but needs no counting of smaller tiles.
+
+Usage
+-----
+Call rank() with a packed state and its board to get its rank and unrank() to
+get the state back. Call make_visited() to get the cheapest set of seen states
+for a board, a VisitedSet when its bitset fits in MAX_BITSET_BYTES and a
+StateSet otherwise. visit() checks and adds a state in one step, ranking it
+once.
+
+Classes:
+    VisitedSet:
+        Constructor:
+            VisitedSet(Board board)
+
+        Attributes:
+            board : Board
+
+        Methods:
+            add(int) -> none
+            visit(int) -> bool
+
+    StateSet:
+        Constructor:
+            StateSet()
+
+        Methods:
+            visit(int) -> bool
+
+Methods
+-------
+rank(int packed, Board board) -> int:
+    returns the lexicographic rank of a packed state.
+unrank(int rank, Board board) -> int:
+    returns the packed state with a lexicographic rank.
+mr_rank(int packed, Board board) -> int:
+    returns the Myrvold-Ruskey rank of a packed state.
+mr_unrank(int rank, Board board) -> int:
+    returns the packed state with a Myrvold-Ruskey rank.
+make_visited(Board board) -> VisitedSet or StateSet:
+    returns an empty set of seen states for the board.
+bitset_bytes(Board board) -> int:
+    returns the bytes a VisitedSet of the board needs.
+_get_factorials(int size) -> tuple[int]:
+    returns the place values of the Lehmer code digits.
+_get_rank_tables(Board board) -> list[int], list[int]:
+    returns the lookup tables rank() uses on small boards.
+
+Globals
+-------
+MAX_BITSET_BYTES : int
+    largest bitset make_visited() will allocate.
+MAX_TABLE_TILES : int
+    largest board rank() uses lookup tables for.
+"""
+
+from functools import lru_cache
+from math import factorial
+
+MAX_BITSET_BYTES = 1 << 24
+MAX_TABLE_TILES = 12
+
+@lru_cache(maxsize=None)
+def _get_factorials(size):
+    """
+    Lists the place value of every digit of a Lehmer code, (size - 1)! for the
+    first flat index down to 0! for the last.
+
+    Parameters
+    ----------
+    size : int
+        number of tiles.
+
+    Returns
+    -------
+    tuple[int]
+        returns the place values in flat index order.
+    """
+    return tuple(factorial(size - 1 - idx) for idx in range(size))
+
+@lru_cache(maxsize=None)
+def _get_rank_tables(board):
+    """
+    Builds the tables that replace counting bits in rank() on boards of up to
+    MAX_TABLE_TILES tiles. The tiles placed so far are kept as a mask shifted
+    up by cell_bits, so the mask and the next tile together index the count of
+    smaller tiles not placed yet.
+
+    Parameters
+    ----------
+    board : Board
+        board of the states.
+
+    Returns
+    -------
+    list[int], list[int]
+        returns smaller, indexed by mask | tile, and marks, the bit each tile
+        adds to the mask. None, None on larger boards.
+    """
+    if board.size > MAX_TABLE_TILES:
+        return None, None
+    smaller = [0] * ((1 << board.size) << board.cell_bits)
+    for used in range(1 << board.size):
+        for tile in range(board.size):
+            smaller[used << board.cell_bits | tile] = bin(~used & ((1 << tile) - 1)).count("1")
+    marks = [1 << (tile + board.cell_bits) for tile in range(board.size)]
+    return smaller, marks
+
+def rank(packed, board):
+    """
+    Ranks a packed state among all permutations of the board's tiles in
+    lexicographic order, using the tile order of the flat indices.
+
+    Parameters
+    ----------
+    packed : int
+        packed puzzle state.
+    board : Board
+        board of the state.
+
+    Returns
+    -------
+    int
+        returns the rank of the state, 0 to n! - 1.
+    """
+    cell_bits = board.cell_bits
+    cell_mask = board.cell_mask
+    result = 0
+    used = 0
+    smaller, marks = _get_rank_tables(board)
+    if smaller is not None:
+        for place in _get_factorials(board.size):
+            value = packed & cell_mask
+            packed >>= cell_bits
+            result += smaller[used | value] * place
+            used |= marks[value]
+        return result
+    for place in _get_factorials(board.size):
+        value = packed & cell_mask
+        packed >>= cell_bits
+        #count the smaller tiles that haven't been placed yet
+        result += bin(~used & ((1 << value) - 1)).count("1") * place
+        used |= 1 << value
+    return result
+
+def unrank(state_rank, board):
+    """
+    Rebuilds the packed state with a lexicographic rank, the inverse of
+    rank().
+
+    Parameters
+    ----------
+    state_rank : int
+        rank of the state, 0 to n! - 1.
+    board : Board
+        board of the state.
+
+    Returns
+    -------
+    int
+        returns the packed state.
+    """
+    tiles = list(range(board.size))
+    packed = 0
+    for idx, place in enumerate(_get_factorials(board.size)):
+        digit, state_rank = divmod(state_rank, place)
+        packed |= tiles.pop(digit) << (idx * board.cell_bits)
+    return packed
+
+def mr_rank(packed, board):
+    """
+    Ranks a packed state with the Myrvold-Ruskey ranking. The tile at the last
+    place is swapped out of the way and recorded as one digit, then the same
+    is done for the rest. Uses the inverse of the state to find each swap in
+    constant time.
+
+    Parameters
+    ----------
+    packed : int
+        packed puzzle state.
+    board : Board
+        board of the state.
+
+    Returns
+    -------
+    int
+        returns the rank of the state, 0 to n! - 1.
+    """
+    tiles = board.unpack_tiles(packed)
+    cells = [0] * board.size
+    for idx, tile in enumerate(tiles):
+        cells[tile] = idx
+    result = 0
+    place = 1
+    for size in range(board.size, 1, -1):
+        last = size - 1
+        tile = tiles[last]
+        cell = cells[last]
+        tiles[last], tiles[cell] = last, tile
+        cells[tile], cells[last] = cell, last
+        result += tile * place
+        place *= size
+    return result
+
+def mr_unrank(state_rank, board):
+    """
+    Rebuilds the packed state with a Myrvold-Ruskey rank, the inverse of
+    mr_rank().
+
+    Parameters
+    ----------
+    state_rank : int
+        rank of the state, 0 to n! - 1.
+    board : Board
+        board of the state.
+
+    Returns
+    -------
+    int
+        returns the packed state.
+    """
+    tiles = list(range(board.size))
+    for size in range(board.size, 0, -1):
+        state_rank, digit = divmod(state_rank, size)
+        tiles[size - 1], tiles[digit] = tiles[digit], tiles[size - 1]
+    return board.pack_tiles(tiles)
+
+def bitset_bytes(board):
+    """
+    Works out the size of the bitset a VisitedSet of the board needs, 1 bit
+    per permutation of its tiles.
+
+    Parameters
+    ----------
+    board : Board
+        board of the states.
+
+    Returns
+    -------
+    int
+        returns the number of bytes.
+    """
+    return (factorial(board.size) + 7) // 8
+
+def make_visited(board):
+    """
+    Creates an empty set of seen states for the board. The whole state space
+    of boards up to 10 tiles fits in a bitset of at most MAX_BITSET_BYTES, so
+    those get a VisitedSet and larger boards a StateSet.
+
+    Parameters
+    ----------
+    board : Board
+        board of the states.
+
+    Returns
+    -------
+    VisitedSet or StateSet
+        returns the empty set, both support in, add(), visit() and len().
+    """
+    if bitset_bytes(board) <= MAX_BITSET_BYTES:
+        return VisitedSet(board)
+    return StateSet()
+
+class StateSet(set):
+    """
+    The StateSet class is a set of packed states with the visit() method of
+    VisitedSet, for boards too large for a bitset.
+
+    Methods
+    -------
+    visit(int packed) -> bool:
+        adds a packed state, returns False if it was already in the set.
+    """
+
+    def visit(self, packed):
+        """
+        Adds a packed state to the set.
+
+        Parameters
+        ----------
+        packed : int
+            packed puzzle state.
+
+        Returns
+        -------
+        bool
+            Returns True if the state is new, False if it was already in the
+            set.
+
+        """
+        if packed in self:
+            return False
+        self.add(packed)
+        return True
+
+class VisitedSet:
+    """
+    The VisitedSet class is a set of packed states backed by a bytearray with
+    1 bit per rank, so the whole state space of a 3x3 board takes 45 KB
+    however many states are added, instead of about 100 bytes per state in a
+    set. Supports in, add() and len() like the set it replaces. Ranking
+    costs more than hashing, so searches should call visit() to check and add
+    a state with a single rank.
+
+    Attributes
+    ----------
+    board : Board
+        board of the states.
+
+    Methods
+    -------
+    add(int packed) -> none:
+        adds a packed state to the set.
+    visit(int packed) -> bool:
+        adds a packed state, returns False if it was already in the set.
+    """
+    __slots__ = ('board', '_bits', '_count', '_tables')
+
+    def __init__(self, board):
+        self.board = board
+        self._bits = bytearray(bitset_bytes(board))
+        self._count = 0
+        #looked up once here, visit() runs for every generated state
+        smaller, marks = _get_rank_tables(board)
+        self._tables = (smaller, marks, _get_factorials(board.size)[:-1],
+                        board.cell_bits, board.cell_mask)
+
+    def __contains__(self, packed):
+        idx = rank(packed, self.board)
+        return self._bits[idx >> 3] >> (idx & 7) & 1 == 1
+
+    def __len__(self):
+        return self._count
+
+    def add(self, packed):
+        """
+        Adds a packed state to the set, if it isn't in it already.
+
+        Parameters
+        ----------
+        packed : int
+            packed puzzle state.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.visit(packed)
+
+    def visit(self, packed):
+        """
+        Adds a packed state to the set, ranking it once.
+
+        Parameters
+        ----------
+        packed : int
+            packed puzzle state.
+
+        Returns
+        -------
+        bool
+            Returns True if the state is new, False if it was already in the
+            set.
+
+        """
+        smaller, marks, places, cell_bits, cell_mask = self._tables
+        if smaller is None:
+            idx = rank(packed, self.board)
+        else:
+            #rank() inlined, the last digit is always 0
+            idx = 0
+            used = 0
+            for place in places:
+                value = packed & cell_mask
+                packed >>= cell_bits
+                idx += smaller[used | value] * place
+                used |= marks[value]
+        bit = 1 << (idx & 7)
+        if self._bits[idx >> 3] & bit:
+            return False
+        self._bits[idx >> 3] |= bit
+        self._count += 1
+        return True
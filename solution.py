@@ -0,0 +1,246 @@
+"""
+Solution is the module that holds the moves of a solved puzzle and the states
+along the way in compact form. A MoveList stores every move as the flat
+indices of the 2 swapped cells, one byte each on boards of up to 256 tiles,
+instead of nested lists of coordinates. A SolutionView replays those moves on
+demand over the packed initial state, so the states of a solution are only
+built when they're looked at.
+
+Both still behave like the lists they replace: iterating a MoveList gives
+[[x, y], [x, y]] moves and indexing a SolutionView gives 2d puzzle states.
+
+Usage
+-----
+Puzzle creates a MoveList as its moves attr and a SolutionView over it as its
+soln_states attr. Engines add moves with append_flat() and read them back with
+flat(). Index or iterate the view to get states, stepping through it in order
+is the cheapest since each step replays a single move.
+
+Classes:
+    MoveList:
+        Constructor:
+            MoveList(Board board)
+
+        Attributes:
+            board : Board
+
+        Methods:
+            append(list[list[int]]) -> none
+            append_flat(int, int) -> none
+            flat(int, int) -> list[tuple[int]]
+
+    SolutionView:
+        Constructor:
+            SolutionView(Board board, int packed, MoveList moves)
+
+        Attributes:
+            board : Board
+            initial : int
+            moves : MoveList
+
+        Methods:
+            get_packed(int) -> int
+"""
+
+from array import array
+from collections.abc import Sequence
+
+class MoveList:
+    """
+    The MoveList class stores moves as flat cell indices in an array. Moves
+    are read back as [[x, y], [x, y]] lists, so it can be used where a list of
+    moves was.
+
+    Attributes
+    ----------
+    board : Board
+        shared tables for the size of the puzzle.
+
+    Methods
+    -------
+    append(list[list[int]] move) -> none:
+        adds a move given as 2 x,y coordinates.
+    append_flat(int idx1, int idx2) -> none:
+        adds a move given as 2 flat indices.
+    flat(int start, int stop) -> list[tuple[int]]:
+        returns the moves as pairs of flat indices.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self._cells = array("B" if board.size <= 256 else "H")
+
+    def __len__(self):
+        return len(self._cells) // 2
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("move index out of range")
+        coords = self.board.coords
+        return [list(coords[self._cells[2 * idx]]), list(coords[self._cells[2 * idx + 1]])]
+
+    def __iter__(self):
+        coords = self.board.coords
+        cells = iter(self._cells)
+        for idx1, idx2 in zip(cells, cells):
+            yield [list(coords[idx1]), list(coords[idx2])]
+
+    def __eq__(self, other):
+        if isinstance(other, MoveList):
+            return self.board is other.board and self._cells == other._cells
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"MoveList({list(self)})"
+
+    def append(self, move):
+        """
+        Adds a move given as 2 lists of x,y coordinates.
+
+        Parameters
+        ----------
+        move : list[list[int]]
+            List of lists representing a move.
+
+        Returns
+        -------
+        None.
+
+        """
+        cols = self.board.cols
+        self._cells.append(move[0][0] * cols + move[0][1])
+        self._cells.append(move[1][0] * cols + move[1][1])
+
+    def append_flat(self, idx1, idx2):
+        """
+        Adds a move given as the flat indices of the 2 swapped cells, the form
+        the engines work in.
+
+        Parameters
+        ----------
+        idx1 : int
+            flat index of the first cell.
+        idx2 : int
+            flat index of the second cell.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._cells.append(idx1)
+        self._cells.append(idx2)
+
+    def flat(self, start=0, stop=None):
+        """
+        Gets the moves, or the moves from start up to stop, as pairs of flat
+        indices.
+
+        Parameters
+        ----------
+        start : int
+            index of the first move.
+        stop : int
+            index after the last move, the end if not given.
+
+        Returns
+        -------
+        list[tuple[int]]
+            Returns the moves as pairs of flat indices.
+
+        """
+        if stop is None:
+            stop = len(self)
+        cells = iter(self._cells[2 * start:2 * stop])
+        return list(zip(cells, cells))
+
+class SolutionView(Sequence):
+    """
+    The SolutionView class is a read only sequence of the states of a
+    solution, the initial state followed by the state after each move. States
+    are rebuilt from the packed initial state when asked for. The last state
+    looked at is remembered, so stepping forwards or backwards one state at a
+    time only replays one move.
+
+    The view reads moves as they are added, so it can be created before the
+    puzzle is solved.
+
+    Attributes
+    ----------
+    board : Board
+        shared tables for the size of the puzzle.
+    initial : int
+        packed initial state.
+    moves : MoveList
+        moves taken from the initial state.
+
+    Methods
+    -------
+    get_packed(int idx) -> int:
+        returns the state after idx moves in packed form.
+    """
+
+    def __init__(self, board, packed, moves):
+        self.board = board
+        self.initial = packed
+        self.moves = moves
+        self._last_idx = 0
+        self._last_packed = packed
+
+    def __len__(self):
+        return len(self.moves) + 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        return self.board.unpack(self.get_packed(idx))
+
+    def __iter__(self):
+        packed = self.initial
+        yield self.board.unpack(packed)
+        for idx1, idx2 in self.moves.flat():
+            packed = self.board.swap(packed, idx1, idx2)
+            yield self.board.unpack(packed)
+
+    def get_packed(self, idx):
+        """
+        Replays the moves up to idx from the closer of the initial state and
+        the last state looked at. Moves are swaps, so replaying one undoes it
+        as well.
+
+        Parameters
+        ----------
+        idx : int
+            number of moves applied, negative counts back from the end.
+
+        Raises
+        ------
+        IndexError
+            if idx is outside the solution.
+
+        Returns
+        -------
+        int
+            Returns the packed state.
+
+        """
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("solution index out of range")
+        if idx < abs(idx - self._last_idx):
+            start, packed = 0, self.initial
+        else:
+            start, packed = self._last_idx, self._last_packed
+        if idx < start:
+            steps = reversed(self.moves.flat(idx, start))
+        else:
+            steps = self.moves.flat(start, idx)
+        for idx1, idx2 in steps:
+            packed = self.board.swap(packed, idx1, idx2)
+        self._last_idx, self._last_packed = idx, packed
+        return packed
@@ -0,0 +1,199 @@
+"""
+Stats is the module that holds the record the solvers fill in while they
+search. Every engine takes an optional SearchStats and counts the work it does
+in it, and heuristic.solve() returns one next to the solution with the search
+and path reconstruction times (and the peak memory if asked for) filled in.
+
+Usage
+-----
+Call heuristic.solve() to get a solution and its SearchStats, or create a
+SearchStats and pass it to an engine with stats=. Read its attributes, call
+as_dict() to write them out or summary() to display them.
+
+Classes:
+    SearchStats:
+        Constructor:
+            SearchStats()
+
+        Attributes:
+            expanded : int
+            generated : int
+            deduped : int
+            max_frontier : int
+            max_visited : int
+            search_time : float
+            reconstruct_time : float
+            peak_memory : int
+            aborted : str
+            cached : bool
+            workers : list[SearchStats]
+            bound : float
+
+        Methods:
+            record_sizes(int, int) -> none
+            add(SearchStats) -> none
+            as_dict() -> dict[str] -> int
+            summary() -> str
+"""
+
+class SearchStats:
+    """
+    The SearchStats class records the work done by a single search. Counters
+    are filled in by the engines, times and memory by heuristic.solve().
+
+    Attributes
+    ----------
+    expanded : int
+        number of states whose moves were tried.
+    generated : int
+        number of states produced by a move, duplicates included.
+    deduped : int
+        number of generated states thrown away because they had already been
+        seen at the same or fewer moves.
+    max_frontier : int
+        largest number of states waiting to be expanded at once.
+    max_visited : int
+        largest number of states stored as seen at once.
+    search_time : float
+        seconds spent searching, reconstruct_time left out.
+    reconstruct_time : float
+        seconds spent rebuilding the moves of the solution from the search
+        nodes.
+    peak_memory : int
+        most bytes allocated at once during the search, None if memory wasn't
+        traced.
+    aborted : str
+        reason the search was stopped early (see limits), None if it ran to
+        the end.
+    cached : boolean
+        True if the solution came from a cache instead of a search.
+    workers : list[SearchStats]
+        record of every worker process of a parallel search (see parallel),
+        None for searches run in a single process.
+    bound : float
+        most the solution can be over the optimal length, as a ratio, for
+        anytime searches (see heuristic.AnytimeSearch). None for searches that
+        only return optimal solutions.
+
+    Methods
+    -------
+    record_sizes(int frontier, int visited) -> none:
+        keeps the largest frontier and visited sizes seen.
+    add(SearchStats other) -> none:
+        adds the counters and times of other, keeping the largest sizes.
+    as_dict() -> dict[str] -> int:
+        returns the record keyed by name.
+    summary() -> str:
+        returns the record as lines of text for display.
+    """
+
+    def __init__(self):
+        self.expanded = 0
+        self.generated = 0
+        self.deduped = 0
+        self.max_frontier = 0
+        self.max_visited = 0
+        self.search_time = 0.0
+        self.reconstruct_time = 0.0
+        self.peak_memory = None
+        self.aborted = None
+        self.cached = False
+        self.workers = None
+        self.bound = None
+
+    def record_sizes(self, frontier, visited):
+        """
+        Keeps the largest frontier and visited set sizes. Engines call this once
+        per state or layer they expand.
+
+        Parameters
+        ----------
+        frontier : int
+            number of states waiting to be expanded.
+        visited : int
+            number of states stored as seen.
+
+        Returns
+        -------
+        None.
+
+        """
+        if frontier > self.max_frontier:
+            self.max_frontier = frontier
+        if visited > self.max_visited:
+            self.max_visited = visited
+
+    def add(self, other):
+        """
+        Adds the counters and times of another record to this one, keeping the
+        largest sizes and peak memory, e.g. to total the searches of a batch.
+
+        Parameters
+        ----------
+        other : SearchStats
+            record to add.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.expanded += other.expanded
+        self.generated += other.generated
+        self.deduped += other.deduped
+        self.record_sizes(other.max_frontier, other.max_visited)
+        self.search_time += other.search_time
+        self.reconstruct_time += other.reconstruct_time
+        if other.peak_memory is not None:
+            self.peak_memory = max(self.peak_memory or 0, other.peak_memory)
+
+    def as_dict(self):
+        """
+        Gets the record keyed by the attribute names, e.g. for writing it to
+        JSON. The records of worker processes are converted too.
+
+        Returns
+        -------
+        dict[str] -> int
+            Returns the record keyed by name.
+
+        """
+        return {"expanded": self.expanded, "generated": self.generated,
+                "deduped": self.deduped, "max_frontier": self.max_frontier,
+                "max_visited": self.max_visited, "search_time": self.search_time,
+                "reconstruct_time": self.reconstruct_time,
+                "peak_memory": self.peak_memory, "aborted": self.aborted,
+                "cached": self.cached, "bound": self.bound,
+                "workers": None if self.workers is None
+                           else [record.as_dict() for record in self.workers]}
+
+    def summary(self):
+        """
+        Formats the record as lines of text for the console and GUI.
+
+        Returns
+        -------
+        str
+            Returns one line per value.
+
+        """
+        memory = "not traced" if self.peak_memory is None \
+                 else f"{self.peak_memory / 1024:.1f} KiB"
+        lines = [] if self.aborted is None else [f"Aborted: {self.aborted}"]
+        if self.cached:
+            lines.append("Answered from cache")
+        if self.bound is not None:
+            lines.append(f"Suboptimality bound: {self.bound:.3f}")
+        lines += [
+            f"Expanded: {self.expanded}",
+            f"Generated: {self.generated} ({self.deduped} duplicates)",
+            f"Max frontier: {self.max_frontier}",
+            f"Max visited: {self.max_visited}",
+            f"Search time: {self.search_time:.5f}s",
+            f"Reconstruction time: {self.reconstruct_time:.5f}s",
+            f"Peak memory: {memory}",
+        ]
+        for idx, record in enumerate(self.workers or []):
+            lines.append(f"Worker {idx}: {record.expanded} expanded, "
+                         f"{record.max_visited} visited")
+        return "\n".join(lines)
@@ -0,0 +1,153 @@
+"""
+Symmetry is the module that maps puzzle states onto a representative of their
+symmetry class. Reflecting a square board across its main diagonal and
+relabelling every tile with the tile whose goal position it lands on maps the
+completed puzzle to itself, as long as 0's goal position is on the diagonal.
+A state and its reflection then need the same number of moves, and reflecting
+the moves that solve one solves the other, so caches and tables only need to
+store one state of each pair.
+
+Usage
+-----
+Call canonicalize() with a packed state to get its representative and the
+transform that produced it. Solutions found for the representative are mapped
+back onto the original state with map_moves().
+
+Methods
+-------
+canonicalize(int packed, Goal goal) -> int, int:
+    returns the representative of packed and the transform applied.
+transform_state(int packed, Goal goal, int transform) -> int:
+    applies a transform to a packed state.
+map_moves(list[tuple[int]] path, Board board, int transform) -> list[tuple[int]]:
+    maps moves through a transform.
+get_symmetry(Goal goal) -> tuple:
+    returns the cell map and relabelling of the goal, None if it has none.
+
+Globals
+-------
+IDENTITY : int
+    transform leaving the state as it is.
+TRANSPOSE : int
+    transform reflecting the state across the main diagonal and relabelling.
+"""
+
+from functools import lru_cache
+
+IDENTITY = 0
+TRANSPOSE = 1
+
+@lru_cache(maxsize=None)
+def get_symmetry(goal):
+    """
+    Builds the reflection of a board and the relabelling that keeps the
+    completed puzzle fixed. Reflecting is its own inverse, so the same tables
+    map states both ways.
+
+    Parameters
+    ----------
+    goal : Goal
+        completed puzzle of the states.
+
+    Returns
+    -------
+    tuple
+        Returns (cells, labels), where the tile at flat index i moves to
+        cells[i] and tile t becomes labels[t], or None if the board isn't
+        square or 0's goal position isn't on the diagonal.
+
+    """
+    board = goal.board
+    goal_tiles = goal.tiles
+    zero_row, zero_col = board.coords[goal_tiles.index(0)]
+    if board.rows != board.cols or zero_row != zero_col:
+        return None
+
+    cells = [col * board.cols + row for row, col in board.coords]
+    labels = [0] * board.size
+    for idx, tile in enumerate(goal_tiles):
+        labels[tile] = goal_tiles[cells[idx]]
+    return cells, labels
+
+def transform_state(packed, goal, transform):
+    """
+    Applies a transform to a packed state.
+
+    Parameters
+    ----------
+    packed : int
+        packed puzzle state.
+    goal : Goal
+        completed puzzle of the state.
+    transform : int
+        IDENTITY or TRANSPOSE.
+
+    Returns
+    -------
+    int
+        Returns the transformed packed state.
+
+    """
+    if transform == IDENTITY:
+        return packed
+    cells, labels = get_symmetry(goal)
+    board = goal.board
+    tiles = [0] * board.size
+    for idx, tile in enumerate(board.unpack_tiles(packed)):
+        tiles[cells[idx]] = labels[tile]
+    return board.pack_tiles(tiles)
+
+def canonicalize(packed, goal):
+    """
+    Maps a packed state onto the representative of its symmetry class, the
+    smaller of the state and its reflection. States of boards without the
+    symmetry are their own representative.
+
+    Parameters
+    ----------
+    packed : int
+        packed puzzle state.
+    goal : Goal
+        completed puzzle of the state.
+
+    Returns
+    -------
+    int, int
+        Returns the representative and the transform that maps packed onto
+        it. The same transform maps it back.
+
+    """
+    if get_symmetry(goal) is None:
+        return packed, IDENTITY
+    reflected = transform_state(packed, goal, TRANSPOSE)
+    if reflected < packed:
+        return reflected, TRANSPOSE
+    return packed, IDENTITY
+
+def map_moves(path, board, transform):
+    """
+    Maps moves through a transform. Moves solving a state, mapped through the
+    transform canonicalize() returned for it, solve the representative and
+    the other way around.
+
+    Parameters
+    ----------
+    path : list[tuple[int]]
+        moves as pairs of flat indices.
+    board : Board
+        board of the moves.
+    transform : int
+        IDENTITY or TRANSPOSE.
+
+    Returns
+    -------
+    list[tuple[int]]
+        Returns the mapped moves.
+
+    """
+    if transform == IDENTITY:
+        return path
+    #row * cols + col becomes col * cols + row
+    cols = board.cols
+    return [(idx1 % cols * cols + idx1 // cols, idx2 % cols * cols + idx2 // cols)
+            for idx1, idx2 in path]
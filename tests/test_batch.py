@@ -0,0 +1,34 @@
+import unittest
+import batch
+
+class TestBatchSolve(unittest.TestCase):
+    def setUp(self):
+        self.lines = ["123456708\n", "\n", "213456780\n", "1123\n", "123456780\n",
+                      "1,2,3,4,5,6,7,8,9,10,11,12,13,14,0,15\n"]
+
+    def test_ordered_results(self):
+        results = list(batch.batch_solve(self.lines, workers=2, chunksize=2))
+        self.assertEqual(results, [
+            "123456708\tsolved\t1\tR",
+            "213456780\tunsolvable",
+            "1123\tinvalid",
+            "123456780\tsolved\t0\t",
+            "1,2,3,4,5,6,7,8,9,10,11,12,13,14,0,15\tsolved\t1\tR",
+        ])
+
+    def test_unordered_results(self):
+        ordered = list(batch.batch_solve(self.lines, workers=2, chunksize=1))
+        unordered = list(batch.batch_solve(self.lines, workers=2, chunksize=1, ordered=False))
+        self.assertEqual(sorted(ordered), sorted(unordered))
+
+    def test_engine_error(self):
+        results = list(batch.batch_solve(["1,2,3,4,5,6,7,8,9,10,11,12,13,14,0,15"],
+                                         engine="table", workers=1))
+        self.assertTrue(results[0].startswith("1,2,3,4,5,6,7,8,9,10,11,12,13,14,0,15\terror"))
+
+    def test_move_string(self):
+        self.assertEqual(batch._move_string([[[2,2],[1,2]], [[1,2],[1,1]]]), "UL")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+import subprocess
+import sys
+import benchmark
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.corpus = {"seed": 0,
+                       "shift": {"easy": [{"tiles": "123456708", "depth": 1}],
+                                 "unsolvable": [{"tiles": "213456780", "depth": None}]},
+                       "swap": {"easy": [{"tiles": "213456780", "depth": 1}]}}
+
+    def test_run_benchmarks(self):
+        results = benchmark.run_benchmarks(self.corpus, ["astar"], repeat=1)
+        self.assertEqual([(row["mode"], row["group"]) for row in results],
+                         [("shift", "easy"), ("shift", "unsolvable"), ("swap", "easy")])
+        self.assertEqual(results[0]["expanded"], 1)
+        self.assertEqual(results[1]["expanded"], 0)
+        self.assertGreater(results[2]["peak_memory"], 0)
+
+    def test_wrong_depth(self):
+        self.corpus["shift"]["easy"][0]["depth"] = 3
+        with self.assertRaises(ValueError):
+            benchmark.run_benchmarks(self.corpus, ["bfs"], repeat=1)
+
+    def test_compare(self):
+        baseline = [{"mode": "shift", "engine": "astar", "group": "easy",
+                     "time": 1.0, "expanded": 10}]
+        same = [dict(baseline[0], time=1.1)]
+        slower = [dict(baseline[0], time=2.0, expanded=12)]
+        self.assertEqual(benchmark.compare(same, baseline), [])
+        self.assertEqual(len(benchmark.compare(slower, baseline)), 2)
+
+class TestStartup(unittest.TestCase):
+    def test_lean_console_imports(self):
+        #modules only the GUI, parallel engine, batches of states or memory
+        #tracing need
+        heavy = ["tkinter", "numpy", "multiprocessing", "tracemalloc"]
+        code = f"import sys, console; print([m for m in {heavy} if m in sys.modules])"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(benchmark.__file__)),
+                                check=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_measure_startup(self):
+        startup, interpreter = benchmark.measure_startup(repeat=1)
+        self.assertGreater(startup, interpreter)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+import heuristic as H
+from cache import SolutionCache, make_key
+from puzzle import Puzzle
+
+class TestSolutionCache(unittest.TestCase):
+    def test_repeat_hits(self):
+        cache = SolutionCache()
+        first, stats = H.solve(Puzzle([8,6,7,2,5,4,3,0,1]), cache=cache)
+        self.assertFalse(stats.cached)
+        second, stats = H.solve(Puzzle([8,6,7,2,5,4,3,0,1]), cache=cache)
+        self.assertTrue(stats.cached)
+        self.assertEqual(stats.expanded, 0)
+        self.assertEqual(second.moves, first.moves)
+        self.assertEqual(second.get_soln_states()[-1], second.correct_puzzle)
+        self.assertEqual(cache.counters(), {"hits": 1, "disk_hits": 0, "misses": 1, "size": 1})
+
+    def test_mode_in_key(self):
+        cache = SolutionCache()
+        H.solve(Puzzle([2,1,3,4,5,6,7,8,0]), mode='swap', cache=cache)
+        self.assertNotEqual(make_key(Puzzle([2,1,3,4,5,6,7,8,0]), 'swap')[0],
+                            make_key(Puzzle([2,1,3,4,5,6,7,8,0]), 'shift')[0])
+        self.assertIsNone(cache.get(Puzzle([2,1,3,4,5,6,7,8,0]), 'shift'))
+        self.assertEqual(cache.get(Puzzle([2,1,3,4,5,6,7,8,0]), 'swap'), [(0, 1)])
+
+    def test_reflection_shares_entry(self):
+        cache = SolutionCache()
+        H.solve(Puzzle([4,1,3,7,2,6,0,5,8]), cache=cache)
+        #reflection of the puzzle above across the main diagonal, relabelled
+        puzzle, stats = H.solve(Puzzle([2,3,0,1,4,5,7,8,6]), cache=cache)
+        self.assertTrue(stats.cached)
+        self.assertEqual(len(puzzle.moves), 6)
+        self.assertEqual(puzzle.get_soln_states()[-1], puzzle.correct_puzzle)
+
+    def test_large_board(self):
+        #flat indices past 255 need 2 bytes each
+        tiles = list(range(1, 17 * 16 - 1)) + [0, 17 * 16 - 1]
+        cache = SolutionCache()
+        cache.put(Puzzle(tiles, 17, 16), 'shift', [(270, 271)])
+        self.assertEqual(cache.get(Puzzle(tiles, 17, 16), 'shift'), [(270, 271)])
+
+    def test_lru_eviction(self):
+        cache = SolutionCache(maxsize=2)
+        puzzles = [[1,2,3,4,5,6,7,0,8], [1,2,3,4,5,6,0,7,8], [1,2,3,4,0,5,7,8,6]]
+        for tiles in puzzles[:2]:
+            H.solve(Puzzle(tiles), cache=cache)
+        cache.get(Puzzle(puzzles[0]), 'shift')
+        H.solve(Puzzle(puzzles[2]), cache=cache)
+        self.assertIsNotNone(cache.get(Puzzle(puzzles[0]), 'shift'))
+        self.assertIsNone(cache.get(Puzzle(puzzles[1]), 'shift'))
+
+    def test_disk_tier(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "solutions")
+            cache = SolutionCache(path=path)
+            H.solve(Puzzle([4,1,3,7,2,6,0,5,8]), cache=cache)
+            cache.close()
+            cache = SolutionCache(path=path)
+            puzzle, stats = H.solve(Puzzle([4,1,3,7,2,6,0,5,8]), cache=cache)
+            cache.close()
+            self.assertTrue(stats.cached)
+            self.assertEqual(len(puzzle.moves), 6)
+            self.assertEqual(cache.disk_hits, 1)
+
+if __name__ == '__main__':
+    unittest.main()
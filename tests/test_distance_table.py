@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+import distance_table as D
+import heuristic as H
+from board import get_board
+from puzzle import Puzzle
+
+class TestDistanceTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp_dir.name, "shift_3x3.bin")
+        cls.table = D.get_table(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        for path in [path for path in D._tables if path.startswith(cls.tmp_dir.name)]:
+            D._tables.pop(path).close()
+        cls.tmp_dir.cleanup()
+
+    def test_table_contents(self):
+        distances = [entry & D.DIST_MASK for entry in bytes(self.table) if entry != D.UNSOLVABLE]
+        self.assertEqual(len(distances), D.TABLE_SIZE // 2)
+        self.assertEqual(max(distances), 31)
+        self.assertEqual(distances.count(31), 2)
+
+    def test_hardest_solution(self):
+        puzzle = D.table_shift(Puzzle([8,6,7,2,5,4,3,0,1]), path=self.path)
+        self.assertEqual(len(puzzle.moves), 31)
+        self.assertEqual(puzzle.get_soln_states()[-1], [[1,2,3],[4,5,6],[7,8,0]])
+
+    def test_unsolvable(self):
+        self.assertIsNone(D.table_shift(Puzzle([2,1,3,4,5,6,7,8,0]), path=self.path))
+
+    def test_query(self):
+        pairs = [([8,6,7,2,5,4,3,0,1], [1,2,3,4,5,6,7,8,0]),
+                 ([4,1,3,7,2,6,0,5,8], [2,3,6,1,5,0,4,7,8]),
+                 ([1,2,3,4,0,5,7,8,6], [8,1,3,4,2,5,7,0,6])]
+        for start, end in pairs:
+            distance, path = D.query(start, end, self.tmp_dir.name)
+            expected = H.bfs_shift(Puzzle(start, goal=end))
+            self.assertEqual(distance, len(expected.moves))
+            self.assertEqual(D.query(end, start, self.tmp_dir.name, False), (distance, None))
+            board = get_board(3, 3)
+            packed = Puzzle(start).get_packed_state()
+            for idx1, idx2 in path:
+                packed = board.swap(packed, idx1, idx2)
+            self.assertEqual(board.unpack_tiles(packed), end)
+
+    def test_query_unreachable(self):
+        self.assertIsNone(D.query([2,1,3,4,5,6,7,8,0], [1,2,3,4,5,6,7,8,0], self.tmp_dir.name))
+        self.assertRaises(ValueError, D.query, list(range(16)), list(range(16)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import random
+import heuristic as H
+import distance_table as D
+from goal import get_goal
+from puzzle import Puzzle
+
+def _random_walk(goal, steps):
+    board = goal.board
+    packed = goal.packed
+    for _ in range(steps):
+        zero = board.zero_pos(packed)
+        packed = board.swap(packed, zero, random.choice(board.neighbours[zero]))
+    return board.unpack_tiles(packed)
+
+class TestGoal(unittest.TestCase):
+    def setUp(self):
+        random.seed(20)
+
+    def test_layouts(self):
+        self.assertEqual(get_goal(3, 3).puzzle, [[1,2,3],[4,5,6],[7,8,0]])
+        self.assertEqual(get_goal(3, 3, 'blank-first').puzzle, [[0,1,2],[3,4,5],[6,7,8]])
+        self.assertEqual(get_goal(3, 3, 'snake').puzzle, [[1,2,3],[6,5,4],[7,8,0]])
+        self.assertEqual(get_goal(2, 3, 'snake').puzzle, [[1,2,3],[0,5,4]])
+
+    def test_shared(self):
+        goal = get_goal(3, 3, 'snake')
+        self.assertIs(get_goal(3, 3, [1,2,3,6,5,4,7,8,0]), goal)
+        self.assertIs(Puzzle([1,2,3,6,5,4,7,0,8], goal='snake').goal, goal)
+        self.assertIs(Puzzle([1,2,3,4,5,6,7,0,8]).goal, get_goal(3, 3))
+        self.assertIsNone(get_goal(3, 3, [8,7,6,5,4,3,2,1,0]).name)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, get_goal, 3, 3, 'spiral')
+        self.assertRaises(ValueError, get_goal, 3, 3, [1,1,2,3,4,5,6,7,8])
+
+    def test_heuristic_zero_at_goal(self):
+        for layout in ('blank-first', 'snake'):
+            goal = get_goal(3, 3, layout)
+            self.assertEqual(H._get_shift_heuristic(goal.puzzle, goal), 0)
+            self.assertEqual(H._get_swap_heuristic(goal.puzzle, goal), 0)
+
+    def test_engines_reach_goal(self):
+        for layout in ('blank-first', 'snake'):
+            goal = get_goal(3, 3, layout)
+            tiles = _random_walk(goal, 30)
+            expected = len(H.bfs_shift(Puzzle(tiles, goal=goal)).moves)
+            for engine in ('astar', 'astar-batch', 'bidirectional', 'hda'):
+                puzzle, _ = H.solve(Puzzle(tiles, goal=layout), engine)
+                self.assertEqual(len(puzzle.moves), expected)
+                self.assertEqual(puzzle.get_soln_states()[-1], goal.puzzle)
+
+    def test_solvable_parity(self):
+        #snake swaps 4 and 6 of the standard goal, so only one of them is reachable
+        tiles = [1,2,3,4,5,6,7,0,8]
+        self.assertTrue(Puzzle(tiles).is_solvable())
+        self.assertFalse(Puzzle(tiles, goal='snake').is_solvable())
+
+    def test_swap_mode(self):
+        goal = get_goal(3, 3, 'snake')
+        puzzle, _ = H.solve(Puzzle([2,1,3,6,5,4,7,8,0], goal=goal), 'astar', mode='swap')
+        self.assertEqual(puzzle.get_soln_states()[-1], goal.puzzle)
+        self.assertEqual(len(puzzle.moves), 1)
+
+    def test_table_needs_standard_goal(self):
+        self.assertRaises(ValueError, D.table_shift, Puzzle([1,2,3,6,5,4,7,0,8], goal='snake'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+import unittest
+import random
+import heuristic as H
+import distance_table as D
+from goal import get_goal
+from limits import SearchLimits
+from stats import SearchStats
+from puzzle import Puzzle
+
+def _final_state(puzzle):
+    return puzzle.get_soln_states()[-1]
+
+class TestShiftHeuristic(unittest.TestCase):
+    def test_completed_state(self):
+        self.assertEqual(H._get_shift_heuristic([[1,2,3],[4,5,6],[7,8,0]]), 0)
+
+    def test_linear_conflict(self):
+        self.assertEqual(H._get_linear_conflict([[2,1,3],[4,5,6],[7,8,0]]), 2)
+        self.assertEqual(H._get_linear_conflict([[3,2,1],[4,5,6],[7,8,0]]), 4)
+
+    def test_manhattan_ignores_zero(self):
+        self.assertEqual(H._get_shift_heuristic([[1,2,3],[4,5,6],[7,0,8]]), 1)
+
+class TestIncrementalHeuristic(unittest.TestCase):
+    def setUp(self):
+        random.seed(21)
+
+    def test_shift_delta(self):
+        for rows, cols, layout in [(3, 3, 'standard'), (4, 4, 'standard'), (3, 4, 'snake')]:
+            goal = get_goal(rows, cols, layout)
+            board = goal.board
+            state = board.pack_tiles(random.sample(range(board.size), board.size))
+            h_value = H._get_shift_heuristic(board.unpack(state), goal)
+            for _ in range(300):
+                zero_idx = board.zero_pos(state)
+                move_idx = random.choice(board.neighbours[zero_idx])
+                new_state = board.swap(state, zero_idx, move_idx)
+                h_value += H._get_shift_delta(state, new_state, zero_idx, move_idx, goal)
+                state = new_state
+                self.assertEqual(h_value, H._get_shift_heuristic(board.unpack(state), goal))
+
+    def test_swap_delta(self):
+        for rows, cols in [(3, 3), (2, 5)]:
+            goal = get_goal(rows, cols)
+            board = goal.board
+            state = board.pack_tiles(random.sample(range(board.size), board.size))
+            h_value = H._get_heuristic(board.unpack(state), goal)
+            for _ in range(300):
+                idx1, idx2 = random.choice(board.swap_edges)
+                h_value += H._get_swap_delta(state, idx1, idx2, goal)
+                state = board.swap(state, idx1, idx2)
+                self.assertEqual(h_value, H._get_heuristic(board.unpack(state), goal))
+
+class TestShiftEngines(unittest.TestCase):
+    def setUp(self):
+        self.inputs = [
+            [1,2,3,4,5,6,7,0,8],
+            [4,1,3,7,2,6,0,5,8],
+            [2,3,6,1,5,0,4,7,8],
+            [0,1,3,4,2,5,7,8,6],
+        ]
+
+    def test_engines_agree(self):
+        for puzzle_input in self.inputs:
+            lengths = set()
+            for engine in H.SHIFT_ENGINES.values():
+                puzzle = engine(Puzzle(puzzle_input))
+                self.assertEqual(_final_state(puzzle), [[1,2,3],[4,5,6],[7,8,0]])
+                lengths.add(len(puzzle.moves))
+            self.assertEqual(len(lengths), 1)
+
+    def test_unsolvable(self):
+        for engine in H.SHIFT_ENGINES.values():
+            self.assertIsNone(engine(Puzzle([2,1,3,4,5,6,7,8,0])))
+
+    def test_completed(self):
+        for engine in H.SHIFT_ENGINES.values():
+            self.assertEqual(len(engine(Puzzle([1,2,3,4,5,6,7,8,0])).moves), 0)
+
+    def test_batch_sizes_optimal(self):
+        random.seed(10)
+        inputs = [[1,6,7,4,3,5,0,2,8], [6,4,7,0,2,8,1,3,5]]
+        while len(inputs) < 12:
+            tiles = random.sample(range(9), 9)
+            if Puzzle(tiles).is_solvable():
+                inputs.append(tiles)
+        for tiles in inputs:
+            expected = len(D.table_shift(Puzzle(tiles)).moves)
+            for batch_size in (1, 4, 16, 64, 256):
+                puzzle = H.batch_astar_shift(Puzzle(tiles), batch_size=batch_size)
+                self.assertEqual(len(puzzle.moves), expected)
+                self.assertEqual(_final_state(puzzle), puzzle.correct_puzzle)
+
+class TestSwapEngine(unittest.TestCase):
+    def test_swap_edges(self):
+        self.assertEqual(len(set(Puzzle([1,2,3,4,5,6,7,8,0]).board.swap_edges)), 12)
+
+    def test_single_swap(self):
+        puzzle = H.heuristic_swap(Puzzle([2,1,3,4,5,6,7,8,0]))
+        self.assertEqual(puzzle.moves, [[[0,0],[0,1]]])
+
+    def test_optimal_swaps(self):
+        puzzle = H.heuristic_swap(Puzzle([8,6,7,2,5,4,3,0,1]))
+        self.assertEqual(len(puzzle.moves), 13)
+        self.assertEqual(_final_state(puzzle), [[1,2,3],[4,5,6],[7,8,0]])
+
+class TestLargerBoards(unittest.TestCase):
+    def test_rectangle_shift(self):
+        for engine in ['astar', 'astar-batch', 'bfs', 'bidirectional']:
+            puzzle = H.SHIFT_ENGINES[engine](Puzzle([0,1,2,4,5,3], 2, 3))
+            self.assertEqual(_final_state(puzzle), [[1,2,3],[4,5,0]])
+            self.assertEqual(len(puzzle.moves), 3)
+
+    def test_four_by_four_shift(self):
+        goal = Puzzle([x for x in range(16)]).correct_puzzle
+        puzzle = H.astar_shift(Puzzle([1,2,3,4,5,6,7,8,9,10,0,11,13,14,15,12]))
+        self.assertEqual(_final_state(puzzle), goal)
+        self.assertEqual(len(puzzle.moves), 2)
+
+    def test_table_rejects_other_sizes(self):
+        with self.assertRaises(ValueError):
+            H.SHIFT_ENGINES['table'](Puzzle([1,2,3,4,5,6,7,8,9,10,11,12,13,14,0,15]))
+
+    def test_four_by_four_swap(self):
+        puzzle = H.heuristic_swap(Puzzle([2,1,3,4,5,6,7,8,9,10,11,12,13,14,0,15]))
+        self.assertEqual(len(puzzle.moves), 2)
+
+class TestSolve(unittest.TestCase):
+    def test_shift_stats(self):
+        for engine in H.SHIFT_ENGINES:
+            puzzle, stats = H.solve(Puzzle([4,1,3,7,2,6,0,5,8]), engine)
+            self.assertEqual(len(puzzle.moves), 6)
+            self.assertGreater(stats.expanded, 0)
+            self.assertLessEqual(stats.deduped, stats.generated)
+            self.assertGreaterEqual(stats.search_time, 0)
+            self.assertIsNone(stats.peak_memory)
+
+    def test_swap_stats(self):
+        puzzle, stats = H.solve(Puzzle([2,1,3,4,5,6,7,8,0]), mode='swap')
+        self.assertEqual(len(puzzle.moves), 1)
+        self.assertEqual(stats.max_visited, len(puzzle.board.swap_edges) + 1)
+
+    def test_trace_memory(self):
+        _, stats = H.solve(Puzzle([4,1,3,7,2,6,0,5,8]), 'bfs', trace_memory=True)
+        self.assertGreater(stats.peak_memory, 0)
+        self.assertGreater(stats.max_frontier, 0)
+
+class TestIDA(unittest.TestCase):
+    def test_heuristics_agree(self):
+        tiles = [5,1,2,4,9,6,3,8,13,15,10,11,14,0,7,12]
+        expected = len(H.astar_shift(Puzzle(tiles)).moves)
+        for options in ({}, {'table_size': 0}, {'heuristic': 'manhattan'},
+                        {'heuristic': H._get_manhattan, 'table_size': 64}):
+            puzzle = H.ida_shift(Puzzle(tiles), **options)
+            self.assertEqual(len(puzzle.moves), expected)
+            self.assertEqual(_final_state(puzzle), puzzle.correct_puzzle)
+
+    def test_table_replacement(self):
+        table = H._TranspositionTable(1)
+        table.iteration = 1
+        self.assertTrue(table.visit(10, 3))
+        self.assertFalse(table.visit(10, 3))
+        self.assertTrue(table.visit(10, 2))
+        #the shallower entry keeps the slot within an iteration
+        self.assertTrue(table.visit(20, 5))
+        self.assertFalse(table.visit(10, 2))
+        table.iteration = 2
+        self.assertTrue(table.visit(20, 5))
+        self.assertFalse(table.visit(20, 6))
+
+    def test_table_growth(self):
+        table = H._TranspositionTable(64, size=4)
+        table.iteration = 1
+        for state in range(40):
+            table.visit(state, 1)
+        self.assertEqual(table.size, 64)
+        self.assertEqual(table.used, len({hash((state,)) % 64 for state in range(40)}))
+        _, stats = H.solve(Puzzle([1,2,3,4,5,6,7,0,8]), 'ida')
+        self.assertLessEqual(stats.max_visited, 1)
+
+    def test_limits(self):
+        _, stats = H.solve(Puzzle([5,1,2,4,9,6,3,8,13,15,10,11,14,0,7,12]), 'ida',
+                           limits=SearchLimits(max_expanded=10))
+        self.assertIsNotNone(stats.aborted)
+
+class TestAnytime(unittest.TestCase):
+    def setUp(self):
+        self.tiles = [5,1,2,4,9,6,3,8,13,15,10,11,14,0,7,12]
+
+    def test_improves_to_optimal(self):
+        found = []
+        puzzle, stats = H.solve(Puzzle(self.tiles), 'anytime',
+                                on_solution=lambda best, bound: found.append((len(best.moves), bound)))
+        expected = len(H.astar_shift(Puzzle(self.tiles)).moves)
+        self.assertEqual(len(puzzle.moves), expected)
+        self.assertEqual(_final_state(puzzle), puzzle.correct_puzzle)
+        self.assertEqual(stats.bound, 1.0)
+        lengths = [length for length, _ in found]
+        self.assertEqual(lengths, sorted(lengths, reverse=True))
+        for length, bound in found:
+            self.assertLessEqual(length, bound * expected + 1e-9)
+
+    def test_stopped_keeps_best(self):
+        search = H.AnytimeSearch(Puzzle(self.tiles), weight=5.0)
+        self.assertIsNone(search.best)
+        stats = SearchStats()
+        puzzle = search.run(stats, limits=SearchLimits(max_expanded=50))
+        self.assertIsNone(stats.aborted)
+        self.assertEqual(_final_state(puzzle), puzzle.correct_puzzle)
+        self.assertEqual(len(search.best.moves), len(puzzle.moves))
+        self.assertGreaterEqual(stats.bound, 1.0)
+        self.assertLessEqual(search.lower_bound, len(H.astar_shift(Puzzle(self.tiles)).moves))
+
+    def test_swap(self):
+        for tiles in ([2,1,3,4,5,6,7,8,0], [8,6,7,2,5,4,3,0,1]):
+            puzzle, stats = H.solve(Puzzle(tiles), 'anytime', mode='swap')
+            self.assertEqual(len(puzzle.moves), len(H.heuristic_swap(Puzzle(tiles)).moves))
+            self.assertEqual(stats.bound, 1.0)
+
+    def test_unsolvable(self):
+        self.assertIsNone(H.anytime_shift(Puzzle([2,1,3,4,5,6,7,8,0])))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import batch
+import heuristic as H
+from limits import CancelToken, SearchLimits, SearchAborted, CANCELLED, TIMED_OUT, \
+    OUT_OF_EXPANSIONS
+from puzzle import Puzzle
+from stats import SearchStats
+
+HARDEST = [8,6,7,2,5,4,3,0,1]
+
+class TestSearchLimits(unittest.TestCase):
+    def test_max_expanded(self):
+        for engine in ['astar', 'astar-batch', 'bfs', 'bidirectional']:
+            puzzle, stats = H.solve(Puzzle(HARDEST), engine,
+                                    limits=SearchLimits(max_expanded=100))
+            self.assertIsNone(puzzle)
+            self.assertEqual(stats.aborted, OUT_OF_EXPANSIONS)
+            self.assertGreaterEqual(stats.expanded, 100)
+            self.assertGreater(stats.generated, 0)
+
+    def test_swap_timeout(self):
+        puzzle, stats = H.solve(Puzzle([0,8,7,6,5,4,3,2,1]), mode='swap',
+                                limits=SearchLimits(timeout=0))
+        self.assertIsNone(puzzle)
+        self.assertEqual(stats.aborted, TIMED_OUT)
+
+    def test_cancel(self):
+        token = CancelToken()
+        token.cancel()
+        with self.assertRaises(SearchAborted) as context:
+            H.astar_shift(Puzzle(HARDEST), limits=SearchLimits(token=token))
+        self.assertEqual(context.exception.reason, CANCELLED)
+
+    def test_within_limits(self):
+        puzzle, stats = H.solve(Puzzle([4,1,3,7,2,6,0,5,8]),
+                                limits=SearchLimits(timeout=60, max_expanded=1000))
+        self.assertEqual(len(puzzle.moves), 6)
+        self.assertIsNone(stats.aborted)
+
+    def test_check(self):
+        stats = SearchStats()
+        SearchLimits(max_expanded=1).check(stats)
+        stats.expanded = 1
+        with self.assertRaises(SearchAborted):
+            SearchLimits(max_expanded=1).check(stats)
+
+    def test_batch_aborted(self):
+        results = list(batch.batch_solve(["867254301", "123456708"], workers=1,
+                                         max_expanded=10))
+        self.assertEqual(results, [f"867254301\taborted\t{OUT_OF_EXPANSIONS}",
+                                   "123456708\tsolved\t1\tR"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import random
+import parallel as P
+import heuristic as H
+from puzzle import Puzzle
+from limits import SearchLimits, OUT_OF_EXPANSIONS
+
+def _solved_state(puzzle):
+    return puzzle.get_soln_states()[-1]
+
+class TestHDA(unittest.TestCase):
+    def test_matches_astar(self):
+        for tiles in ([8,6,7,2,5,4,3,0,1], [4,1,3,7,2,6,0,5,8]):
+            expected = len(H.astar_shift(Puzzle(tiles)).moves)
+            for workers in (1, 3):
+                puzzle = P.hda_shift(Puzzle(tiles), workers=workers)
+                self.assertEqual(len(puzzle.moves), expected)
+                self.assertEqual(_solved_state(puzzle), puzzle.correct_puzzle)
+
+    def test_larger_board(self):
+        tiles = [1,2,3,4,5,6,7,8,0,10,11,12,9,13,14,15]
+        puzzle, stats = H.solve(Puzzle(tiles), 'hda', workers=2)
+        self.assertEqual(len(puzzle.moves), 4)
+        self.assertEqual(_solved_state(puzzle), puzzle.correct_puzzle)
+        self.assertEqual(len(stats.workers), 2)
+        self.assertEqual(stats.expanded, sum(record.expanded for record in stats.workers))
+
+    def test_unsolvable(self):
+        self.assertIsNone(P.hda_shift(Puzzle([2,1,3,4,5,6,7,8,0]), workers=2))
+
+    def test_limits(self):
+        puzzle, stats = H.solve(Puzzle([8,6,7,2,5,4,3,0,1]), 'hda', workers=2,
+                                limits=SearchLimits(max_expanded=10), batch_size=1)
+        self.assertIsNone(puzzle)
+        self.assertEqual(stats.aborted, OUT_OF_EXPANSIONS)
+
+    def test_owner_spread(self):
+        board = Puzzle([1,2,3,4,5,6,7,8,0]).board
+        random.seed(18)
+        owners = [P._owner(board.pack_tiles(random.sample(range(9), 9)), 4)
+                  for _ in range(400)]
+        self.assertTrue(all(owners.count(wid) > 50 for wid in range(4)))
+
+if __name__ == '__main__':
+    unittest.main()
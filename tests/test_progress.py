@@ -0,0 +1,37 @@
+import unittest
+import queue
+import heuristic as H
+from progress import ProgressReporter, queue_reporter
+from puzzle import Puzzle
+from stats import SearchStats
+
+class TestProgressReporter(unittest.TestCase):
+    def test_node_throttle(self):
+        snapshots = []
+        reporter = ProgressReporter(snapshots.append, every_nodes=10, every_seconds=0)
+        stats = SearchStats()
+        for _ in range(35):
+            stats.expanded += 1
+            reporter.update(stats)
+        self.assertEqual([snapshot['expanded'] for snapshot in snapshots], [1, 11, 21, 31])
+
+    def test_time_throttle(self):
+        snapshots = []
+        reporter = ProgressReporter(snapshots.append, every_nodes=1, every_seconds=60)
+        stats = SearchStats()
+        for _ in range(100):
+            stats.expanded += 1
+            reporter.update(stats)
+        self.assertEqual(len(snapshots), 1)
+
+    def test_queue_reporter(self):
+        messages = queue.Queue()
+        H.solve(Puzzle([8,6,7,2,5,4,3,0,1]), 'astar',
+                progress=queue_reporter(messages, every_nodes=100, every_seconds=0))
+        kind, snapshot = messages.get_nowait()
+        self.assertEqual(kind, 'progress')
+        self.assertGreater(messages.qsize(), 10)
+        self.assertIn('max_visited', snapshot)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import console
 import random
 from puzzle import Puzzle
 
@@ -73,6 +74,78 @@ class TestPuzzlePuzzleCheck(unittest.TestCase):
             puzzle = Puzzle(puzzle_input)
             self.assertFalse(puzzle.puzzle_check())
 
+class TestPuzzlePacked(unittest.TestCase):
+    def setUp(self):
+        self.puzzle = Puzzle([1,2,3,4,5,6,7,0,8])
+
+    def test_pack_round_trip(self):
+        packed = self.puzzle.get_packed_state()
+        self.assertEqual(Puzzle.unpack(packed), self.puzzle.puzzle)
+
+    def test_packed_goal(self):
+        self.assertEqual(Puzzle.pack([[1,2,3],[4,5,6],[7,8,0]]), 0x087654321)
+        self.assertFalse(self.puzzle.packed_check(self.puzzle.get_packed_state()))
+
+    def test_packed_zero_pos(self):
+        self.assertEqual(Puzzle.packed_zero_pos(self.puzzle.get_packed_state()), 7)
+        self.assertEqual(Puzzle.packed_zero_pos(Puzzle.pack([[0,1,2],[3,4,5],[6,7,8]])), 0)
+
+    def test_packed_swap(self):
+        packed = Puzzle.packed_swap(self.puzzle.get_packed_state(), 7, 8)
+        self.assertTrue(self.puzzle.packed_check(packed))
+        self.puzzle.set_packed_state(packed)
+        self.assertTrue(self.puzzle.puzzle_check())
+
+class TestPuzzleSolvable(unittest.TestCase):
+    def test_completed_state(self):
+        self.assertTrue(Puzzle([1,2,3,4,5,6,7,8,0]).is_solvable())
+
+    def test_solvable_state(self):
+        self.assertTrue(Puzzle([8,6,7,2,5,4,3,0,1]).is_solvable())
+        self.assertTrue(Puzzle([0,1,2,3,4,5,6,7,8]).is_solvable())
+
+    def test_unsolvable_state(self):
+        self.assertFalse(Puzzle([2,1,3,4,5,6,7,8,0]).is_solvable())
+        self.assertFalse(Puzzle([1,2,3,4,5,6,8,7,0]).is_solvable())
+
+class TestPuzzleSizes(unittest.TestCase):
+    def test_validate_sizes(self):
+        self.assertTrue(Puzzle.validate([x for x in range(16)], 4, 4))
+        self.assertTrue(Puzzle.validate([x for x in range(6)], 2, 3))
+        self.assertFalse(Puzzle.validate([x for x in range(9)], 4, 4))
+
+    def test_square_conversion(self):
+        puzzle = Puzzle([x for x in range(16)])
+        self.assertEqual(puzzle.puzzle[1], [4,5,6,7])
+        self.assertEqual(puzzle.correct_puzzle[3], [13,14,15,0])
+
+    def test_rectangle_conversion(self):
+        puzzle = Puzzle([1,2,3,4,5,0], 2, 3)
+        self.assertEqual(puzzle.puzzle, [[1,2,3],[4,5,0]])
+        self.assertTrue(puzzle.puzzle_check())
+
+    def test_shape_mismatch(self):
+        self.assertRaises(ValueError, Puzzle, [x for x in range(6)])
+        self.assertRaises(ValueError, Puzzle, [x for x in range(7)], cols=3)
+        self.assertRaises(ValueError, Puzzle, [x for x in range(12)], 3, 3)
+        self.assertEqual(Puzzle([x for x in range(12)], cols=4).board.rows, 3)
+
+    def test_console_shape_mismatch(self):
+        self.assertRaises(ValueError, console.parse_puzzle, "123450")
+        self.assertRaises(ValueError, console.parse_puzzle, "1234567", [2, 3])
+        self.assertIn("6 tiles", console.console_solve(["123450"]))
+
+    def test_large_packed_round_trip(self):
+        tiles = [x for x in range(25)]
+        puzzle = Puzzle(tiles)
+        self.assertEqual(puzzle.board.cell_bits, 5)
+        self.assertEqual(puzzle.board.unpack_tiles(puzzle.get_packed_state()), tiles)
+
+    def test_solvable_even_width(self):
+        self.assertTrue(Puzzle([1,2,3,4,5,6,7,8,9,10,11,12,13,14,0,15]).is_solvable())
+        self.assertFalse(Puzzle([1,2,3,4,5,6,7,8,9,10,11,12,13,15,14,0]).is_solvable())
+        self.assertTrue(Puzzle([1,2,3,4,5,6,7,8,9,10,11,0,13,14,15,12]).is_solvable())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import random
+import ranking as R
+from board import get_board
+from puzzle import Puzzle
+
+class TestRanking(unittest.TestCase):
+    def setUp(self):
+        random.seed(24)
+
+    def test_rank_bounds(self):
+        board = get_board(3, 3)
+        self.assertEqual(R.rank(Puzzle.pack([[0,1,2],[3,4,5],[6,7,8]]), board), 0)
+        self.assertEqual(R.rank(Puzzle.pack([[8,7,6],[5,4,3],[2,1,0]]), board), 362879)
+
+    def test_round_trip(self):
+        for rows, cols in [(3, 3), (2, 4), (4, 4)]:
+            board = get_board(rows, cols)
+            for _ in range(100):
+                packed = board.pack_tiles(random.sample(range(board.size), board.size))
+                self.assertEqual(R.unrank(R.rank(packed, board), board), packed)
+                self.assertEqual(R.mr_unrank(R.mr_rank(packed, board), board), packed)
+
+    def test_perfect_hash(self):
+        board = get_board(2, 3)
+        for ranker, unranker in [(R.rank, R.unrank), (R.mr_rank, R.mr_unrank)]:
+            states = {unranker(idx, board) for idx in range(720)}
+            self.assertEqual(len(states), 720)
+            self.assertEqual(sorted(ranker(packed, board) for packed in states), list(range(720)))
+
+    def test_lexicographic(self):
+        board = get_board(2, 3)
+        tiles = [board.unpack_tiles(R.unrank(idx, board)) for idx in range(720)]
+        self.assertEqual(tiles, sorted(tiles))
+
+class TestVisitedSet(unittest.TestCase):
+    def test_set_behaviour(self):
+        board = get_board(3, 3)
+        visited = R.make_visited(board)
+        self.assertIsInstance(visited, R.VisitedSet)
+        self.assertEqual(len(visited._bits), 45360)
+        packed = Puzzle.pack([[1,2,3],[4,5,6],[7,8,0]])
+        self.assertNotIn(packed, visited)
+        visited.add(packed)
+        visited.add(packed)
+        self.assertIn(packed, visited)
+        self.assertNotIn(Puzzle.pack([[1,2,3],[4,5,6],[7,0,8]]), visited)
+        self.assertEqual(len(visited), 1)
+
+    def test_large_boards_use_set(self):
+        self.assertIsInstance(R.make_visited(get_board(4, 4)), set)
+
+    def test_visit(self):
+        random.seed(24)
+        for board in (get_board(3, 3), get_board(4, 4)):
+            visited = R.make_visited(board)
+            states = [board.pack_tiles(random.sample(range(board.size), board.size))
+                      for _ in range(200)]
+            for packed in states:
+                seen = packed in visited
+                self.assertEqual(visited.visit(packed), not seen)
+                self.assertFalse(visited.visit(packed))
+            self.assertEqual(len(visited), len(set(states)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from board import get_board
+from solution import MoveList, SolutionView
+from puzzle import Puzzle
+import heuristic as H
+
+class TestMoveList(unittest.TestCase):
+    def test_round_trip(self):
+        moves = MoveList(get_board(3, 3))
+        moves.append([[2,2],[1,2]])
+        moves.append_flat(5, 4)
+        self.assertEqual(len(moves), 2)
+        self.assertEqual(moves, [[[2,2],[1,2]], [[1,2],[1,1]]])
+        self.assertEqual(moves[-1], [[1,2],[1,1]])
+        self.assertEqual(moves.flat(), [(8, 5), (5, 4)])
+
+    def test_large_board(self):
+        moves = MoveList(get_board(17, 17))
+        moves.append_flat(288, 271)
+        self.assertEqual(moves[0], [[16,16],[15,16]])
+
+class TestSolutionView(unittest.TestCase):
+    def setUp(self):
+        self.puzzle, _ = H.solve(Puzzle([4,1,3,7,2,6,0,5,8]))
+        self.states = self.puzzle.get_soln_states()
+
+    def test_states(self):
+        self.assertEqual(len(self.states), 7)
+        self.assertEqual(self.states[0], [[4,1,3],[7,2,6],[0,5,8]])
+        self.assertEqual(self.states[-1], self.puzzle.correct_puzzle)
+        self.assertEqual(self.puzzle.puzzle, self.puzzle.correct_puzzle)
+
+    def test_random_access(self):
+        replayed = list(self.states)
+        for idx in [3, 4, 2, 6, 0, 5, 1, 6]:
+            self.assertEqual(self.states[idx], replayed[idx])
+        self.assertEqual(self.states[1:3], replayed[1:3])
+        with self.assertRaises(IndexError):
+            self.states[7]
+
+    def test_repeat_calls(self):
+        self.assertEqual(len(self.puzzle.get_soln_states()), 7)
+
+    def test_view_before_moves(self):
+        view = SolutionView(get_board(2, 2), get_board(2, 2).pack_tiles([1,2,0,3]),
+                            MoveList(get_board(2, 2)))
+        self.assertEqual(list(view), [[[1,2],[0,3]]])
+        view.moves.append_flat(2, 3)
+        self.assertEqual(view[1], [[1,2],[3,0]])
+
+if __name__ == '__main__':
+    unittest.main()
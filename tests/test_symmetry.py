@@ -0,0 +1,57 @@
+import unittest
+import random
+import symmetry as S
+import distance_table as D
+from board import get_board
+from goal import get_goal
+from puzzle import Puzzle
+
+class TestSymmetry(unittest.TestCase):
+    def setUp(self):
+        self.board = get_board(3, 3)
+        self.goal = get_goal(3, 3)
+        random.seed(16)
+
+    def test_goal_fixed(self):
+        self.assertEqual(S.transform_state(self.goal.packed, self.goal, S.TRANSPOSE),
+                         self.goal.packed)
+
+    def test_transpose_relabels(self):
+        puzzle = Puzzle([4,1,3,7,2,6,0,5,8])
+        reflected = S.transform_state(puzzle.get_packed_state(), self.goal, S.TRANSPOSE)
+        self.assertEqual(self.board.unpack_tiles(reflected), [2,3,0,1,4,5,7,8,6])
+
+    def test_class_shares_distance(self):
+        for _ in range(50):
+            puzzle = Puzzle(random.sample(range(9), 9))
+            packed = puzzle.get_packed_state()
+            reflected = S.transform_state(packed, self.goal, S.TRANSPOSE)
+            self.assertEqual(S.transform_state(reflected, self.goal, S.TRANSPOSE), packed)
+            self.assertEqual(S.canonicalize(packed, self.goal)[0],
+                             S.canonicalize(reflected, self.goal)[0])
+            if puzzle.is_solvable():
+                self.assertEqual(len(D.table_shift(puzzle).moves),
+                                 len(D.table_shift(Puzzle(self.board.unpack_tiles(reflected))).moves))
+
+    def test_mapped_moves_solve(self):
+        for _ in range(20):
+            puzzle = Puzzle(random.sample(range(9), 9))
+            if not puzzle.is_solvable():
+                continue
+            canonical, transform = puzzle.get_canonical_state()
+            solved = D.table_shift(Puzzle(self.board.unpack_tiles(canonical)))
+            path = [(row1 * 3 + col1, row2 * 3 + col2)
+                    for (row1, col1), (row2, col2) in solved.moves]
+            packed = puzzle.get_packed_state()
+            for idx1, idx2 in S.map_moves(path, self.board, transform):
+                packed = self.board.swap(packed, idx1, idx2)
+            self.assertEqual(packed, self.goal.packed)
+
+    def test_no_symmetry(self):
+        goal = get_goal(2, 3)
+        packed = goal.board.pack_tiles([0,1,2,4,5,3])
+        self.assertIsNone(S.get_symmetry(goal))
+        self.assertEqual(S.canonicalize(packed, goal), (packed, S.IDENTITY))
+
+if __name__ == '__main__':
+    unittest.main()
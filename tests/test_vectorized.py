@@ -0,0 +1,61 @@
+import unittest
+import random
+import heuristic as H
+import vectorized as V
+from goal import get_goal
+
+class TestBatchHeuristic(unittest.TestCase):
+    def setUp(self):
+        random.seed(10)
+
+    def _states(self, board, count):
+        return [board.pack_tiles(random.sample(range(board.size), board.size))
+                for _ in range(count)]
+
+    def test_matches_shift_heuristic(self):
+        for rows, cols, layout in [(3, 3, 'standard'), (2, 3, 'standard'), (3, 4, 'standard'),
+                                   (3, 3, 'snake'), (4, 4, 'blank-first'), (5, 5, 'standard')]:
+            goal = get_goal(rows, cols, layout)
+            board = goal.board
+            states = self._states(board, 50)
+            self.assertEqual(V.batch_shift_heuristic(states, goal),
+                             [H._get_shift_heuristic(board.unpack(state), goal)
+                              for state in states])
+
+    def test_manhattan_only(self):
+        goal = get_goal(3, 3)
+        board = goal.board
+        states = self._states(board, 50)
+        self.assertEqual(V.batch_shift_heuristic(states, goal, False),
+                         [H._get_manhattan(board.unpack(state)) for state in states])
+
+    def test_without_numpy(self):
+        goal = get_goal(3, 3)
+        states = self._states(goal.board, 20)
+        expected = V.batch_shift_heuristic(states, goal)
+        has_numpy = V.HAS_NUMPY
+        V.HAS_NUMPY = False
+        try:
+            self.assertEqual(V.batch_shift_heuristic(states, goal), expected)
+        finally:
+            V.HAS_NUMPY = has_numpy
+
+    def test_long_lines_without_numpy(self):
+        #7x7 lines are too long for a table, both paths leave out linear conflict
+        goal = get_goal(7, 7)
+        self.assertFalse(V.has_line_tables(goal.board))
+        states = self._states(goal.board, 5)
+        expected = [H._get_manhattan(goal.board.unpack(state), goal) for state in states]
+        self.assertEqual(V.batch_shift_heuristic(states, goal), expected)
+        has_numpy = V.HAS_NUMPY
+        V.HAS_NUMPY = False
+        try:
+            self.assertEqual(V.batch_shift_heuristic(states, goal), expected)
+        finally:
+            V.HAS_NUMPY = has_numpy
+
+    def test_empty_batch(self):
+        self.assertEqual(V.batch_shift_heuristic([], get_goal(3, 3)), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+"""
+Vectorized is the module that evaluates the shifting puzzle heuristic for a
+whole batch of states at once. The per tile distances and per line linear
+conflicts of a board are precomputed into NumPy lookup tables, so a batch of k
+states costs a handful of array operations instead of k trips through the
+Python loops in heuristic.
+
+A line's conflicts only depend on which of its tiles belong in it and in what
+order, so each tile is first mapped to its place in the line's goal (0 for
+tiles that belong elsewhere) and the conflict table is indexed by those codes.
+The table only depends on the length of the line, so it's shared by every
+line and goal. Boards whose lines are too long for a table of at most
+MAX_LINE_TABLE entries get manhattan distance only.
+
+NumPy is optional. Without it batch_shift_heuristic falls back to evaluating
+the states one at a time with the functions in heuristic, leaving out linear
+conflicts on the same boards, so both give the same values. It's only
+imported the first time a batch is evaluated, so programs that never call
+batch_shift_heuristic don't pay for loading it.
+
+Usage
+-----
+Call batch_shift_heuristic() with a list of packed states and the goal they're
+heading for.
+
+Methods
+-------
+batch_shift_heuristic(list[int] states, Goal goal, bool linear_conflict) -> list[int]:
+    returns the heuristic value of every state.
+get_tables(Goal goal) -> _Tables:
+    returns the lookup tables for the goal, building them on first use.
+has_line_tables(Board board) -> bool:
+    returns True if linear conflicts are evaluated on the board.
+_line_table(Goal goal, list[int] cells, int axis) -> tuple:
+    returns the cells, tile codes, index weights and conflict table of a line.
+_line_conflicts(int length) -> numpy.ndarray:
+    returns the linear conflicts of every possible coded content of a line.
+_load_numpy() -> module:
+    imports NumPy on first use.
+
+Globals
+-------
+HAS_NUMPY : boolean
+    True if NumPy is installed.
+MAX_LINE_TABLE : int
+    largest linear conflict table built for a line length. Boards with longer
+    lines get manhattan distance only.
+"""
+
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import product
+
+#set by _load_numpy()
+np = None
+
+HAS_NUMPY = find_spec("numpy") is not None
+MAX_LINE_TABLE = 1 << 20
+
+class _Tables:
+    """
+    Lookup tables for one board.
+
+    Attributes
+    ----------
+    distances : numpy.ndarray
+        distances[cell, tile] is how far tile is from it's proper position when
+        it lies at cell, 0 for the blank.
+    lines : list[tuple]
+        (cells, codes, weights, conflicts) for every row and column. The index
+        into conflicts is the dot product of the codes of the tiles at cells
+        with weights.
+    """
+    def __init__(self, distances, lines):
+        self.distances = distances
+        self.lines = lines
+
+@lru_cache(maxsize=None)
+def get_tables(goal):
+    """
+    Gets the lookup tables for a goal, building them the first time the goal
+    is used. Linear conflict tables are only built when has_line_tables() is
+    True for the board.
+
+    Parameters
+    ----------
+    goal : Goal
+        goal of the states being evaluated.
+
+    Returns
+    -------
+    _Tables
+        Returns the lookup tables.
+    """
+    _load_numpy()
+    board = goal.board
+    distances = np.array(goal.distances, dtype=np.int32)
+    distances[:, 0] = 0
+
+    lines = []
+    if has_line_tables(board):
+        for row in range(board.rows):
+            cells = [row * board.cols + col for col in range(board.cols)]
+            lines.append(_line_table(goal, cells, 0))
+        for col in range(board.cols):
+            cells = [row * board.cols + col for row in range(board.rows)]
+            lines.append(_line_table(goal, cells, 1))
+    return _Tables(distances, lines)
+
+def has_line_tables(board):
+    """
+    Checks if the linear conflict table of the board's longest line has at
+    most MAX_LINE_TABLE entries, 1 per possible coded content.
+
+    Parameters
+    ----------
+    board : Board
+        board of the states being evaluated.
+
+    Returns
+    -------
+    boolean
+        Returns True if linear conflicts are evaluated on the board.
+    """
+    length = max(board.rows, board.cols)
+    return (length + 1) ** length <= MAX_LINE_TABLE
+
+def _line_table(goal, cells, axis):
+    """
+    Builds the lookup entry for one row or column. A tile's code is 1 plus its
+    position along the line in the goal if it belongs in the line, otherwise
+    0.
+
+    Parameters
+    ----------
+    goal : Goal
+        goal of the states being evaluated.
+    cells : list[int]
+        flat indices of the line in order.
+    axis : int
+        0 for a row, 1 for a column.
+
+    Returns
+    -------
+    tuple
+        Returns the cells, the tile codes, the weights used to index the table
+        and the table.
+    """
+    length = len(cells)
+    line = goal.board.coords[cells[0]][axis]
+    codes = np.zeros(goal.board.size, dtype=np.int64)
+    for tile, coords in enumerate(goal.coords):
+        if tile != 0 and coords[axis] == line:
+            codes[tile] = coords[1 - axis] + 1
+    weights = np.array([(length + 1) ** power for power in range(length - 1, -1, -1)],
+                       dtype=np.int64)
+    return (np.array(cells), codes, weights, _line_conflicts(length))
+
+@lru_cache(maxsize=None)
+def _line_conflicts(length):
+    """
+    Computes the linear conflicts of every possible coded content of a line,
+    indexed by the codes read as a number in base length + 1.
+
+    Parameters
+    ----------
+    length : int
+        number of cells in the line.
+
+    Returns
+    -------
+    numpy.ndarray
+        Returns the extra moves for every line content.
+    """
+    #imported here since heuristic imports this module
+    from heuristic import _longest_increasing # pylint: disable=import-outside-toplevel
+
+    table = np.zeros((length + 1) ** length, dtype=np.int32)
+    for idx, codes in enumerate(product(range(length + 1), repeat=length)):
+        proper = [code for code in codes if code]
+        table[idx] = 2 * (len(proper) - _longest_increasing(proper))
+    return table
+
+def _load_numpy():
+    """
+    Imports NumPy the first time it's needed and keeps it in np.
+
+    Returns
+    -------
+    module
+        Returns the numpy module.
+    """
+    global np # pylint: disable=global-statement,invalid-name
+    if np is None:
+        import numpy # pylint: disable=import-outside-toplevel
+        np = numpy
+    return np
+
+def batch_shift_heuristic(states, goal, linear_conflict=True):
+    """
+    Evaluates the manhattan distance (0 left out) plus, optionally, the linear
+    conflicts of a batch of packed states.
+
+    Parameters
+    ----------
+    states : list[int]
+        packed states to evaluate.
+    goal : Goal
+        goal the states are heading for.
+    linear_conflict : boolean
+        add linear conflicts if True.
+
+    Returns
+    -------
+    list[int]
+        Returns the heuristic value of every state, in the same order.
+
+    """
+    #boards without line tables get manhattan distance either way
+    linear_conflict = linear_conflict and has_line_tables(goal.board)
+    if not HAS_NUMPY or not states:
+        #imported here since heuristic imports this module
+        from heuristic import _get_shift_heuristic, _get_manhattan # pylint: disable=import-outside-toplevel
+        evaluate = _get_shift_heuristic if linear_conflict else _get_manhattan
+        return [evaluate(goal.board.unpack(state), goal) for state in states]
+
+    _load_numpy()
+    board = goal.board
+    tables = get_tables(goal)
+    if board.size * board.cell_bits <= 64:
+        #unpack every state at once with shifts on unsigned 64 bit ints
+        shifts = np.arange(board.size, dtype=np.uint64) * np.uint64(board.cell_bits)
+        packed = np.array(states, dtype=np.uint64)[:, None]
+        tiles = ((packed >> shifts) & np.uint64(board.cell_mask)).astype(np.int64)
+    else:
+        tiles = np.array([board.unpack_tiles(state) for state in states], dtype=np.int64)
+    values = tables.distances[np.arange(board.size), tiles].sum(axis=1)
+    if linear_conflict:
+        for cells, codes, weights, conflicts in tables.lines:
+            values += conflicts[codes[tiles[:, cells]] @ weights]
+    return values.tolist()